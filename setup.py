@@ -33,6 +33,8 @@ setup(
     extras_require={
         'dev': ['pandas', 'numpy', 'tox'],
         'test':  ['pytest'],
+        'parquet': ['pyarrow'],
+        'benchmark': ['pytest', 'pytest-benchmark'],
     },
     entry_points={
         'console_scripts': ['acqdiv=acqdiv.__main__:main'],
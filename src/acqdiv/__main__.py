@@ -8,12 +8,14 @@ Invoking commands:
 
 The following commands are supported:
     - load
+    - export
 """
 import os
 import time
 import acqdiv
 import argparse
 
+from acqdiv.exporter import Exporter
 from acqdiv.loader import Loader
 
 
@@ -22,10 +24,39 @@ def load(args):
     start_time = time.time()
     loader = Loader()
 
+    kwargs = {
+        'jobs': args.jobs,
+        'parallel_sessions': args.parallel_sessions,
+        'incremental': args.incremental,
+        'materialize': args.materialize,
+        'backend': args.backend,
+        'normalize': args.normalize,
+        'profile_dir': args.profile,
+        'cprofile': args.cprofile,
+    }
+
+    if args.cfg:
+        loader.load(cfg_path=args.cfg, **kwargs)
+    else:
+        loader.load(**kwargs)
+
+    print("%s seconds --- Finished" % (time.time() - start_time))
+
+
+def export(args):
+    """Run the exporter."""
+    start_time = time.time()
+
+    kwargs = {
+        'fmt': args.format,
+        'db_path': args.database,
+        'out_dir': args.output,
+    }
+
     if args.cfg:
-        loader.load(cfg_path=args.cfg)
+        Exporter.export(cfg_path=args.cfg, **kwargs)
     else:
-        loader.load()
+        Exporter.export(**kwargs)
 
     print("%s seconds --- Finished" % (time.time() - start_time))
 
@@ -50,9 +81,71 @@ def get_cmd_args():
                      'use the flag -f.'))
     parser_load.add_argument(
         '-c', '--cfg', help="Specify a path to a custom ini file.")
+    parser_load.add_argument(
+        '-j', '--jobs', type=int, default=1,
+        help=('Number of processes parsing the corpora in parallel. '
+              'The database is identical to the one of a serial run.'))
+    parser_load.add_argument(
+        '--parallel-sessions', action='store_true',
+        help=('Parse the sessions of one corpus after the other in parallel '
+              'instead of whole corpora. Balances the load better if a few '
+              'large corpora dominate the runtime.'))
+    parser_load.add_argument(
+        '-i', '--incremental', action='store_true',
+        help=('Update the most recent database instead of rebuilding it. '
+              'Only session files that changed since, or whose parser code '
+              'changed, are parsed again.'))
+    parser_load.add_argument(
+        '-m', '--materialize', action='store_true',
+        help=('Store the view v_all_data as the table all_data for faster '
+              'reads. Incremental loads only refresh the rows of changed '
+              'sessions.'))
+    parser_load.add_argument(
+        '-b', '--backend', choices=['sqlite', 'parquet'], default='sqlite',
+        help=('Where the data is written to. The parquet backend skips the '
+              'database and writes the files of the export command '
+              'directly. Requires pyarrow and cannot be combined with -i.'))
+    parser_load.add_argument(
+        '-n', '--normalize', action='store_true',
+        help=('Store the repeated languages, POS tags, glosses and morpheme '
+              'types of words and morphemes in lookup tables referenced by '
+              'integer keys. The views words and morphemes keep the original '
+              'columns.'))
+    parser_load.add_argument(
+        '--profile', metavar='DIR',
+        help=('Write the wall time and number of calls of every stage (file '
+              'read, record split, reader, cleaner, alignment, parsing, '
+              'cache, insert) per corpus and session to DIR/profile.json '
+              'and DIR/profile.csv. With -j, the stages of the worker '
+              'processes are not recorded.'))
+    parser_load.add_argument(
+        '--cprofile', action='store_true',
+        help='With --profile, also write a cProfile dump per corpus to DIR.')
 
     parser_load.set_defaults(func=load)
 
+    # command 'export'
+    parser_export = subparsers.add_parser(
+        'export', help='Export the database to columnar files.',
+        description=('The exporter writes every table of the database and '
+                     'the view v_all_data (as all_data) to one file per '
+                     'corpus. The tables are streamed in batches.'))
+    parser_export.add_argument(
+        '-c', '--cfg', help="Specify a path to a custom ini file.")
+    parser_export.add_argument(
+        '-f', '--format', choices=['parquet'], default='parquet',
+        help='The file format. Parquet requires pyarrow.')
+    parser_export.add_argument(
+        '-d', '--database',
+        help=('Path to the database. Defaults to the most recent database '
+              'in the database directory of the config.'))
+    parser_export.add_argument(
+        '-o', '--output',
+        help=('Where the files are written to. Defaults to a directory next '
+              'to the database.'))
+
+    parser_export.set_defaults(func=export)
+
     return parser.parse_args()
 
 
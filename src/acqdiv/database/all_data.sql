@@ -0,0 +1,10 @@
+-- Materialization of the view v_all_data for faster reads.
+DROP TABLE IF EXISTS all_data;
+
+CREATE TABLE all_data AS SELECT * FROM v_all_data;
+
+CREATE INDEX ix_all_data_corpus ON all_data (corpus);
+CREATE INDEX ix_all_data_session_id
+    ON all_data (session_id, utterance_id, word_id, morpheme_id);
+CREATE INDEX ix_all_data_speaker_id ON all_data (speaker_id);
+CREATE INDEX ix_all_data_uniquespeaker_id ON all_data (uniquespeaker_id);
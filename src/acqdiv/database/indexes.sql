@@ -0,0 +1,35 @@
+-- Indexes created after all data is inserted as they slow down inserts.
+
+-- foreign keys
+CREATE INDEX IF NOT EXISTS ix_sessions_corpus ON sessions (corpus);
+CREATE INDEX IF NOT EXISTS ix_speakers_session_id_fk
+    ON speakers (session_id_fk);
+CREATE INDEX IF NOT EXISTS ix_speakers_uniquespeaker_id_fk
+    ON speakers (uniquespeaker_id_fk);
+CREATE INDEX IF NOT EXISTS ix_uniquespeakers_corpus
+    ON uniquespeakers (corpus);
+CREATE INDEX IF NOT EXISTS ix_utterances_session_id_fk
+    ON utterances (session_id_fk);
+CREATE INDEX IF NOT EXISTS ix_utterances_speaker_id_fk
+    ON utterances (speaker_id_fk);
+CREATE INDEX IF NOT EXISTS ix_utterances_addressee_id_fk
+    ON utterances (addressee_id_fk);
+CREATE INDEX IF NOT EXISTS ix_words_utterance_id_fk
+    ON words (utterance_id_fk);
+CREATE INDEX IF NOT EXISTS ix_morphemes_utterance_id_fk
+    ON morphemes (utterance_id_fk);
+CREATE INDEX IF NOT EXISTS ix_morphemes_word_id_fk ON morphemes (word_id_fk);
+CREATE INDEX IF NOT EXISTS ix_manifest_corpus ON manifest (corpus);
+CREATE INDEX IF NOT EXISTS ix_manifest_session_id_fk
+    ON manifest (session_id_fk);
+
+-- commonly filtered columns
+CREATE INDEX IF NOT EXISTS ix_sessions_source_id ON sessions (source_id);
+CREATE INDEX IF NOT EXISTS ix_speakers_role ON speakers (role);
+CREATE INDEX IF NOT EXISTS ix_speakers_macrorole ON speakers (macrorole);
+CREATE INDEX IF NOT EXISTS ix_uniquespeakers_speaker_label
+    ON uniquespeakers (speaker_label);
+CREATE INDEX IF NOT EXISTS ix_words_word ON words (word);
+CREATE INDEX IF NOT EXISTS ix_morphemes_morpheme ON morphemes (morpheme);
+CREATE INDEX IF NOT EXISTS ix_morphemes_gloss ON morphemes (gloss);
+CREATE INDEX IF NOT EXISTS ix_morphemes_pos ON morphemes (pos);
@@ -1,7 +1,8 @@
 """Model for the ACQDIV database."""
 import enum
 
-from sqlalchemy import (Text, Column, Integer, Boolean, ForeignKey, Enum)
+from sqlalchemy import (Text, Column, Integer, Float, Boolean, ForeignKey,
+                        Enum)
 from sqlalchemy.orm import relationship
 from sqlalchemy.ext.declarative import declarative_base
 
@@ -131,3 +132,21 @@ class Morpheme(Base):
     pos_raw = Column(Text)
     pos = Column(Text)
     lemma_id = Column(Text)
+
+
+class ManifestEntry(Base):
+    """Model for the manifest entry of a session file.
+
+    Records the state of the file and of the parser code at the time the
+    session was loaded so that unchanged sessions can be skipped by an
+    incremental load.
+    """
+    __tablename__ = 'manifest'
+
+    path = Column(Text, primary_key=True)
+    corpus = Column(Text, ForeignKey('corpora.id'))
+    session_id_fk = Column(Integer, ForeignKey('sessions.id'))
+    size = Column(Integer)
+    mtime = Column(Float)
+    sha1 = Column(Text)
+    fingerprint = Column(Text)
@@ -0,0 +1,137 @@
+-- Normalization of the repeated values of words and morphemes.
+-- The values are stored once in lookup tables and referenced by integer
+-- foreign keys. The views words and morphemes keep the original columns.
+
+-- lookup tables
+CREATE TABLE lookup_languages (
+    id INTEGER NOT NULL PRIMARY KEY,
+    value TEXT NOT NULL UNIQUE
+);
+
+INSERT INTO lookup_languages (value)
+SELECT language FROM words WHERE language IS NOT NULL
+UNION
+SELECT language FROM morphemes WHERE language IS NOT NULL;
+
+CREATE TABLE lookup_pos (
+    id INTEGER NOT NULL PRIMARY KEY,
+    value TEXT NOT NULL UNIQUE
+);
+
+INSERT INTO lookup_pos (value)
+SELECT pos FROM words WHERE pos IS NOT NULL
+UNION
+SELECT pos_ud FROM words WHERE pos_ud IS NOT NULL
+UNION
+SELECT pos FROM morphemes WHERE pos IS NOT NULL
+UNION
+SELECT pos_raw FROM morphemes WHERE pos_raw IS NOT NULL;
+
+CREATE TABLE lookup_glosses (
+    id INTEGER NOT NULL PRIMARY KEY,
+    value TEXT NOT NULL UNIQUE
+);
+
+INSERT INTO lookup_glosses (value)
+SELECT gloss FROM morphemes WHERE gloss IS NOT NULL
+UNION
+SELECT gloss_raw FROM morphemes WHERE gloss_raw IS NOT NULL;
+
+CREATE TABLE lookup_types (
+    id INTEGER NOT NULL PRIMARY KEY,
+    value TEXT NOT NULL UNIQUE
+);
+
+INSERT INTO lookup_types (value)
+SELECT DISTINCT type FROM morphemes WHERE type IS NOT NULL
+ORDER BY type;
+
+-- words
+CREATE TABLE words_normalized (
+    id INTEGER NOT NULL PRIMARY KEY,
+    utterance_id_fk INTEGER REFERENCES utterances (id),
+    language_id_fk INTEGER REFERENCES lookup_languages (id),
+    word TEXT,
+    pos_id_fk INTEGER REFERENCES lookup_pos (id),
+    pos_ud_id_fk INTEGER REFERENCES lookup_pos (id),
+    word_actual TEXT,
+    word_target TEXT
+);
+
+INSERT INTO words_normalized
+SELECT w.id, w.utterance_id_fk, l.id, w.word, p.id, pu.id, w.word_actual,
+    w.word_target
+FROM words AS w
+LEFT JOIN lookup_languages AS l ON l.value = w.language
+LEFT JOIN lookup_pos AS p ON p.value = w.pos
+LEFT JOIN lookup_pos AS pu ON pu.value = w.pos_ud
+ORDER BY w.id;
+
+DROP TABLE words;
+
+CREATE VIEW words
+AS
+SELECT w.id, w.utterance_id_fk, l.value AS language, w.word, p.value AS pos,
+    pu.value AS pos_ud, w.word_actual, w.word_target
+FROM words_normalized AS w
+LEFT JOIN lookup_languages AS l ON l.id = w.language_id_fk
+LEFT JOIN lookup_pos AS p ON p.id = w.pos_id_fk
+LEFT JOIN lookup_pos AS pu ON pu.id = w.pos_ud_id_fk;
+
+CREATE INDEX ix_words_normalized_utterance_id_fk
+    ON words_normalized (utterance_id_fk);
+CREATE INDEX ix_words_normalized_word ON words_normalized (word);
+CREATE INDEX ix_words_normalized_pos_id_fk ON words_normalized (pos_id_fk);
+
+-- morphemes
+CREATE TABLE morphemes_normalized (
+    id INTEGER NOT NULL PRIMARY KEY,
+    utterance_id_fk INTEGER REFERENCES utterances (id),
+    word_id_fk INTEGER REFERENCES words_normalized (id),
+    language_id_fk INTEGER REFERENCES lookup_languages (id),
+    type_id_fk INTEGER REFERENCES lookup_types (id),
+    morpheme TEXT,
+    gloss_raw_id_fk INTEGER REFERENCES lookup_glosses (id),
+    gloss_id_fk INTEGER REFERENCES lookup_glosses (id),
+    pos_raw_id_fk INTEGER REFERENCES lookup_pos (id),
+    pos_id_fk INTEGER REFERENCES lookup_pos (id),
+    lemma_id TEXT
+);
+
+INSERT INTO morphemes_normalized
+SELECT m.id, m.utterance_id_fk, m.word_id_fk, l.id, t.id, m.morpheme, gr.id,
+    g.id, pr.id, p.id, m.lemma_id
+FROM morphemes AS m
+LEFT JOIN lookup_languages AS l ON l.value = m.language
+LEFT JOIN lookup_types AS t ON t.value = m.type
+LEFT JOIN lookup_glosses AS gr ON gr.value = m.gloss_raw
+LEFT JOIN lookup_glosses AS g ON g.value = m.gloss
+LEFT JOIN lookup_pos AS pr ON pr.value = m.pos_raw
+LEFT JOIN lookup_pos AS p ON p.value = m.pos
+ORDER BY m.id;
+
+DROP TABLE morphemes;
+
+CREATE VIEW morphemes
+AS
+SELECT m.id, m.utterance_id_fk, m.word_id_fk, l.value AS language,
+    t.value AS type, m.morpheme, gr.value AS gloss_raw, g.value AS gloss,
+    pr.value AS pos_raw, p.value AS pos, m.lemma_id
+FROM morphemes_normalized AS m
+LEFT JOIN lookup_languages AS l ON l.id = m.language_id_fk
+LEFT JOIN lookup_types AS t ON t.id = m.type_id_fk
+LEFT JOIN lookup_glosses AS gr ON gr.id = m.gloss_raw_id_fk
+LEFT JOIN lookup_glosses AS g ON g.id = m.gloss_id_fk
+LEFT JOIN lookup_pos AS pr ON pr.id = m.pos_raw_id_fk
+LEFT JOIN lookup_pos AS p ON p.id = m.pos_id_fk;
+
+CREATE INDEX ix_morphemes_normalized_utterance_id_fk
+    ON morphemes_normalized (utterance_id_fk);
+CREATE INDEX ix_morphemes_normalized_word_id_fk
+    ON morphemes_normalized (word_id_fk);
+CREATE INDEX ix_morphemes_normalized_morpheme
+    ON morphemes_normalized (morpheme);
+CREATE INDEX ix_morphemes_normalized_gloss_id_fk
+    ON morphemes_normalized (gloss_id_fk);
+CREATE INDEX ix_morphemes_normalized_pos_id_fk
+    ON morphemes_normalized (pos_id_fk);
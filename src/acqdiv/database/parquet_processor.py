@@ -0,0 +1,328 @@
+import collections
+import datetime
+import os
+import pathlib
+import shutil
+
+import sqlalchemy as sa
+
+import acqdiv.database.model as db
+from acqdiv.database.processor import DBProcessor
+from acqdiv.database.writer import Writer
+from acqdiv.exporter import Exporter, TABLE_QUERIES, get_arrow_schema, \
+    open_parquet_writer, write_record_batch
+from acqdiv.util.profiler import profiler
+
+# source table and column of every column of the view `v_all_data`
+ALL_DATA_COLUMNS = [
+    ('corpora', 'id'),
+    ('corpora', 'language'),
+    ('sessions', 'id'),
+    ('sessions', 'source_id'),
+    ('sessions', 'date'),
+    ('speakers', 'id'),
+    ('uniquespeakers', 'id'),
+    ('uniquespeakers', 'speaker_label'),
+    ('uniquespeakers', 'name'),
+    ('uniquespeakers', 'birthdate'),
+    ('speakers', 'age_raw'),
+    ('speakers', 'age'),
+    ('speakers', 'age_in_days'),
+    ('uniquespeakers', 'gender'),
+    ('speakers', 'role'),
+    ('speakers', 'macrorole'),
+    ('utterances', 'addressee_id_fk'),
+    ('utterances', 'id'),
+    ('utterances', 'source_id'),
+    ('utterances', 'utterance'),
+    ('utterances', 'morpheme'),
+    ('utterances', 'gloss_raw'),
+    ('utterances', 'pos_raw'),
+    ('utterances', 'translation'),
+    ('utterances', 'sentence_type'),
+    ('utterances', 'childdirected'),
+    ('utterances', 'start'),
+    ('utterances', 'end'),
+    ('utterances', 'comment'),
+    ('words', 'id'),
+    ('words', 'word'),
+    ('words', 'pos'),
+    ('words', 'pos_ud'),
+    ('words', 'word_actual'),
+    ('words', 'word_target'),
+    ('words', 'language'),
+    ('morphemes', 'id'),
+    ('morphemes', 'morpheme'),
+    ('morphemes', 'gloss_raw'),
+    ('morphemes', 'gloss'),
+    ('morphemes', 'pos_raw'),
+    ('morphemes', 'pos'),
+    ('morphemes', 'language'),
+    ('morphemes', 'type'),
+]
+
+
+class ParquetProcessor(Writer):
+    """Methods for writing corpus data straight to Parquet files.
+
+    The files are the same as the ones of `acqdiv export`, but no database
+    is built: The rows of every table are buffered and written to
+    `<out_dir>/<table>/<corpus>.parquet` in record batches. The denormalized
+    `v_all_data` is joined per session and written as the table `all_data`.
+    """
+
+    # number of rows written at once
+    batch_size = Exporter.batch_size
+
+    def __init__(self, db_dir='database', incremental=False):
+        """Initialize the output directory.
+
+        Args:
+            db_dir (str): Where the output directory is created.
+            incremental (bool): Not supported.
+        """
+        if incremental:
+            raise ValueError(
+                'Incremental loads require the sqlite backend.')
+
+        super().__init__()
+        self.out_dir = self.get_out_dir(db_dir)
+        self.schemas = self.get_schemas()
+
+        # writers and buffered rows of the current corpus by table name
+        self.writers = {}
+        self.buffers = {}
+
+        # rows of the current corpus referenced by `all_data` by ID
+        self.speaker_rows = {}
+        self.uspeaker_rows = {}
+
+    @staticmethod
+    def get_out_dir(db_dir):
+        """Get the output directory and remove the files of previous loads.
+
+        Args:
+            db_dir (str): Where the output directory is created.
+
+        Returns:
+            pathlib.Path: The output directory.
+        """
+        date = datetime.datetime.now().strftime('%Y-%m-%d')
+        out_dir = pathlib.Path(db_dir) / f'acqdiv_corpus_{date}_parquet'
+
+        if out_dir.exists():
+            shutil.rmtree(str(out_dir))
+
+        print(f'Writing Parquet files to: {out_dir.resolve()}')
+        print()
+
+        return out_dir
+
+    @staticmethod
+    def get_schemas():
+        """Get the Arrow schemas of the tables.
+
+        They are read from an empty in-memory database, so the schemas are
+        the same as the ones of the exporter.
+
+        Returns:
+            Dict[str, pyarrow.Schema]: The schemas by table name.
+        """
+        engine = sa.create_engine('sqlite://')
+
+        with engine.connect() as conn:
+            DBProcessor.create_tables(conn)
+            DBProcessor.create_views(conn)
+
+            return {table: get_arrow_schema(conn.connection, table)
+                    for table in TABLE_QUERIES}
+
+    def insert_corpus(self, corpus, session_paths=(), fingerprint=None,
+                      source_paths=None):
+        """Write the corpus to one file per table.
+
+        Args:
+            corpus (acqdiv.model.corpus.Corpus): The corpus.
+            session_paths (List[str]): Paths to the parsed session files.
+            fingerprint (str): Fingerprint of the parser code. Not used.
+            source_paths (dict): The source files by session file. Not used.
+        """
+        self.open_writers(corpus.corpus)
+
+        try:
+            corpus_row = self.get_corpus_row(corpus)
+            self.add_rows('corpora', [corpus_row])
+
+            uspeakers_dict = {}
+
+            for session in corpus.sessions:
+                self.insert_session(session, corpus_row, uspeakers_dict)
+        finally:
+            self.close_writers()
+
+    def open_writers(self, c_id):
+        """Open the files of a corpus.
+
+        Args:
+            c_id (str): The corpus ID.
+        """
+        for table, schema in self.schemas.items():
+            table_dir = self.out_dir / table
+            os.makedirs(str(table_dir), exist_ok=True)
+
+            self.writers[table] = open_parquet_writer(
+                str(table_dir / f'{c_id}.parquet'), schema)
+            self.buffers[table] = []
+
+        self.uspeaker_rows = {}
+
+    def close_writers(self):
+        """Write the remaining rows and close the files."""
+        for table, writer in self.writers.items():
+            self.flush(table)
+            writer.close()
+
+        self.writers = {}
+        self.buffers = {}
+
+    def add_rows(self, table, rows):
+        """Buffer rows and write them once there is a batch.
+
+        Args:
+            table (str): The table name.
+            rows (List[dict]): The rows.
+        """
+        names = self.schemas[table].names
+        buffer = self.buffers[table]
+        buffer.extend(tuple(row.get(name) for name in names) for row in rows)
+
+        while len(buffer) >= self.batch_size:
+            self.flush(table, self.batch_size)
+
+    def flush(self, table, n_rows=None):
+        """Write the buffered rows of a table.
+
+        Args:
+            table (str): The table name.
+            n_rows (int): Number of rows to write. Defaults to all rows.
+        """
+        buffer = self.buffers[table]
+        rows = buffer[:n_rows]
+
+        if rows:
+            write_record_batch(self.writers[table], self.schemas[table], rows)
+            del buffer[:len(rows)]
+
+    def insert_session(self, session, corpus_row, uspeakers_dict):
+        """Write the session with its speakers and utterances.
+
+        Args:
+            session (acqdiv.model.session.Session): The session.
+            corpus_row (dict): The row of the corpus.
+            uspeakers_dict (dict): The unique speaker IDs by unique speaker.
+        """
+        profiler.set_session(corpus_row['id'], session.path)
+
+        with profiler.stage('insert'):
+            self.write_session(session, corpus_row, uspeakers_dict)
+
+    def write_session(self, session, corpus_row, uspeakers_dict):
+        c_id = corpus_row['id']
+        s_id = self.get_next_id(db.Session.__table__)
+        session_row = dict(id=s_id, **self.get_session_row(session, c_id))
+        self.add_rows('sessions', [session_row])
+
+        self.speaker_rows = {}
+        speakers_dict = self.insert_speakers(
+            session.speakers, s_id, c_id, uspeakers_dict)
+
+        batches = self.iter_batches(
+            session.utterances, self.utterance_batch_size)
+
+        for batch in batches:
+            utt_rows = []
+            word_rows = []
+            morph_rows = []
+
+            for utt in batch:
+                u_id = self.get_next_id(db.Utterance.__table__)
+                utt_rows.append(
+                    self.get_utterance_row(utt, u_id, s_id, speakers_dict))
+                w_ids = self.add_word_rows(word_rows, utt.words, u_id)
+                self.add_morpheme_rows(
+                    morph_rows, utt.morphemes, u_id, w_ids)
+
+            self.add_rows('utterances', utt_rows)
+            self.add_rows('words', word_rows)
+            self.add_rows('morphemes', morph_rows)
+            self.add_rows('all_data', self.get_all_data_rows(
+                corpus_row, session_row, utt_rows, word_rows, morph_rows))
+
+    def insert_uspeaker(self, uspeaker, c_id):
+        usp_id = self.get_next_id(db.UniqueSpeaker.__table__)
+        row = dict(id=usp_id, **self.get_uspeaker_row(uspeaker, c_id))
+        self.add_rows('uniquespeakers', [row])
+        self.uspeaker_rows[usp_id] = row
+
+        return usp_id
+
+    def insert_speaker(self, speaker, s_id, usp_id):
+        sp_id = self.get_next_id(db.Speaker.__table__)
+        row = dict(id=sp_id, **self.get_speaker_row(speaker, s_id, usp_id))
+        self.add_rows('speakers', [row])
+        self.speaker_rows[sp_id] = row
+
+        return sp_id
+
+    def get_all_data_rows(self, corpus_row, session_row, utt_rows, word_rows,
+                          morph_rows):
+        """Join the rows of a session as the view `v_all_data` does.
+
+        Every utterance has one row per morpheme of its words. Words without
+        morphemes and utterances without words have a single row. Morphemes
+        not linked to words are left out.
+
+        Args:
+            corpus_row (dict): The row of the corpus.
+            session_row (dict): The row of the session.
+            utt_rows (List[dict]): The rows of the utterances.
+            word_rows (List[dict]): The rows of the words.
+            morph_rows (List[dict]): The rows of the morphemes.
+
+        Returns:
+            List[dict]: The rows of `all_data`.
+        """
+        names = self.schemas['all_data'].names
+
+        words_by_utt = collections.defaultdict(list)
+        for word_row in word_rows:
+            words_by_utt[word_row['utterance_id_fk']].append(word_row)
+
+        morphs_by_word = collections.defaultdict(list)
+        for morph_row in morph_rows:
+            if morph_row['word_id_fk'] is not None:
+                morphs_by_word[morph_row['word_id_fk']].append(morph_row)
+
+        rows = []
+        for utt_row in utt_rows:
+            speaker_row = self.speaker_rows.get(utt_row['speaker_id_fk'], {})
+            uspeaker_row = self.uspeaker_rows.get(
+                speaker_row.get('uniquespeaker_id_fk'), {})
+
+            for word_row in words_by_utt[utt_row['id']] or [{}]:
+                for morph_row in morphs_by_word[word_row.get('id')] or [{}]:
+                    sources = {
+                        'corpora': corpus_row,
+                        'sessions': session_row,
+                        'speakers': speaker_row,
+                        'uniquespeakers': uspeaker_row,
+                        'utterances': utt_row,
+                        'words': word_row,
+                        'morphemes': morph_row,
+                    }
+                    rows.append({
+                        name: sources[table].get(column)
+                        for name, (table, column)
+                        in zip(names, ALL_DATA_COLUMNS)})
+
+        return rows
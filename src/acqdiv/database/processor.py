@@ -1,41 +1,95 @@
+import contextlib
 import datetime
-import subprocess
+import os
+import shutil
 import pathlib
 
 import sqlalchemy as sa
 from sqlalchemy import create_engine
 
 from acqdiv.database.model import Base
+from acqdiv.database.writer import Writer
 import acqdiv.database.model as db
+from acqdiv.util.fingerprint import get_source_hash, get_source_stat
 from acqdiv.util.path import get_full_path
+from acqdiv.util.profiler import profiler
 
 
-class DBProcessor:
+class DBProcessor(Writer):
     """Methods for adding corpus data to the database."""
 
-    def __init__(self, db_dir='database'):
+    # pragmas of the long-lived connection of a bulk load trading safety
+    # for speed, a database left by a crashed build has to be rebuilt
+    bulk_pragmas = [
+        'journal_mode = MEMORY',
+        'synchronous = OFF',
+        'cache_size = -262144',
+        'temp_store = MEMORY',
+        'locking_mode = EXCLUSIVE',
+    ]
+
+    # pragmas restoring the default settings at the end of a bulk load
+    safe_pragmas = [
+        'journal_mode = DELETE',
+        'synchronous = FULL',
+        'locking_mode = NORMAL',
+    ]
+
+    # number of sessions after which a bulk load commits
+    checkpoint_interval = 500
+
+    # tables of a normalized database, see `normalize`
+    normalized_tables = [
+        'words_normalized',
+        'morphemes_normalized',
+        'lookup_languages',
+        'lookup_pos',
+        'lookup_glosses',
+        'lookup_types',
+    ]
+
+    def __init__(self, db_dir='database', incremental=False):
         """Initialize DB engine.
 
         Args:
             db_dir (str): Where the database is written to.
+            incremental (bool): Whether to update the most recent database
+                instead of creating it from scratch.
         """
-        self.engine = self.get_engine(db_dir)
+        super().__init__()
+        self.incremental = incremental
+        self.engine = self.get_engine(db_dir, incremental=incremental)
 
-        # initialize them once for each session
+        # initialize them once for each connection
         # to increase performance
         self.insert_corpus_func = None
         self.insert_session_func = None
         self.insert_speaker_func = None
-        self.insert_utt_func = None
-        self.insert_word_func = None
-        self.insert_morph_func = None
+        self.insert_uspeaker_func = None
+        # connection of the current transaction
+        self.conn = None
+
+        # long-lived connection and transaction of a bulk load
+        self.bulk_conn = None
+        self.bulk_trans = None
+        # sessions inserted since the last commit of a bulk load
+        self.uncommitted_sessions = 0
+
+        # IDs of deleted sessions to be reinserted in place by file path
+        self.session_ids = {}
+
+        # sessions and corpora changed by this load, see `refresh_all_data`
+        self.inserted_session_ids = []
+        self.deleted_session_ids = []
+        self.changed_corpora = []
 
     @classmethod
-    def get_engine(cls, db_dir):
+    def get_engine(cls, db_dir, incremental=False):
         """Return a database engine.
 
         Args:
             db_dir (str): Where the database is written to.
+            incremental (bool): Whether to keep the existing tables.
 
         Returns:
             Engine: The DB engine.
@@ -44,47 +98,384 @@ class DBProcessor:
         date = datetime.datetime.now().strftime('%Y-%m-%d')
         path = db_dir / f'acqdiv_corpus_{date}.sqlite3'
 
+        if incremental:
+            cls.copy_most_recent_database(db_dir, path)
+
         print(f"Writing database to: {path.resolve()}")
         print()
         engine = create_engine(f'sqlite:///{str(path)}', echo=False)
-        cls.create_tables(engine)
-        cls.create_views(path)
+
+        with engine.connect() as conn:
+            if incremental and cls.is_normalized(conn):
+                with conn.begin():
+                    cls.denormalize(conn)
+
+            cls.create_tables(conn, drop=not incremental)
+            cls.create_views(conn)
 
         return engine
 
+    @classmethod
+    def copy_most_recent_database(cls, db_dir, path):
+        """Copy the most recent database of `db_dir` to `path`.
+
+        Nothing is copied if `path` already exists.
+
+        Args:
+            db_dir (pathlib.Path): The database directory.
+            path (pathlib.Path): The path of the database to be written.
+        """
+        if path.exists():
+            return
+
+        recent_path = cls.get_most_recent_database(db_dir)
+        if recent_path is not None:
+            print(f'Updating database: {recent_path.resolve()}')
+            shutil.copyfile(recent_path, path)
+
     @staticmethod
-    def create_tables(engine):
+    def get_most_recent_database(db_dir):
+        """Get the most recent database of `db_dir`.
+
+        Args:
+            db_dir (pathlib.Path): The database directory.
+
+        Returns:
+            Optional[pathlib.Path]: The path or None if there is no database.
+        """
+        paths = sorted(db_dir.glob('acqdiv_corpus_*.sqlite3'))
+
+        return paths[-1] if paths else None
+
+    @classmethod
+    def create_tables(cls, conn, drop=True):
         """Drop all tables before creating them.
 
             Args:
-                engine: An sqlalchemy database engine.
+                conn: An sqlalchemy database engine or connection.
+                drop (bool): Whether to drop the tables. If not, only missing
+                    tables are created.
         """
-        Base.metadata.drop_all(bind=engine)
-        Base.metadata.create_all(engine)
+        if drop:
+            cls.drop_normalized_tables(conn)
+            Base.metadata.drop_all(bind=conn)
+            conn.execute('DROP TABLE IF EXISTS all_data')
+        Base.metadata.create_all(conn)
 
     @staticmethod
-    def create_views(db_path):
-        view_path = get_full_path('database/views.sql')
-        cmd = f'sqlite3 {db_path} < {view_path}'
-        subprocess.run(cmd, shell=True)
+    def create_views(conn):
+        """Create the views of `views.sql` that do not exist yet.
 
-    def insert_corpus(self, corpus):
-        """Insert the corpus into the database.
+        Args:
+            conn (sqlalchemy.engine.Connection): The connection.
+
+        Raises:
+            sqlite3.Error: If a view cannot be created.
+        """
+        with open(get_full_path('database/views.sql')) as f:
+            script = f.read()
+
+        # the DBAPI connection runs the whole script
+        conn.connection.executescript(script)
+
+    @contextlib.contextmanager
+    def bulk_load(self, checkpoint_interval=None):
+        """Write to the database over a single long-lived connection.
+
+        The pragmas in `bulk_pragmas` are applied once and the insert
+        functions are only initialized once. The data is committed every
+        `checkpoint_interval` sessions and at the end. The settings are reset
+        to `safe_pragmas` even if the load fails.
 
         Args:
-            corpus (acqdiv.model.corpus.Corpus): The corpus.
+            checkpoint_interval (int): Number of sessions after which the
+                data is committed.
         """
+        if checkpoint_interval is not None:
+            self.checkpoint_interval = checkpoint_interval
+
+        conn = self.engine.connect().execution_options(compiled_cache={})
+
+        try:
+            for pragma in self.bulk_pragmas:
+                conn.execute(f'PRAGMA {pragma}')
+
+            self.bulk_conn = conn
+            self.bulk_trans = conn.begin()
+            self.uncommitted_sessions = 0
+
+            try:
+                yield
+            except BaseException:
+                self.bulk_trans.rollback()
+                raise
+
+            self.bulk_trans.commit()
+        finally:
+            self.bulk_conn = None
+            self.bulk_trans = None
+
+            try:
+                for pragma in self.safe_pragmas:
+                    conn.execute(f'PRAGMA {pragma}')
+            finally:
+                conn.close()
+
+    @contextlib.contextmanager
+    def begin(self):
+        """Begin a transaction.
+
+        During a bulk load, the long-lived connection is used instead and its
+        transaction is only committed at checkpoints.
+
+        Yields:
+            sqlalchemy.engine.Connection: The connection.
+        """
+        if self.bulk_conn is not None:
+            yield self.bulk_conn
+            return
+
         with self.engine.begin() as conn:
             conn.execute('PRAGMA synchronous = OFF')
             conn.execute('PRAGMA journal_mode = MEMORY')
-            conn = conn.execution_options(compiled_cache={})
-            self.insert_corpus_func = sa.insert(db.Corpus, bind=conn).execute
+            yield conn.execution_options(compiled_cache={})
+
+    def checkpoint(self):
+        """Commit the data of a bulk load every `checkpoint_interval` sessions.
+        """
+        self.uncommitted_sessions += 1
+
+        if self.uncommitted_sessions >= self.checkpoint_interval:
+            self.bulk_trans.commit()
+            self.bulk_trans = self.bulk_conn.begin()
+            self.uncommitted_sessions = 0
+
+    def set_connection(self, conn):
+        """Bind the insert functions to a connection.
+
+        Args:
+            conn (sqlalchemy.engine.Connection): The connection.
+        """
+        if conn is self.conn:
+            return
+
+        self.conn = conn
+        self.insert_corpus_func = sa.insert(
+            db.Corpus, bind=conn).prefix_with('OR REPLACE').execute
+        self.insert_session_func = sa.insert(db.Session, bind=conn).execute
+        self.insert_speaker_func = sa.insert(db.Speaker, bind=conn).execute
+        self.insert_uspeaker_func = sa.insert(
+            db.UniqueSpeaker, bind=conn).execute
+
+    def create_indexes(self):
+        """Create the indexes and gather statistics for the query planner.
+
+        Should be called once all data is inserted as the indexes slow down
+        inserts. Existing indexes are kept.
+        """
+        with self.begin() as conn:
+            self.execute_sql_file(conn, 'database/indexes.sql')
+            conn.execute('ANALYZE')
+
+    @staticmethod
+    def execute_sql_file(conn, path):
+        """Execute the statements of an SQL file.
+
+        Args:
+            conn (sqlalchemy.engine.Connection): The connection.
+            path (str): Path to the SQL file relative to the package.
+        """
+        with open(get_full_path(path)) as f:
+            statements = f.read().split(';')
+
+        for statement in statements:
+            if statement.strip():
+                conn.execute(statement)
+
+    def normalize(self):
+        """Store the repeated values of words and morphemes in lookup tables.
+
+        The tables `words` and `morphemes` are replaced by tables referencing
+        the values of languages, POS tags, glosses and morpheme types by
+        integer foreign keys, see `normalize.sql`. Views with the names and
+        columns of the replaced tables are created instead.
+
+        The database is vacuumed to free the space of the replaced tables, so
+        it has to be called after a bulk load.
+        """
+        with self.begin() as conn:
+            self.execute_sql_file(conn, 'database/normalize.sql')
+            conn.execute('ANALYZE')
+
+        with self.engine.connect() as conn:
+            conn.execute('VACUUM')
+
+    @staticmethod
+    def is_normalized(conn):
+        """Check whether the database is normalized.
+
+        Args:
+            conn (sqlalchemy.engine.Connection): The connection.
+
+        Returns:
+            bool: True if the database is normalized.
+        """
+        return conn.dialect.has_table(conn, 'morphemes_normalized')
+
+    @classmethod
+    def denormalize(cls, conn):
+        """Restore the tables `words` and `morphemes` of a normalized database.
+
+        Args:
+            conn (sqlalchemy.engine.Connection): The connection.
+        """
+        tables = [db.Word.__table__, db.Morpheme.__table__]
+
+        for table in tables:
+            conn.execute(f'CREATE TABLE {table.name}_denormalized '
+                         f'AS SELECT * FROM {table.name}')
+
+        cls.drop_normalized_tables(conn)
+        Base.metadata.create_all(conn, tables=tables)
+
+        for table in tables:
+            conn.execute(f'INSERT INTO {table.name} '
+                         f'SELECT * FROM {table.name}_denormalized '
+                         f'ORDER BY id')
+            conn.execute(f'DROP TABLE {table.name}_denormalized')
+
+    @classmethod
+    def drop_normalized_tables(cls, conn):
+        """Drop the tables and views of a normalized database.
+
+        Args:
+            conn: An sqlalchemy database engine or connection.
+        """
+        for view in ['words', 'morphemes']:
+            is_view = conn.execute(
+                sa.text("SELECT 1 FROM sqlite_master "
+                        "WHERE type = 'view' AND name = :name"),
+                name=view).scalar()
+            if is_view:
+                conn.execute(f'DROP VIEW {view}')
+
+        for table in cls.normalized_tables:
+            conn.execute(f'DROP TABLE IF EXISTS {table}')
+
+    @staticmethod
+    def has_all_data(conn):
+        """Check whether the database has the table `all_data`.
+
+        Args:
+            conn (sqlalchemy.engine.Connection): The connection.
+
+        Returns:
+            bool: True if the table exists.
+        """
+        return conn.dialect.has_table(conn, 'all_data')
+
+    def materialize_all_data(self, force=False):
+        """Materialize the view `v_all_data` as the table `all_data`.
+
+        The table is created from scratch unless the database is loaded
+        incrementally and already has it. Then only the rows of the changed
+        sessions are refreshed, see `refresh_all_data`.
+
+        Args:
+            force (bool): Whether to create the table if it does not exist.
+                Otherwise, only an existing table is kept up to date.
+        """
+        with self.begin() as conn:
+            exists = self.has_all_data(conn)
+
+            if exists and self.incremental:
+                self.refresh_all_data(conn)
+            elif exists or force:
+                self.execute_sql_file(conn, 'database/all_data.sql')
+            else:
+                return
+
+            conn.execute('ANALYZE all_data')
+
+    def refresh_all_data(self, conn):
+        """Refresh the rows of the changed sessions in the table `all_data`.
+
+        The rows of deleted and (re)inserted sessions are deleted and those
+        of (re)inserted sessions are selected again from `v_all_data`. The
+        refreshed rows thus come last, the order of `v_all_data` is restored
+        by ordering by session, utterance, word and morpheme ID.
+
+        Args:
+            conn (sqlalchemy.engine.Connection): The connection.
+        """
+        s_ids = sorted(
+            set(self.deleted_session_ids) | set(self.inserted_session_ids))
+
+        if s_ids:
+            conn.execute(
+                sa.text('DELETE FROM all_data WHERE session_id = :s_id'),
+                [{'s_id': s_id} for s_id in s_ids])
+
+        for s_id in sorted(self.inserted_session_ids):
+            conn.execute(
+                sa.text('INSERT INTO all_data '
+                        'SELECT * FROM v_all_data WHERE session_id = :s_id'),
+                s_id=s_id)
+
+        for c_id in self.changed_corpora:
+            conn.execute(
+                sa.text('UPDATE all_data SET language = '
+                        '(SELECT language FROM corpora WHERE id = :c_id) '
+                        'WHERE corpus = :c_id'),
+                c_id=c_id)
+
+    def insert_corpus(self, corpus, session_paths=(), fingerprint=None,
+                      source_paths=None):
+        """Insert the corpus into the database.
+
+        If a code fingerprint is given, a manifest entry is recorded for every
+        session as well as for every file of `session_paths` that did not
+        yield a session.
+
+        Args:
+            corpus (acqdiv.model.corpus.Corpus): The corpus.
+            session_paths (List[str]): Paths to the parsed session files.
+            fingerprint (str): Fingerprint of the parser code.
+            source_paths (dict): The files every session is parsed from by
+                session file, see `CorpusParser.get_source_paths`. By
+                default, only the session file.
+        """
+        source_paths = source_paths or {}
+
+        with self.begin() as conn:
+            self.set_connection(conn)
+
+            language = conn.execute(
+                sa.select([db.Corpus.language]).where(
+                    db.Corpus.id == corpus.corpus)).scalar()
+            if language != corpus.language:
+                self.changed_corpora.append(corpus.corpus)
+
             c_id = self.insert_corpus_metadata(corpus)
 
         uspeakers_dict = {}
+        inserted_paths = set()
 
         for session in corpus.sessions:
-            self.insert_session(session, c_id, uspeakers_dict)
+            self.insert_session(session, c_id, uspeakers_dict, fingerprint,
+                                source_paths.get(session.path))
+            inserted_paths.add(session.path)
+
+        if fingerprint is not None:
+            with self.begin() as conn:
+                for path in session_paths:
+                    if path not in inserted_paths:
+                        self.insert_manifest_entry(
+                            conn, path, c_id, None, fingerprint,
+                            source_paths.get(path))
+
+        if self.incremental:
+            self.delete_unused_uspeakers(c_id)
 
     def insert_corpus_metadata(self, corpus):
         """Insert the data into the `Corpus` table.
@@ -96,177 +487,305 @@ class DBProcessor:
             str: The ID of the corpus.
         """
         c_id, = self.insert_corpus_func(
-            id=corpus.corpus,
-            language=corpus.language,
-            iso_639_3=corpus.iso_639_3,
-            glottolog_code=corpus.glottolog_code,
-            owner=corpus.owner,
-            acronym=corpus.acronym,
-            name=corpus.name,
-            license=corpus.license,
-            format=corpus.format
-        ).inserted_primary_key
+            **self.get_corpus_row(corpus)).inserted_primary_key
 
         return c_id
 
-    def insert_session(self, session, c_id, uspeakers_dict):
+    def insert_session(self, session, c_id, uspeakers_dict, fingerprint=None,
+                       source_paths=None):
         """Insert the session into the database.
 
         Args:
             session (acqdiv.model.session.Session): The session.
             c_id (str): The corpus ID.
+            uspeakers_dict (dict): The unique speaker IDs by unique speaker.
+            fingerprint (str): Fingerprint of the parser code. If given, the
+                session is recorded in the manifest.
+            source_paths (List[str]): Paths to the source files of the
+                session. By default, only the session file.
         """
-        with self.engine.begin() as conn:
-            conn.execute('PRAGMA synchronous = OFF')
-            conn.execute('PRAGMA journal_mode = MEMORY')
-            conn = conn.execution_options(compiled_cache={})
+        profiler.set_session(c_id, session.path)
+
+        with profiler.stage('insert'):
+            with self.begin() as conn:
+                self.set_connection(conn)
+
+                s_id = self.insert_session_metadata(session, c_id)
+                speakers_dict = self.insert_speakers(
+                    session.speakers, s_id, c_id, uspeakers_dict)
+                self.insert_utterances(
+                    session.utterances, s_id, speakers_dict)
 
-            self.insert_session_func = sa.insert(db.Session, bind=conn).execute
-            self.insert_speaker_func = sa.insert(db.Speaker, bind=conn).execute
-            self.insert_uspeaker_func = sa.insert(
-                db.UniqueSpeaker, bind=conn).execute
-            self.insert_utt_func = sa.insert(db.Utterance, bind=conn).execute
-            self.insert_word_func = sa.insert(db.Word, bind=conn).execute
-            self.insert_morph_func = sa.insert(db.Morpheme, bind=conn).execute
+                if fingerprint is not None:
+                    self.insert_manifest_entry(
+                        conn, session.path, c_id, s_id, fingerprint,
+                        source_paths)
 
-            s_id = self.insert_session_metadata(session, c_id)
-            speakers_dict = self.insert_speakers(
-                session.speakers, s_id, c_id, uspeakers_dict)
-            self.insert_utterances(session.utterances, s_id, speakers_dict)
+            if self.bulk_conn is not None:
+                self.checkpoint()
 
     def insert_session_metadata(self, session, c_id):
+        # reinsert a session of an incremental load in place
+        path = os.path.abspath(session.path)
+        if path in self.session_ids:
+            kwargs = {'id': self.session_ids.pop(path)}
+        else:
+            kwargs = {}
+
         s_id, = self.insert_session_func(
-            corpus=c_id,
-            date=session.date,
-            source_id=session.source_id,
-            duration=session.duration if session.duration else None,
-            media_id=session.media_filename if session.media_filename else None
+            **kwargs, **self.get_session_row(session, c_id)
         ).inserted_primary_key
+        self.inserted_session_ids.append(s_id)
 
         return s_id
 
-    def insert_speakers(self, speakers, s_id, c_id, uspeakers_dict):
-        speakers_dict = {
-            None: None
-        }
-        for speaker in speakers:
-            if speaker.uniquespeaker in uspeakers_dict:
-                usp_id = uspeakers_dict[speaker.uniquespeaker]
-            else:
-                usp_id = self.insert_uspeaker(speaker.uniquespeaker, c_id)
-                uspeakers_dict[speaker.uniquespeaker] = usp_id
-
-            sp_id = self.insert_speaker(speaker, s_id, usp_id)
-            speakers_dict[speaker] = sp_id
-
-        return speakers_dict
-
     def insert_uspeaker(self, uspeaker, c_id):
         usp_id, = self.insert_uspeaker_func(
-            corpus=c_id,
-            name=uspeaker.name if uspeaker.name else None,
-            birthdate=uspeaker.birth_date if uspeaker.birth_date else None,
-            gender_raw=uspeaker.gender_raw if uspeaker.gender_raw else None,
-            gender=uspeaker.gender if uspeaker.gender else None,
-            speaker_label=uspeaker.code if uspeaker.code else None,
-        ).inserted_primary_key
+            **self.get_uspeaker_row(uspeaker, c_id)).inserted_primary_key
 
         return usp_id
 
+    def get_uspeaker_id(self, uspeaker, c_id):
+        """Get the ID of a unique speaker already in the database.
+
+        Args:
+            uspeaker (acqdiv.model.uniquespeaker.UniqueSpeaker): The unique
+                speaker.
+            c_id (str): The corpus ID.
+
+        Returns:
+            Optional[int]: The ID or None if there is no such unique speaker.
+        """
+        conditions = [db.UniqueSpeaker.corpus == c_id]
+        for column, value in [
+                (db.UniqueSpeaker.speaker_label, uspeaker.code),
+                (db.UniqueSpeaker.name, uspeaker.name),
+                (db.UniqueSpeaker.birthdate, uspeaker.birth_date)]:
+            conditions.append(column == value if value else column.is_(None))
+
+        return self.conn.execute(
+            sa.select([sa.func.min(db.UniqueSpeaker.id)]).where(
+                sa.and_(*conditions))).scalar()
+
     def insert_speaker(self, speaker, s_id, usp_id):
         sp_id, = self.insert_speaker_func(
-            session_id_fk=s_id,
-            uniquespeaker_id_fk=usp_id,
-            age_raw=speaker.age_raw if speaker.age_raw else None,
-            age=speaker.age if speaker.age else None,
-            age_in_days=speaker.age_in_days if speaker.age_in_days else None,
-            role_raw=speaker.role_raw if speaker.role_raw else None,
-            role=speaker.role if speaker.role else None,
-            macrorole=speaker.macro_role if speaker.macro_role else None,
-            languages_spoken=speaker.languages_spoken
-            if speaker.languages_spoken else None
+            **self.get_speaker_row(speaker, s_id, usp_id)
         ).inserted_primary_key
 
         return sp_id
 
+    def get_next_id(self, table):
+        """Get the next primary key of a table.
+
+        The primary keys of utterances, words and morphemes are assigned on
+        the client side so that their rows can be inserted in bulk. The
+        counter starts after the highest key already in the table.
+
+        Args:
+            table (sqlalchemy.Table): The table.
+
+        Returns:
+            int: The next primary key.
+        """
+        if table.name not in self.last_ids:
+            max_id = self.conn.execute(
+                sa.select([sa.func.max(table.c.id)])).scalar()
+            self.last_ids[table.name] = max_id or 0
+
+        self.last_ids[table.name] += 1
+
+        return self.last_ids[table.name]
+
     def insert_utterances(self, utterances, s_id, speakers_dict):
-        for utt in utterances:
-            u_id = self.insert_utterance(utt, s_id, speakers_dict)
-            w_ids = self.insert_words(utt.words, u_id)
-            self.insert_morphemes(utt.morphemes, u_id, w_ids)
+        """Insert the utterances with their words and morphemes.
+
+        Runs one `executemany` per table for every `utterance_batch_size`
+        utterances, so that only the rows of one batch are held in memory
+        if the utterances are streamed.
+
+        Args:
+            utterances (Iterable[acqdiv.model.utterance.Utterance]): The
+                utterances.
+            s_id (int): The session ID.
+            speakers_dict (dict): The speaker IDs by speaker.
+        """
+        for batch in self.iter_batches(utterances, self.utterance_batch_size):
+            utt_rows = []
+            word_rows = []
+            morph_rows = []
+
+            for utt in batch:
+                u_id = self.get_next_id(db.Utterance.__table__)
+                utt_rows.append(
+                    self.get_utterance_row(utt, u_id, s_id, speakers_dict))
+                w_ids = self.add_word_rows(word_rows, utt.words, u_id)
+                self.add_morpheme_rows(
+                    morph_rows, utt.morphemes, u_id, w_ids)
+
+            for model, rows in [(db.Utterance, utt_rows),
+                                (db.Word, word_rows),
+                                (db.Morpheme, morph_rows)]:
+                if rows:
+                    self.conn.execute(model.__table__.insert(), rows)
+
+    @staticmethod
+    def insert_manifest_entry(conn, path, c_id, s_id, fingerprint,
+                              source_paths=None):
+        """Record the current state of a session file in the manifest.
 
-    def insert_utterance(self, utt, s_id, speakers_dict):
-        u_id, = self.insert_utt_func(
+        The size, modification time and hash cover all source files of the
+        session, i.e. its metadata file as well.
+
+        Args:
+            conn (sqlalchemy.engine.Connection): The connection.
+            path (str): Path to the session file.
+            c_id (str): The corpus ID.
+            s_id (Optional[int]): The session ID or None if the file did not
+                yield a session.
+            fingerprint (str): Fingerprint of the parser code.
+            source_paths (List[str]): Paths to the source files of the
+                session. By default, only the session file.
+        """
+        source_paths = source_paths or [path]
+        size, mtime = get_source_stat(source_paths)
+        conn.execute(
+            db.ManifestEntry.__table__.insert().prefix_with('OR REPLACE'),
+            path=os.path.abspath(path),
+            corpus=c_id,
             session_id_fk=s_id,
-            source_id=utt.source_id,
-            speaker_id_fk=speakers_dict[utt.speaker],
-            addressee_id_fk=speakers_dict[utt.addressee],
-            utterance_raw=utt.utterance_raw if utt.utterance_raw else None,
-            utterance=utt.utterance if utt.utterance else None,
-            translation=utt.translation if utt.translation else None,
-            morpheme=utt.morpheme_raw if utt.morpheme_raw else None,
-            gloss_raw=utt.gloss_raw if utt.gloss_raw else None,
-            pos_raw=utt.pos_raw if utt.pos_raw else None,
-            sentence_type=utt.sentence_type if utt.sentence_type else None,
-            childdirected=utt.childdirected
-            if isinstance(utt.childdirected, bool) else None,
-            start_raw=utt.start_raw if utt.start_raw else None,
-            start=utt.start if utt.start else None,
-            end_raw=utt.end_raw if utt.end_raw else None,
-            end=utt.end if utt.end else None,
-            comment=utt.comment if utt.comment else None,
-        ).inserted_primary_key
+            size=size,
+            mtime=mtime,
+            sha1=get_source_hash(source_paths),
+            fingerprint=fingerprint)
 
-        return u_id
+    def get_stale_session_paths(self, corpus_name, session_paths,
+                                fingerprint, source_paths=None):
+        """Get the session files that have to be parsed again.
 
-    def insert_words(self, words, u_id):
-        w_ids = []
-        for w in words:
-            w_id = self.insert_word(w, u_id)
-            w_ids.append(w_id)
+        A session file is stale if it is not in the manifest yet or if the
+        content of its source files or the parser code changed since it was
+        loaded. The content is only hashed if size or modification time
+        changed.
 
-        return w_ids
+        The sessions of stale files are deleted right away, but their IDs are
+        kept so that they are reinserted in place. The sessions of files that
+        no longer exist or that are not in the manifest are deleted as well.
 
-    def insert_word(self, w, u_id):
-        w_id, = self.insert_word_func(
-            utterance_id_fk=u_id,
-            language=w.word_language if w.word_language else None,
-            word=w.word if w.word else None,
-            word_actual=w.word_actual if w.word_actual else None,
-            word_target=w.word_target if w.word_target else None,
-            pos=w.pos if w.pos else None,
-            pos_ud=w.pos_ud if w.pos_ud else None,
+        Args:
+            corpus_name (str): The corpus name.
+            session_paths (List[str]): Paths to all session files.
+            fingerprint (str): Fingerprint of the parser code.
+            source_paths (dict): The files every session is parsed from by
+                session file, see `CorpusParser.get_source_paths`. By
+                default, only the session file.
 
-        ).inserted_primary_key
+        Returns:
+            List[str]: The paths of the stale session files.
+        """
+        source_paths = source_paths or {}
+        manifest = db.ManifestEntry.__table__
+        stale_paths = []
+
+        with self.begin() as conn:
+            entries = {
+                entry.path: entry for entry in conn.execute(
+                    manifest.select().where(manifest.c.corpus == corpus_name))
+            }
 
-        return w_id
+            for path in session_paths:
+                entry = entries.pop(os.path.abspath(path), None)
 
-    def insert_morphemes(self, morphemes, u_id, w_ids):
-        link_to_word = len(morphemes) == len(w_ids)
+                if entry is not None and entry.fingerprint == fingerprint:
+                    paths = source_paths.get(path, [path])
+                    size, mtime = get_source_stat(paths)
+                    if (size, mtime) == (entry.size, entry.mtime):
+                        continue
 
-        for i, mword in enumerate(morphemes):
-            w_id = w_ids[i] if link_to_word else None
+                    # e.g. file touched or checked out again
+                    if get_source_hash(paths) == entry.sha1:
+                        conn.execute(
+                            manifest.update().where(
+                                manifest.c.path == entry.path),
+                            size=size, mtime=mtime)
+                        continue
 
-            for m in mword:
-                self.insert_morpheme(m, u_id, w_id)
+                stale_paths.append(path)
 
-    def insert_morpheme(self, m, u_id, w_id):
-        """Insert the morpheme.
+                if entry is not None:
+                    self.delete_manifest_entry(conn, entry)
+
+            # files that were removed
+            for entry in entries.values():
+                self.delete_manifest_entry(conn, entry)
+
+            self.deleted_session_ids.extend(
+                self.delete_untracked_sessions(conn, corpus_name))
+
+        return stale_paths
+
+    def delete_manifest_entry(self, conn, entry):
+        """Delete a manifest entry and keep the ID of its session.
+
+        Args:
+            conn (sqlalchemy.engine.Connection): The connection.
+            entry (sqlalchemy.engine.RowProxy): The manifest entry.
+        """
+        manifest = db.ManifestEntry.__table__
+        conn.execute(manifest.delete().where(manifest.c.path == entry.path))
+
+        if entry.session_id_fk is not None:
+            self.session_ids[entry.path] = entry.session_id_fk
+
+    @staticmethod
+    def delete_untracked_sessions(conn, corpus_name):
+        """Delete the sessions of a corpus that are not in the manifest.
+
+        Args:
+            conn (sqlalchemy.engine.Connection): The connection.
+            corpus_name (str): The corpus name.
+
+        Returns:
+            List[int]: The IDs of the deleted sessions.
+        """
+        manifest = db.ManifestEntry.__table__
+        sessions = db.Session.__table__
+        utterances = db.Utterance.__table__
+
+        s_ids = sa.select([sessions.c.id]).where(sa.and_(
+            sessions.c.corpus == corpus_name,
+            sessions.c.id.notin_(
+                sa.select([manifest.c.session_id_fk]).where(
+                    manifest.c.session_id_fk.isnot(None)))))
+        u_ids = sa.select([utterances.c.id]).where(
+            utterances.c.session_id_fk.in_(s_ids))
+
+        for model in [db.Morpheme, db.Word]:
+            table = model.__table__
+            conn.execute(
+                table.delete().where(table.c.utterance_id_fk.in_(u_ids)))
+
+        for model in [db.Utterance, db.Speaker]:
+            table = model.__table__
+            conn.execute(
+                table.delete().where(table.c.session_id_fk.in_(s_ids)))
+
+        deleted_ids = [row.id for row in conn.execute(s_ids)]
+        conn.execute(sessions.delete().where(sessions.c.id.in_(s_ids)))
+
+        return deleted_ids
+
+    def delete_unused_uspeakers(self, c_id):
+        """Delete the unique speakers of a corpus without any speaker.
 
         Args:
-            m (acqdiv.model.morpheme.Morpheme): The morpheme instance.
-            u_id (str): The utterance ID.
-            w_id (str): The word ID.
+            c_id (str): The corpus ID.
         """
-        self.insert_morph_func(
-            utterance_id_fk=u_id,
-            word_id_fk=w_id,
-            language=m.morpheme_language if m.morpheme_language else None,
-            type=m.type if m.type else None,
-            morpheme=m.morpheme if m.morpheme else None,
-            gloss_raw=m.gloss_raw if m.gloss_raw else None,
-            gloss=m.gloss if m.gloss else None,
-            pos_raw=m.pos_raw if m.pos_raw else None,
-            pos=m.pos if m.pos else None,
-            lemma_id=m.lemma_id if m.lemma_id else None,
-        )
+        uspeakers = db.UniqueSpeaker.__table__
+        speakers = db.Speaker.__table__
+
+        with self.begin() as conn:
+            conn.execute(uspeakers.delete().where(sa.and_(
+                uspeakers.c.corpus == c_id,
+                uspeakers.c.id.notin_(
+                    sa.select([speakers.c.uniquespeaker_id_fk]).where(
+                        speakers.c.uniquespeaker_id_fk.isnot(None))))))
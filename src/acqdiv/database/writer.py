@@ -0,0 +1,384 @@
+import contextlib
+import itertools
+
+import acqdiv.database.model as db
+
+
+class Writer:
+    """Interface of the backends the loader writes the corpora to.
+
+    The rows of all tables are built by the methods of this class so that
+    every backend writes the same data. Backends implement the inserts.
+    """
+
+    # whether the backend updates the data of a previous load
+    incremental = False
+
+    # number of utterances whose rows are written at once
+    utterance_batch_size = 1000
+
+    def __init__(self):
+        # last primary keys assigned on the client side by table name
+        self.last_ids = {}
+
+    @contextlib.contextmanager
+    def bulk_load(self, checkpoint_interval=None):
+        """Write all corpora at once.
+
+        Args:
+            checkpoint_interval (int): Number of sessions after which the
+                data is persisted.
+        """
+        yield
+
+    def insert_corpus(self, corpus, session_paths=(), fingerprint=None,
+                      source_paths=None):
+        """Insert the corpus with all its sessions.
+
+        Args:
+            corpus (acqdiv.model.corpus.Corpus): The corpus.
+            session_paths (List[str]): Paths to the parsed session files.
+            fingerprint (str): Fingerprint of the parser code.
+            source_paths (dict): The files every session is parsed from by
+                session file, see `CorpusParser.get_source_paths`. By
+                default, only the session file.
+        """
+        raise NotImplementedError
+
+    def get_stale_session_paths(self, corpus_name, session_paths,
+                                fingerprint, source_paths=None):
+        """Get the session files that have to be parsed again.
+
+        Only called if the backend is `incremental`.
+
+        Args:
+            corpus_name (str): The corpus name.
+            session_paths (List[str]): Paths to all session files.
+            fingerprint (str): Fingerprint of the parser code.
+            source_paths (dict): The files every session is parsed from by
+                session file, see `CorpusParser.get_source_paths`. By
+                default, only the session file.
+
+        Returns:
+            List[str]: The paths of the stale session files.
+        """
+        raise NotImplementedError
+
+    def create_indexes(self):
+        """Index the data once all of it is inserted."""
+
+    def materialize_all_data(self, force=False):
+        """Store the view `v_all_data` as the table `all_data`.
+
+        Args:
+            force (bool): Whether to create the table if it does not exist.
+        """
+
+    def normalize(self):
+        """Store the repeated values of words and morphemes in lookup tables.
+        """
+
+    def insert_uspeaker(self, uspeaker, c_id):
+        """Insert the unique speaker.
+
+        Args:
+            uspeaker (acqdiv.model.uniquespeaker.UniqueSpeaker): The unique
+                speaker.
+            c_id (str): The corpus ID.
+
+        Returns:
+            int: The ID of the unique speaker.
+        """
+        raise NotImplementedError
+
+    def get_uspeaker_id(self, uspeaker, c_id):
+        """Get the ID of a unique speaker inserted by a previous load.
+
+        Only called if the backend is `incremental`.
+
+        Args:
+            uspeaker (acqdiv.model.uniquespeaker.UniqueSpeaker): The unique
+                speaker.
+            c_id (str): The corpus ID.
+
+        Returns:
+            Optional[int]: The ID or None if there is no such unique speaker.
+        """
+        raise NotImplementedError
+
+    def insert_speaker(self, speaker, s_id, usp_id):
+        """Insert the speaker.
+
+        Args:
+            speaker (acqdiv.model.speaker.Speaker): The speaker.
+            s_id (int): The session ID.
+            usp_id (int): The unique speaker ID.
+
+        Returns:
+            int: The ID of the speaker.
+        """
+        raise NotImplementedError
+
+    def insert_speakers(self, speakers, s_id, c_id, uspeakers_dict):
+        speakers_dict = {
+            None: None
+        }
+        for speaker in speakers:
+            if speaker.uniquespeaker in uspeakers_dict:
+                usp_id = uspeakers_dict[speaker.uniquespeaker]
+            else:
+                usp_id = None
+                if self.incremental:
+                    usp_id = self.get_uspeaker_id(speaker.uniquespeaker, c_id)
+                if usp_id is None:
+                    usp_id = self.insert_uspeaker(speaker.uniquespeaker, c_id)
+                uspeakers_dict[speaker.uniquespeaker] = usp_id
+
+            sp_id = self.insert_speaker(speaker, s_id, usp_id)
+            speakers_dict[speaker] = sp_id
+
+        return speakers_dict
+
+    @staticmethod
+    def iter_batches(items, size):
+        """Group items into lists without reading ahead of the current one.
+
+        Args:
+            items (Iterable): The items.
+            size (int): Maximum number of items per list.
+
+        Yields:
+            list: The next items.
+        """
+        items = iter(items)
+        batch = list(itertools.islice(items, size))
+
+        while batch:
+            yield batch
+            batch = list(itertools.islice(items, size))
+
+    def get_next_id(self, table):
+        """Get the next primary key of a table.
+
+        Args:
+            table (sqlalchemy.Table): The table.
+
+        Returns:
+            int: The next primary key.
+        """
+        self.last_ids[table.name] = self.last_ids.get(table.name, 0) + 1
+
+        return self.last_ids[table.name]
+
+    @staticmethod
+    def get_corpus_row(corpus):
+        """Get the row of the corpus.
+
+        Args:
+            corpus (acqdiv.model.corpus.Corpus): The corpus.
+
+        Returns:
+            dict: The column values.
+        """
+        return dict(
+            id=corpus.corpus,
+            language=corpus.language,
+            iso_639_3=corpus.iso_639_3,
+            glottolog_code=corpus.glottolog_code,
+            owner=corpus.owner,
+            acronym=corpus.acronym,
+            name=corpus.name,
+            license=corpus.license,
+            format=corpus.format
+        )
+
+    @staticmethod
+    def get_session_row(session, c_id):
+        """Get the row of the session without its ID.
+
+        Args:
+            session (acqdiv.model.session.Session): The session.
+            c_id (str): The corpus ID.
+
+        Returns:
+            dict: The column values.
+        """
+        return dict(
+            corpus=c_id,
+            date=session.date,
+            source_id=session.source_id,
+            duration=session.duration if session.duration else None,
+            media_id=session.media_filename if session.media_filename else None
+        )
+
+    @staticmethod
+    def get_uspeaker_row(uspeaker, c_id):
+        """Get the row of the unique speaker without its ID.
+
+        Args:
+            uspeaker (acqdiv.model.uniquespeaker.UniqueSpeaker): The unique
+                speaker.
+            c_id (str): The corpus ID.
+
+        Returns:
+            dict: The column values.
+        """
+        return dict(
+            corpus=c_id,
+            name=uspeaker.name if uspeaker.name else None,
+            birthdate=uspeaker.birth_date if uspeaker.birth_date else None,
+            gender_raw=uspeaker.gender_raw if uspeaker.gender_raw else None,
+            gender=uspeaker.gender if uspeaker.gender else None,
+            speaker_label=uspeaker.code if uspeaker.code else None,
+        )
+
+    @staticmethod
+    def get_speaker_row(speaker, s_id, usp_id):
+        """Get the row of the speaker without its ID.
+
+        Args:
+            speaker (acqdiv.model.speaker.Speaker): The speaker.
+            s_id (int): The session ID.
+            usp_id (int): The unique speaker ID.
+
+        Returns:
+            dict: The column values.
+        """
+        return dict(
+            session_id_fk=s_id,
+            uniquespeaker_id_fk=usp_id,
+            age_raw=speaker.age_raw if speaker.age_raw else None,
+            age=speaker.age if speaker.age else None,
+            age_in_days=speaker.age_in_days if speaker.age_in_days else None,
+            role_raw=speaker.role_raw if speaker.role_raw else None,
+            role=speaker.role if speaker.role else None,
+            macrorole=speaker.macro_role if speaker.macro_role else None,
+            languages_spoken=speaker.languages_spoken
+            if speaker.languages_spoken else None
+        )
+
+    @staticmethod
+    def get_utterance_row(utt, u_id, s_id, speakers_dict):
+        """Get the row of the utterance.
+
+        Args:
+            utt (acqdiv.model.utterance.Utterance): The utterance.
+            u_id (int): The utterance ID.
+            s_id (int): The session ID.
+            speakers_dict (dict): The speaker IDs by speaker.
+
+        Returns:
+            dict: The column values.
+        """
+        return dict(
+            id=u_id,
+            session_id_fk=s_id,
+            source_id=utt.source_id,
+            speaker_id_fk=speakers_dict[utt.speaker],
+            addressee_id_fk=speakers_dict[utt.addressee],
+            utterance_raw=utt.utterance_raw if utt.utterance_raw else None,
+            utterance=utt.utterance if utt.utterance else None,
+            translation=utt.translation if utt.translation else None,
+            morpheme=utt.morpheme_raw if utt.morpheme_raw else None,
+            gloss_raw=utt.gloss_raw if utt.gloss_raw else None,
+            pos_raw=utt.pos_raw if utt.pos_raw else None,
+            sentence_type=utt.sentence_type if utt.sentence_type else None,
+            childdirected=utt.childdirected
+            if isinstance(utt.childdirected, bool) else None,
+            start_raw=utt.start_raw if utt.start_raw else None,
+            start=utt.start if utt.start else None,
+            end_raw=utt.end_raw if utt.end_raw else None,
+            end=utt.end if utt.end else None,
+            comment=utt.comment if utt.comment else None,
+        )
+
+    def add_word_rows(self, word_rows, words, u_id):
+        """Add the rows of the words.
+
+        Args:
+            word_rows (List[dict]): The rows the word rows are added to.
+            words (List[acqdiv.model.word.Word]): The words.
+            u_id (int): The utterance ID.
+
+        Returns:
+            List[int]: The word IDs.
+        """
+        w_ids = []
+        for w in words:
+            w_id = self.get_next_id(db.Word.__table__)
+            word_rows.append(self.get_word_row(w, w_id, u_id))
+            w_ids.append(w_id)
+
+        return w_ids
+
+    @staticmethod
+    def get_word_row(w, w_id, u_id):
+        """Get the row of the word.
+
+        Args:
+            w (acqdiv.model.word.Word): The word.
+            w_id (int): The word ID.
+            u_id (int): The utterance ID.
+
+        Returns:
+            dict: The column values.
+        """
+        return dict(
+            id=w_id,
+            utterance_id_fk=u_id,
+            language=w.word_language if w.word_language else None,
+            word=w.word if w.word else None,
+            word_actual=w.word_actual if w.word_actual else None,
+            word_target=w.word_target if w.word_target else None,
+            pos=w.pos if w.pos else None,
+            pos_ud=w.pos_ud if w.pos_ud else None,
+        )
+
+    def add_morpheme_rows(self, morph_rows, morphemes, u_id, w_ids):
+        """Add the rows of the morphemes.
+
+        Morphemes are only linked to words if there are as many morpheme
+        words as words.
+
+        Args:
+            morph_rows (List[dict]): The rows the morpheme rows are added to.
+            morphemes (List[List[acqdiv.model.morpheme.Morpheme]]): The
+                morphemes grouped by word.
+            u_id (int): The utterance ID.
+            w_ids (List[int]): The word IDs.
+        """
+        link_to_word = len(morphemes) == len(w_ids)
+
+        for i, mword in enumerate(morphemes):
+            w_id = w_ids[i] if link_to_word else None
+
+            for m in mword:
+                m_id = self.get_next_id(db.Morpheme.__table__)
+                morph_rows.append(self.get_morpheme_row(m, m_id, u_id, w_id))
+
+    @staticmethod
+    def get_morpheme_row(m, m_id, u_id, w_id):
+        """Get the row of the morpheme.
+
+        Args:
+            m (acqdiv.model.morpheme.Morpheme): The morpheme instance.
+            m_id (int): The morpheme ID.
+            u_id (int): The utterance ID.
+            w_id (int): The word ID.
+
+        Returns:
+            dict: The column values.
+        """
+        return dict(
+            id=m_id,
+            utterance_id_fk=u_id,
+            word_id_fk=w_id,
+            language=m.morpheme_language if m.morpheme_language else None,
+            type=m.type if m.type else None,
+            morpheme=m.morpheme if m.morpheme else None,
+            gloss_raw=m.gloss_raw if m.gloss_raw else None,
+            gloss=m.gloss if m.gloss else None,
+            pos_raw=m.pos_raw if m.pos_raw else None,
+            pos=m.pos if m.pos else None,
+            lemma_id=m.lemma_id if m.lemma_id else None,
+        )
@@ -0,0 +1,274 @@
+""" Export of the ACQDIV-DB to columnar file formats
+"""
+import os
+import pathlib
+import sqlite3
+from configparser import ConfigParser, ExtendedInterpolation
+
+from acqdiv.database.processor import DBProcessor
+
+# queries selecting the rows of a table that belong to a corpus
+TABLE_QUERIES = {
+    'corpora': 'SELECT * FROM corpora WHERE id = :corpus',
+    'sessions': (
+        'SELECT * FROM sessions WHERE corpus = :corpus ORDER BY id'),
+    'uniquespeakers': (
+        'SELECT * FROM uniquespeakers WHERE corpus = :corpus ORDER BY id'),
+    'speakers': (
+        'SELECT speakers.* FROM speakers '
+        'JOIN sessions ON speakers.session_id_fk = sessions.id '
+        'WHERE sessions.corpus = :corpus ORDER BY speakers.id'),
+    'utterances': (
+        'SELECT utterances.* FROM utterances '
+        'JOIN sessions ON utterances.session_id_fk = sessions.id '
+        'WHERE sessions.corpus = :corpus ORDER BY utterances.id'),
+    'words': (
+        'SELECT words.* FROM words '
+        'JOIN utterances ON words.utterance_id_fk = utterances.id '
+        'JOIN sessions ON utterances.session_id_fk = sessions.id '
+        'WHERE sessions.corpus = :corpus ORDER BY words.id'),
+    'morphemes': (
+        'SELECT morphemes.* FROM morphemes '
+        'JOIN utterances ON morphemes.utterance_id_fk = utterances.id '
+        'JOIN sessions ON utterances.session_id_fk = sessions.id '
+        'WHERE sessions.corpus = :corpus ORDER BY morphemes.id'),
+    'all_data': 'SELECT * FROM v_all_data WHERE corpus = :corpus',
+}
+
+# query reading the materialized view instead if the database has it
+ALL_DATA_QUERY = (
+    'SELECT * FROM all_data WHERE corpus = :corpus '
+    'ORDER BY session_id, utterance_id, word_id, morpheme_id')
+
+# low-cardinality text columns that are dictionary-encoded
+DICTIONARY_COLUMNS = {
+    'corpus', 'language', 'format', 'license',
+    'role', 'role_raw', 'macrorole', 'gender', 'gender_raw',
+    'speaker_label', 'sentence_type', 'type', 'morpheme_type',
+    'gloss', 'gloss_raw', 'pos', 'pos_raw', 'pos_ud', 'pos_morpheme',
+    'pos_word_stem', 'word_language', 'morpheme_language',
+}
+
+
+class Exporter:
+
+    # number of rows read and written at once
+    batch_size = 65536
+
+    @classmethod
+    def export(cls, cfg_path='config.ini', fmt='parquet', db_path=None,
+               out_dir=None):
+        """Export every table and `v_all_data` partitioned by corpus.
+
+        The rows of a table are written to `<out_dir>/<table>/<corpus>.parquet`
+        batch by batch, so no table is ever held in memory as a whole. The
+        denormalized `v_all_data` is written as the table `all_data`.
+
+        Args:
+            cfg_path (str): Path to the config file.
+            fmt (str): The format. Only 'parquet' is supported.
+            db_path (str): Path to the database. Defaults to the most recent
+                database in the database directory of the config.
+            out_dir (str): Where the files are written to. Defaults to a
+                directory next to the database.
+        """
+        if fmt != 'parquet':
+            raise ValueError(f'Unsupported export format: {fmt}')
+
+        if db_path is None:
+            cfg = ConfigParser(interpolation=ExtendedInterpolation())
+            cfg.read(cfg_path)
+            db_dir = cfg['.global']['db_dir']
+            db_path = DBProcessor.get_most_recent_database(
+                pathlib.Path(db_dir))
+
+            if db_path is None:
+                raise FileNotFoundError(f'No database in: {db_dir}')
+
+        if out_dir is None:
+            out_dir = os.path.splitext(str(db_path))[0] + '_parquet'
+
+        print('Reading database:', os.path.abspath(db_path))
+        print('Writing Parquet files to:', os.path.abspath(out_dir))
+
+        conn = sqlite3.connect(f'file:{db_path}?mode=ro', uri=True)
+
+        try:
+            corpora = [row[0] for row in conn.execute(
+                'SELECT id FROM corpora ORDER BY id')]
+
+            for table, query in cls.get_queries(conn).items():
+                schema = get_arrow_schema(conn, table)
+                table_dir = os.path.join(out_dir, table)
+                os.makedirs(table_dir, exist_ok=True)
+
+                for corpus in corpora:
+                    print('\t', table, corpus)
+                    cursor = conn.execute(query, {'corpus': corpus})
+                    write_parquet(
+                        os.path.join(table_dir, f'{corpus}.parquet'),
+                        schema, cursor, cls.batch_size)
+        finally:
+            conn.close()
+
+    @staticmethod
+    def get_queries(conn):
+        """Get the queries of the exported tables.
+
+        Args:
+            conn (sqlite3.Connection): The database connection.
+
+        Returns:
+            Dict[str, str]: The queries by table name.
+        """
+        queries = dict(TABLE_QUERIES)
+
+        has_all_data = conn.execute(
+            "SELECT 1 FROM sqlite_master "
+            "WHERE type = 'table' AND name = 'all_data'").fetchone()
+        if has_all_data:
+            queries['all_data'] = ALL_DATA_QUERY
+
+        return queries
+
+
+def import_pyarrow():
+    """Import pyarrow which is an optional dependency.
+
+    Returns:
+        Tuple[module, module]: The modules `pyarrow` and `pyarrow.parquet`.
+    """
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError(
+            'The Parquet export requires pyarrow: '
+            'pip install acqdiv[parquet]') from e
+
+    return pyarrow, pyarrow.parquet
+
+
+def get_arrow_schema(conn, table):
+    """Get the Arrow schema of a table from its SQLite column types.
+
+    The columns of `DICTIONARY_COLUMNS` are dictionary-encoded strings.
+
+    Args:
+        conn (sqlite3.Connection): The database connection.
+        table (str): The table name. The schema of `all_data` is taken from
+            the view `v_all_data`.
+
+    Returns:
+        pyarrow.Schema: The schema.
+    """
+    pa, _ = import_pyarrow()
+
+    if table == 'all_data':
+        table = 'v_all_data'
+
+    fields = []
+    for _, name, decl_type, *_ in conn.execute(f'PRAGMA table_info({table})'):
+        decl_type = decl_type.upper()
+
+        # first as e.g. `uniquespeakers.corpus` is declared as integer
+        if name in DICTIONARY_COLUMNS:
+            arrow_type = pa.dictionary(pa.int32(), pa.string())
+        elif decl_type.startswith('INT'):
+            arrow_type = pa.int64()
+        elif decl_type in ('FLOAT', 'REAL'):
+            arrow_type = pa.float64()
+        elif decl_type == 'BOOLEAN':
+            arrow_type = pa.bool_()
+        else:
+            arrow_type = pa.string()
+
+        fields.append(pa.field(name, arrow_type))
+
+    return pa.schema(fields)
+
+
+def get_record_batch(schema, rows):
+    """Get the record batch of rows.
+
+    Args:
+        schema (pyarrow.Schema): The schema.
+        rows (List[tuple]): The rows.
+
+    Returns:
+        pyarrow.RecordBatch: The record batch.
+    """
+    pa, _ = import_pyarrow()
+
+    arrays = []
+    for field, values in zip(schema, zip(*rows)):
+        if pa.types.is_boolean(field.type):
+            values = [None if v is None else bool(v) for v in values]
+
+        if pa.types.is_dictionary(field.type):
+            array = pa.array(values, type=pa.string()).dictionary_encode()
+        else:
+            array = pa.array(values, type=field.type)
+
+        arrays.append(array)
+
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def write_parquet(path, schema, cursor, batch_size):
+    """Write the rows of a cursor to a Parquet file.
+
+    Every batch of rows becomes a row group.
+
+    Args:
+        path (str): Path to the Parquet file.
+        schema (pyarrow.Schema): The schema.
+        cursor (sqlite3.Cursor): The cursor of the rows.
+        batch_size (int): Number of rows per batch.
+    """
+    writer = open_parquet_writer(path, schema)
+
+    try:
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+
+            write_record_batch(writer, schema, rows)
+    finally:
+        writer.close()
+
+
+def open_parquet_writer(path, schema):
+    """Open a Parquet file for writing.
+
+    Only the dictionary columns of the schema are dictionary-encoded.
+
+    Args:
+        path (str): Path to the Parquet file.
+        schema (pyarrow.Schema): The schema.
+
+    Returns:
+        pyarrow.parquet.ParquetWriter: The writer.
+    """
+    pa, pq = import_pyarrow()
+
+    use_dictionary = [field.name for field in schema
+                      if pa.types.is_dictionary(field.type)]
+
+    return pq.ParquetWriter(
+        path, schema, use_dictionary=use_dictionary, compression='zstd')
+
+
+def write_record_batch(writer, schema, rows):
+    """Write rows as a row group.
+
+    Args:
+        writer (pyarrow.parquet.ParquetWriter): The writer.
+        schema (pyarrow.Schema): The schema.
+        rows (List[tuple]): The rows.
+    """
+    pa, _ = import_pyarrow()
+
+    batch = get_record_batch(schema, rows)
+    writer.write_table(pa.Table.from_batches([batch]))
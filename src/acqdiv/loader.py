@@ -1,41 +1,315 @@
 """ Entry point for loading ACQDIV raw input corpora data into the ACQDIV-DB
 """
+import contextlib
+import cProfile
 import os
+import pickle
+import tempfile
 from configparser import ConfigParser, ExtendedInterpolation
 
 from acqdiv.parsers.corpus_parser_mapper import CorpusParserMapper
+from acqdiv.database.parquet_processor import ParquetProcessor
 from acqdiv.database.processor import DBProcessor
+from acqdiv.util.fingerprint import get_code_fingerprint
+from acqdiv.util.memoization import add_worker_counts, \
+    call_counting_caches, clear_caches, format_cache_stats
+from acqdiv.util.parallel import get_executor
+from acqdiv.util.profiler import profiler
+from acqdiv.util.uniquespeaker import set_unique_speakers
+
+# writers the data can be loaded into by backend name
+BACKENDS = {
+    'sqlite': DBProcessor,
+    'parquet': ParquetProcessor,
+}
 
 
 class Loader:
 
-    @staticmethod
-    def load(cfg_path='config.ini'):
+    @classmethod
+    def load(cls, cfg_path='config.ini', jobs=1, parallel_sessions=False,
+             incremental=False, materialize=False, backend='sqlite',
+             normalize=False, profile_dir=None, cprofile=False):
         """Load data from source files into DB.
 
         Args:
             cfg_path (str): Path to the config file.
+            jobs (int): Number of worker processes parsing corpora in
+                parallel. The database is written by the main process only.
+            parallel_sessions (bool): Whether to parse the sessions within
+                a corpus in parallel instead of whole corpora.
+            incremental (bool): Whether to update the most recent database
+                by only parsing the session files that changed since.
+            materialize (bool): Whether to store the view `v_all_data` as
+                the table `all_data`. An existing table is always kept up to
+                date.
+            backend (str): The backend the data is written to, see
+                `BACKENDS`. The parquet backend writes one Parquet file per
+                table and corpus instead of a database, always including
+                `all_data`.
+            normalize (bool): Whether to store the repeated values of words
+                and morphemes in lookup tables. Views keep the original
+                tables and columns. An incremental load restores the
+                original tables before loading.
+            profile_dir (str): Where the wall time of the stages per corpus
+                and session is written to, see `Profiler.write_report`. Not
+                profiled if not specified. Sessions parsed in worker
+                processes only have the time of their insert.
+            cprofile (bool): Whether to also write a cProfile dump
+                `<corpus>.prof` per corpus to `profile_dir`.
+
+        The hit and miss statistics of the memoized cleaning methods are
+        printed at the end, including those of the worker processes.
         """
         print('Reading config file:', os.path.abspath(cfg_path))
         cfg = ConfigParser(interpolation=ExtendedInterpolation())
         cfg.read(cfg_path)
 
         db_dir = cfg['.global']['db_dir']
-        db_processor = DBProcessor(db_dir=db_dir)
+        # parsed sessions are only cached if a directory is configured
+        cache_dir = cfg['.global'].get('cache_dir')
+        db_processor = BACKENDS[backend](
+            db_dir=db_dir, incremental=incremental)
 
-        for section in cfg.sections():
+        corpus_cfgs = [
+            (section, dict(cfg.items(section)))
+            for section in cfg.sections()
             # ignore sections starting with a dot
-            if not section.startswith('.'):
-                # get corpus parser based on corpus name
-                corpus_parser_class = CorpusParserMapper.map(section)
-                data = dict(cfg.items(section))
-                corpus_parser = corpus_parser_class(data)
+            if not section.startswith('.')
+        ]
+
+        # number of sessions after which the data is committed
+        checkpoint_interval = cfg['.global'].getint('checkpoint_interval')
+
+        if profile_dir is not None:
+            profiler.enable()
+
+        # the cache statistics only cover this load
+        clear_caches()
+
+        # where the cProfile dumps are written to
+        cprofile_dir = profile_dir if cprofile else None
+
+        with db_processor.bulk_load(checkpoint_interval):
+            if jobs > 1 and not parallel_sessions:
+                cls.load_parallel(db_processor, corpus_cfgs, jobs, cache_dir,
+                                  cprofile_dir)
+            else:
+                for section, data in corpus_cfgs:
+                    session_paths, source_paths, fingerprint = \
+                        get_session_paths(db_processor, section, data)
+
+                    with profile_corpus(cprofile_dir, section):
+                        # get the corpus, its utterances are parsed while
+                        # they are inserted
+                        corpus = parse_corpus(
+                            section, data, jobs=jobs,
+                            session_paths=session_paths, cache_dir=cache_dir,
+                            stream=True)
+
+                        # add the corpus to the DB
+                        db_processor.insert_corpus(
+                            corpus, session_paths, fingerprint, source_paths)
+
+            # after all inserts as indexes slow them down
+            db_processor.create_indexes()
+            db_processor.materialize_all_data(force=materialize)
+
+        # after the bulk load as the database is vacuumed
+        if normalize:
+            db_processor.normalize()
+
+        print()
+        print(format_cache_stats())
+
+        if profile_dir is not None:
+            profiler.disable()
+            profiler.write_report(profile_dir)
+            print('Profile written to:', os.path.abspath(profile_dir))
+
+    @staticmethod
+    def load_parallel(db_processor, corpus_cfgs, jobs, cache_dir=None,
+                      cprofile_dir=None):
+        """Parse the corpora in worker processes and write them to the DB.
+
+        Every worker parses a whole corpus and spools its sessions to a
+        temporary file. The corpora are then inserted in config order by the
+        calling process, so the database is identical to a serial build.
+
+        Args:
+            db_processor (Writer): The processor writing the data.
+            corpus_cfgs (List[Tuple[str, dict]]): Corpus name and config.
+            jobs (int): Number of worker processes.
+            cache_dir (str): Where parsed sessions are cached.
+            cprofile_dir (str): Where the cProfile dumps of the inserts are
+                written to. Not profiled if not specified.
+        """
+        with tempfile.TemporaryDirectory(prefix='acqdiv_') as spool_dir, \
+                get_executor(jobs) as executor:
+
+            futures = []
+            for section, data in corpus_cfgs:
+                session_paths, source_paths, fingerprint = \
+                    get_session_paths(db_processor, section, data)
+                spool_path = os.path.join(spool_dir, f'{section}.pickle')
+                future = executor.submit(
+                    call_counting_caches, spool_corpus, section, data,
+                    spool_path, session_paths, cache_dir)
+                futures.append(
+                    (section, future, session_paths, source_paths, fingerprint))
+
+            for section, future, session_paths, source_paths, fingerprint \
+                    in futures:
+                spool_path, counts = future.result()
+                add_worker_counts(counts)
+                corpus = read_spooled_corpus(spool_path)
+
+                with profile_corpus(cprofile_dir, section):
+                    db_processor.insert_corpus(
+                        corpus, session_paths, fingerprint, source_paths)
+
+
+@contextlib.contextmanager
+def profile_corpus(cprofile_dir, section):
+    """Write a cProfile dump of loading a corpus.
+
+    Args:
+        cprofile_dir (str): Where the dump `<section>.prof` is written to.
+            Not profiled if None.
+        section (str): The corpus name as used in the config.
+    """
+    if cprofile_dir is None:
+        yield
+        return
+
+    os.makedirs(cprofile_dir, exist_ok=True)
+    cprofiler = cProfile.Profile()
+    cprofiler.enable()
+
+    try:
+        yield
+    finally:
+        cprofiler.disable()
+        cprofiler.dump_stats(os.path.join(cprofile_dir, f'{section}.prof'))
+
+
+def get_session_paths(db_processor, section, data):
+    """Get the session files of a corpus that have to be parsed.
+
+    These are all session files unless the database is loaded
+    incrementally.
+
+    Args:
+        db_processor (Writer): The processor writing the data.
+        section (str): The corpus name as used in the config.
+        data (dict): The corpus configuration.
+
+    Returns:
+        Tuple[List[str], dict, str]: The paths to the session files, the
+        paths to the files every session is parsed from by session file and
+        the fingerprint of the parser code.
+    """
+    corpus_parser_class = CorpusParserMapper.map(section)
+    corpus_parser = corpus_parser_class(data)
+    session_paths = corpus_parser.get_session_paths()
+    source_paths = {session_path: corpus_parser.get_source_paths(session_path)
+                    for session_path in session_paths}
+    fingerprint = get_code_fingerprint(corpus_parser_class)
+
+    if db_processor.incremental:
+        session_paths = db_processor.get_stale_session_paths(
+            data['corpus'], session_paths, fingerprint, source_paths)
+
+    return session_paths, source_paths, fingerprint
+
+
+def parse_corpus(section, data, disable_pbar=False, jobs=1,
+                 session_paths=None, cache_dir=None, stream=False):
+    """Get the corpus of a config section.
+
+    Args:
+        section (str): The corpus name as used in the config.
+        data (dict): The corpus configuration.
+        disable_pbar (bool): Whether the progressbar should be disabled.
+        jobs (int): Number of worker processes parsing the sessions.
+        session_paths (List[str]): Only parse these session files.
+        cache_dir (str): Where parsed sessions are cached.
+        stream (bool): Whether the utterances are parsed lazily.
+
+    Returns:
+        acqdiv.model.corpus.Corpus: The corpus with lazily parsed sessions.
+    """
+    # get corpus parser based on corpus name
+    corpus_parser_class = CorpusParserMapper.map(section)
+    corpus_parser = corpus_parser_class(
+        data, disable_pbar=disable_pbar, jobs=jobs, cache_dir=cache_dir,
+        stream=stream)
+
+    return corpus_parser.parse(session_paths)
+
+
+def spool_corpus(section, data, spool_path, session_paths=None,
+                 cache_dir=None):
+    """Parse a corpus and pickle it session by session to a file.
+
+    Runs in a worker process.
+
+    Args:
+        section (str): The corpus name as used in the config.
+        data (dict): The corpus configuration.
+        spool_path (str): Path of the file the corpus is written to.
+        session_paths (List[str]): Only parse these session files.
+        cache_dir (str): Where parsed sessions are cached.
+
+    Returns:
+        str: The spool path.
+    """
+    corpus = parse_corpus(
+        section, data, disable_pbar=True, session_paths=session_paths,
+        cache_dir=cache_dir)
+    sessions = corpus.sessions
+    corpus.sessions = []
+
+    with open(spool_path, 'wb') as spool:
+        pickle.dump(corpus, spool, protocol=pickle.HIGHEST_PROTOCOL)
+
+        for session in sessions:
+            pickle.dump(session, spool, protocol=pickle.HIGHEST_PROTOCOL)
+
+    return spool_path
+
+
+def read_spooled_corpus(spool_path):
+    """Read a corpus written by `spool_corpus`.
+
+    The unique speakers are set again as their identity is lost when the
+    sessions are pickled separately.
+
+    Args:
+        spool_path (str): Path of the spooled corpus.
+
+    Returns:
+        acqdiv.model.corpus.Corpus: The corpus with lazily read sessions.
+    """
+    spool = open(spool_path, 'rb')
+    corpus = pickle.load(spool)
+
+    def iter_sessions():
+        with spool:
+            while True:
+                try:
+                    session = pickle.load(spool)
+                except EOFError:
+                    break
+
+                set_unique_speakers(corpus.corpus, session.speakers)
+                yield session
+
+        os.remove(spool_path)
 
-                # get the corpus
-                corpus = corpus_parser.parse()
+    corpus.sessions = iter_sessions()
 
-                # add the corpus to the DB
-                db_processor.insert_corpus(corpus)
+    return corpus
 
 
 def main():
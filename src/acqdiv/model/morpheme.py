@@ -1,3 +1,6 @@
+from typing import Optional
+
+from acqdiv.model.word import Word
 
 
 class Morpheme:
@@ -12,8 +15,24 @@ class Morpheme:
     pos_ud (str): The Universal Dependency POS tag mapped from `pos_raw`.
     lemma_id (str): The ID of the lemma.
     warning (str): Warnings regarding morpheme.
+    word (Optional[Word]): The word the morpheme belongs to if the words and
+        morphemes of the utterance are aligned.
     """
 
+    __slots__ = (
+        'morpheme_language',
+        'type',
+        'morpheme',
+        'gloss_raw',
+        'gloss',
+        'pos_raw',
+        'pos',
+        'pos_ud',
+        'lemma_id',
+        'warning',
+        'word',
+    )
+
     morpheme_language: str
     type: str
     morpheme: str
@@ -24,6 +43,7 @@ class Morpheme:
     pos_ud: str
     lemma_id: str
     warning: str
+    word: Optional[Word]
 
     def __init__(self):
         """Initialize the variables representing a morpheme."""
@@ -37,3 +57,4 @@ class Morpheme:
         self.pos_ud = ''
         self.lemma_id = ''
         self.warning = ''
+        self.word = None
@@ -12,7 +12,9 @@ class Session:
     media_filename (str): The media file name of the session.
     duration (str): The duration of the session.
     speakers (List[Speaker]): The session speakers.
-    utterances (List[Utterance]): The session utterances.
+    utterances (List[Utterance]): The session utterances. An iterator
+        parsing them lazily if the session is streamed.
+    path (str): The path to the session file.
     """
 
     source_id: str
@@ -21,6 +23,7 @@ class Session:
     duration: str
     speakers: List[Speaker]
     utterances: List[Utterance]
+    path: str
 
     def __init__(self):
         """Initialize variables representing a session."""
@@ -30,3 +33,4 @@ class Session:
         self.duration = ''
         self.speakers = []
         self.utterances = []
+        self.path = ''
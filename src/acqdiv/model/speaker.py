@@ -19,6 +19,22 @@ class Speaker:
     languages_spoken: The languages spoken by the speaker.
     """
 
+    __slots__ = (
+        'uniquespeaker',
+        'code',
+        'name',
+        'gender_raw',
+        'gender',
+        'birth_date',
+        'age_raw',
+        'age',
+        'age_in_days',
+        'role_raw',
+        'role',
+        'macro_role',
+        'languages_spoken',
+    )
+
     uniquespeaker: Optional[UniqueSpeaker]
     code: str
     name: str
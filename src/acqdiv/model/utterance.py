@@ -35,6 +35,33 @@ class Utterance:
     morphemes (List[Morpheme]]): The morphemes of the utterance.
     """
 
+    __slots__ = (
+        'source_id',
+        'speaker',
+        'addressee',
+        'utterance_raw',
+        'utterance',
+        'actual_utterance',
+        'target_utterance',
+        'translation',
+        'morpheme_raw',
+        'morpheme',
+        'gloss_raw',
+        'gloss',
+        'pos_raw',
+        'pos',
+        'sentence_type',
+        'childdirected',
+        'start_raw',
+        'start',
+        'end_raw',
+        'end',
+        'comment',
+        'warning',
+        'words',
+        'morphemes',
+    )
+
     source_id: str
     speaker: Optional[Speaker]
     addressee: Optional[Speaker]
@@ -51,8 +78,8 @@ class Utterance:
     pos: str
     sentence_type: str
     childdirected: str
-    start_raw = str
-    start = str
+    start_raw: str
+    start: str
     end_raw: str
     end: str
     comment: str
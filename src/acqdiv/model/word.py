@@ -11,6 +11,16 @@ class Word:
     pos_ud (str): The Universal Dependency POS tag of the word.
     """
 
+    __slots__ = (
+        'word_language',
+        'word',
+        'word_actual',
+        'word_target',
+        'pos',
+        'pos_ud',
+        'warning',
+    )
+
     word_language: str
     word: str
     word_actual: str
@@ -2,11 +2,21 @@ from acqdiv.parsers.chat.cleaners.utterance_cleaner \
     import CHATUtteranceCleaner
 
 from acqdiv.parsers.chat.cleaners.word_cleaner import CHATWordCleaner
+from acqdiv.util.memoization import MemoizedClassMethods
 from acqdiv.util.timestamp import unify_timestamp
 
 
-class CHATCleaner:
-    """Default cleaner for CHAT corpora."""
+class CHATCleaner(MemoizedClassMethods):
+    """Default cleaner for CHAT corpora.
+
+    The per-token cleaning methods are memoized as the same words and
+    morphemes recur throughout a corpus. Cleaners whose results depend on
+    anything but the token have to set `memoize` to False.
+    """
+
+    memoized_methods = (
+        'clean_word', 'clean_segment', 'clean_gloss_raw', 'clean_gloss',
+        'clean_pos_raw', 'clean_pos', 'clean_pos_ud')
 
     @staticmethod
     def clean_date(date):
@@ -1,11 +1,60 @@
 import re
 
+# postcodes or nothing may follow terminators
+terminator_regex = re.compile(r'[+/.!?"]*[!?.](?=( \[\+|$))')
+event_utterance_regex = re.compile(r'\b0\b')
+event_regex = re.compile(r'&=\S+')
+repetition_regex = re.compile(r'(?:<([^<]*?)>|(\S+))( \[.*?\])? ?\[x (\d+)\]')
+omission_regex = re.compile(r'0\S+[^\]](?=\s|$)')
+untranscribed_regex = re.compile(r'xxx|yyy|www')
+linker_regex = re.compile(r'^\+["^,+<]')
+separator_regex = re.compile(r' [,:;]( )')
+ca_regex = re.compile(r'[↓↑‡„“”]')
+pause_regex = re.compile(r'\(\.{1,3}\)')
+scope_regex = re.compile(r'<|>|\[.*?\]')
+# pauses and scoped symbols in a single pass
+pause_scope_regex = re.compile(r'\(\.{1,3}\)|<|>|\[.*?\]')
+ca_table = str.maketrans('', '', '↓↑‡„“”')
+
 
 class CHATUtteranceCleaner:
     """Cleaners for CHAT utterances."""
 
     @classmethod
     def clean(cls, utterance):
+        """Clean the utterance.
+
+        Same as `clean_stepwise`, but the steps after removing separators are
+        fused to a few passes without normalizing whitespace in between.
+        This is safe as none of these steps depends on the whitespace. The
+        preceding steps are run as they are since they do (e.g. anchors,
+        literal blanks or `remove_omissions` checking the beginning).
+        """
+        for cleaning_method in [
+                cls.remove_terminator,
+                cls.unify_untranscribed,
+                cls.handle_repetitions,
+                cls.remove_events,
+                cls.remove_omissions,
+                cls.remove_linkers,
+                cls.remove_separators]:
+            utterance = cleaning_method(utterance)
+
+        # remove_ca, remove_pauses_between_words, remove_scoped_symbols,
+        # remove_commas and null_event_utterances
+        utterance = utterance.translate(ca_table)
+        utterance = pause_scope_regex.sub('', utterance)
+        utterance = utterance.replace(',', '')
+        utterance = event_utterance_regex.sub('', utterance)
+
+        return cls.remove_redundant_whitespaces(utterance)
+
+    @classmethod
+    def clean_stepwise(cls, utterance):
+        """Clean the utterance running one cleaning method after the other.
+
+        Reference for `clean`.
+        """
         for cleaning_method in [
                 cls.remove_terminator,
                 cls.unify_untranscribed,
@@ -32,8 +81,7 @@ class CHATUtteranceCleaner:
         whitespaces. This method is routinely called by various
         cleaning methods.
         """
-        whitespace_regex = re.compile(r'\s+')
-        return whitespace_regex.sub(' ', utterance).strip(' ')
+        return ' '.join(utterance.split())
 
     @classmethod
     def remove_terminator(cls, utterance):
@@ -41,8 +89,6 @@ class CHATUtteranceCleaner:
 
         There are 13 different terminators in CHAT. Coding: [+/.!?"]*[!?.]  .
         """
-        # postcodes or nothing may follow terminators
-        terminator_regex = re.compile(r'[+/.!?"]*[!?.](?=( \[\+|$))')
         clean = terminator_regex.sub('', utterance)
         return cls.remove_redundant_whitespaces(clean)
 
@@ -68,8 +114,7 @@ class CHATUtteranceCleaner:
 
         CHAT coding: 0
         """
-        regex = re.compile(r'\b0\b')
-        utterance = regex.sub('', utterance)
+        utterance = event_utterance_regex.sub('', utterance)
         return cls.remove_redundant_whitespaces(utterance)
 
     @classmethod
@@ -78,7 +123,6 @@ class CHATUtteranceCleaner:
 
         Coding in CHAT: word starting with &=.
         """
-        event_regex = re.compile(r'&=\S+')
         clean = event_regex.sub('', utterance)
         return cls.remove_redundant_whitespaces(clean)
 
@@ -90,8 +134,6 @@ class CHATUtteranceCleaner:
 
         Coding in CHAT: [x <number>]  .
         """
-        repetition_regex = re.compile(
-            r'(?:<([^<]*?)>|(\S+))( \[.*?\])? ?\[x (\d+)\]')
         # build cleaned utterance
         clean = ''
         match_end = 0
@@ -134,7 +176,6 @@ class CHATUtteranceCleaner:
         """
         # if not a null utterance
         if not utterance.startswith('0['):
-            omission_regex = re.compile(r'0\S+[^\]](?=\s|$)')
             clean = omission_regex.sub('', utterance)
             return cls.remove_redundant_whitespaces(clean)
 
@@ -153,7 +194,6 @@ class CHATUtteranceCleaner:
             on the word level because `null_untranscribed_utterances` depends
             on it.
         """
-        untranscribed_regex = re.compile(r'xxx|yyy|www')
         return untranscribed_regex.sub('???', utterance)
 
     @staticmethod
@@ -162,7 +202,6 @@ class CHATUtteranceCleaner:
 
         Coding in CHAT: +["^,+<] (always in the beginning of utterance).
         """
-        linker_regex = re.compile(r'^\+["^,+<]')
         return linker_regex.sub('', utterance).lstrip(' ')
 
     @staticmethod
@@ -172,7 +211,6 @@ class CHATUtteranceCleaner:
         Separators are commas, colons or semi-colons which are surrounded
         by whitespaces.
         """
-        separator_regex = re.compile(r' [,:;]( )')
         return separator_regex.sub(r'\1', utterance)
 
     @classmethod
@@ -183,7 +221,6 @@ class CHATUtteranceCleaner:
             Only four markers (↓↑‡„“”) are attested in the corpora. Only those
             will be checked for removal.
         """
-        ca_regex = re.compile(r'[↓↑‡„“”]')
         clean = ca_regex.sub('', utterance)
         return cls.remove_redundant_whitespaces(clean)
 
@@ -193,7 +230,6 @@ class CHATUtteranceCleaner:
 
         Coding in CHAT: (.), (..), (...)
         """
-        pause_regex = re.compile(r'\(\.{1,3}\)')
         clean = pause_regex.sub('', utterance)
         return cls.remove_redundant_whitespaces(clean)
 
@@ -212,11 +248,10 @@ class CHATUtteranceCleaner:
                 - <word [...] word> [...]
                 - <<word word> [...] word> [...]
         """
-        scope_regex = re.compile(r'<|>|\[.*?\]')
         clean = scope_regex.sub('', utterance)
         return cls.remove_redundant_whitespaces(clean)
 
     @classmethod
     def remove_commas(cls, utterance):
         """Remove commas from utterance."""
-        return re.sub(r',', '', utterance)
+        return utterance.replace(',', '')
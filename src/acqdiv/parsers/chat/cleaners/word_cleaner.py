@@ -1,5 +1,9 @@
 import re
 
+form_marker_regex = re.compile(r'@.*')
+pause_regex = re.compile(r'(\S+?)\^')
+filler_regex = re.compile(r'&-|&(?!=)(\S+)')
+
 
 class CHATWordCleaner:
 
@@ -20,7 +24,6 @@ class CHATWordCleaner:
         Coding in CHAT: word ending with @.
         The @ and the part after it are removed.
         """
-        form_marker_regex = re.compile(r'@.*')
         return form_marker_regex.sub(r'', word)
 
     @staticmethod
@@ -37,7 +40,6 @@ class CHATWordCleaner:
 
         Coding in CHAT: ^ within word
         """
-        pause_regex = re.compile(r'(\S+?)\^')
         return pause_regex.sub(r'\1', word)
 
     @staticmethod
@@ -54,5 +56,4 @@ class CHATWordCleaner:
 
         Coding in CHAT: word starts with & or &-
         """
-        filler_regex = re.compile(r'&-|&(?!=)(\S+)')
         return filler_regex.sub(r'\1', word)
@@ -11,7 +11,8 @@ class CHAT:
         media_filename (str): The filename at @Media.
         media_format (str): The format at @Media.
         media_comment (str): The comment at @Media.
-        records (List[acqdiv.parsers.chat.model.Record]): The records.
+        records (Iterable[acqdiv.parsers.chat.model.Record]): The records.
+            They may be read lazily from the CHAT file.
         """
         self.date = ''
         self.participants = {}
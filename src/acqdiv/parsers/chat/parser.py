@@ -8,6 +8,7 @@ from acqdiv.util.age import get_age_in_days
 from acqdiv.util.role import RoleMapper
 from acqdiv.util.alignment import align_words_morphemes, fix_misalignments
 from acqdiv.util.childdirectedness import infer_childdirected
+from acqdiv.util.profiler import profiler
 
 from acqdiv.model.session import Session
 from acqdiv.model.speaker import Speaker
@@ -29,10 +30,11 @@ class CHATParser(SessionParser):
         self.session_path = session_path
         self.session_filename = os.path.basename(self.session_path)
 
-        with open(session_path) as session_file:
-            self.reader = self.get_reader(session_file)
+        # the file is only opened by `parse`, unless a reader is set before
+        self.session_file = None
+        self.reader = None
 
-        self.cleaner = self.get_cleaner()
+        self.cleaner = profiler.wrap('cleaner', self.get_cleaner())
         self.consistent_actual_target = True
 
     @staticmethod
@@ -55,16 +57,38 @@ class CHATParser(SessionParser):
         """
         return CHATCleaner()
 
-    def parse(self):
+    def parse(self, stream=False):
         """Get the session instance.
 
+        The session file is opened here and closed once all utterances are
+        parsed, or right away if parsing fails.
+
+        Args:
+            stream (bool): Whether the utterances are parsed lazily, see
+                `iter_utterances`.
+
         Returns:
             acqdiv.model.session.Session: The Session instance.
         """
         session = Session()
-        self.add_session_metadata(session)
-        self.add_speakers(session)
-        self.add_records(session)
+
+        try:
+            if self.reader is None:
+                self.session_file = open(self.session_path)
+                self.reader = profiler.wrap(
+                    'reader', self.get_reader(self.session_file))
+
+            self.add_session_metadata(session)
+            self.add_speakers(session)
+            self.index_target_children(session.speakers)
+            self.clean_speakers(session)
+            self.index_speakers(session.speakers)
+        except BaseException:
+            self.close()
+            raise
+
+        utterances = self.iter_utterances()
+        session.utterances = utterances if stream else list(utterances)
 
         return session
 
@@ -124,34 +148,42 @@ class CHATParser(SessionParser):
 
             session.speakers.append(speaker)
 
-    def add_records(self, session):
-        """Add the records."""
-        while self.reader.load_next_record():
-            utt = self.add_utterance(session)
-            self.add_words(utt)
-            self.add_morphemes(utt)
-            align_words_morphemes(utt)
-
-    @staticmethod
-    def _get_speaker(label, speakers):
-        for speaker in speakers:
-            if speaker.code == label:
-                return speaker
+    def iter_utterances(self):
+        """Parse the utterances one after the other.
 
-        return None
+        The records are read from the session file while iterating. The file
+        is closed once all of them are read.
 
-    def add_utterance(self, session):
-        """Add the utterance to the session."""
+        Yields:
+            acqdiv.model.utterance.Utterance: The next utterance.
+        """
+        try:
+            while self.reader.load_next_record():
+                utt = self.get_utterance()
+                self.add_words(utt)
+                self.add_morphemes(utt)
+                align_words_morphemes(utt)
+
+                yield utt
+        finally:
+            self.close()
+
+    def close(self):
+        """Close the session file if it is open."""
+        if self.session_file is not None:
+            self.session_file.close()
+
+    def get_utterance(self):
+        """Get the utterance of the current record."""
         utt = Utterance()
-        session.utterances.append(utt)
         utt.source_id = self.get_source_id()
         speaker_label = self.cleaner.clean_record_speaker_label(
             self.session_filename, self.reader.get_record_speaker_label())
-        utt.speaker = self._get_speaker(speaker_label, session.speakers)
+        utt.speaker = self.get_speaker(speaker_label)
         addressee_label = self.cleaner.clean_record_speaker_label(
             self.session_filename, self.reader.get_addressee())
-        utt.addressee = self._get_speaker(addressee_label, session.speakers)
-        utt.childdirected = infer_childdirected(utt)
+        utt.addressee = self.get_speaker(addressee_label)
+        utt.childdirected = infer_childdirected(utt, self.target_children)
         utt.translation = self.cleaner.clean_translation(
             self.reader.get_translation())
         utt.comment = self.reader.get_comments()
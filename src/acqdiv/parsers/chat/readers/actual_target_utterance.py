@@ -1,5 +1,21 @@
 import re
 
+shortening_actual_regex = re.compile(r'(?<=\S)\(\S+?\)|\(\S+?\)(?=\S)')
+shortening_target_regex = re.compile(
+    r'(?<=\S)\((\S+?)\)|\((\S+?)\)(?=\S)')
+# several scoped words
+replacement_actual_regex1 = re.compile(r'<(.*?)> ?\[: .*?\]')
+# one scoped word
+replacement_actual_regex2 = re.compile(r'(\S+) ?\[: .*?\]')
+replacement_target_regex = re.compile(r'(?:<.*?>|\S+) ?\[: (.*?)\]')
+fragment_regex = re.compile(r'(^|\s)&([^-=\s]\S*)')
+# several scoped words
+retracing_regex1 = re.compile(r'<(.*?)> ?\[(/{1,3}|/-)\]')
+# one scoped word
+retracing_regex2 = re.compile(r'(\S+) ?\[(/{1,3}|/-)\]')
+# single-word correction
+retracing_target_regex = re.compile(r'([^>\s]+) ?\[//\] (\S+)')
+
 
 class ActualTargetUtteranceExtractor:
     """Methods for extracting actual and target utterances."""
@@ -31,8 +47,7 @@ class ActualTargetUtteranceExtractor:
         Coding in CHAT: parentheses within word.
         The part with parentheses is removed.
         """
-        shortening_regex = re.compile(r'(?<=\S)\(\S+?\)|\(\S+?\)(?=\S)')
-        return shortening_regex.sub('', utterance)
+        return shortening_actual_regex.sub('', utterance)
 
     @staticmethod
     def get_shortening_target(utterance):
@@ -41,8 +56,7 @@ class ActualTargetUtteranceExtractor:
         Coding in CHAT: parentheses within word.
         The part in parentheses is kept, parentheses are removed.
         """
-        shortening_regex = re.compile(r'(?<=\S)\((\S+?)\)|\((\S+?)\)(?=\S)')
-        return shortening_regex.sub(r'\1\2', utterance)
+        return shortening_target_regex.sub(r'\1\2', utterance)
 
     @staticmethod
     def get_replacement_actual(utterance):
@@ -51,12 +65,8 @@ class ActualTargetUtteranceExtractor:
         Coding in CHAT: [: <words>] .
         Keeps replaced words, removes replacing words with brackets.
         """
-        # several scoped words
-        replacement_regex1 = re.compile(r'<(.*?)> ?\[: .*?\]')
-        clean = replacement_regex1.sub(r'\1', utterance)
-        # one scoped word
-        replacement_regex2 = re.compile(r'(\S+) ?\[: .*?\]')
-        return replacement_regex2.sub(r'\1', clean)
+        clean = replacement_actual_regex1.sub(r'\1', utterance)
+        return replacement_actual_regex2.sub(r'\1', clean)
 
     @staticmethod
     def get_replacement_target(utterance):
@@ -67,12 +77,10 @@ class ActualTargetUtteranceExtractor:
         is more than one replacing word, they are joined together by an
         underscore.
         """
-        replacement_regex = re.compile(r'(?:<.*?>|\S+) ?\[: (.*?)\]')
-
         def x(match):
             return match.group(1).replace(' ', '_')
 
-        return replacement_regex.sub(x, utterance)
+        return replacement_target_regex.sub(x, utterance)
 
     @staticmethod
     def get_fragment_actual(utterance):
@@ -81,7 +89,6 @@ class ActualTargetUtteranceExtractor:
         Coding in CHAT: word starting with &.
         Keeps the fragment, removes the & from the word.
         """
-        fragment_regex = re.compile(r'(^|\s)&([^-=\s]\S*)')
         return fragment_regex.sub(r'\1\2', utterance)
 
     @staticmethod
@@ -91,7 +98,6 @@ class ActualTargetUtteranceExtractor:
         Coding in CHAT: word starting with &.
         The fragment is marked as untranscribed (xxx).
         """
-        fragment_regex = re.compile(r'(^|\s)&([^-=\s]\S*)')
         return fragment_regex.sub(r'\1xxx', utterance)
 
     @staticmethod
@@ -102,11 +108,7 @@ class ActualTargetUtteranceExtractor:
 
         Removal of retracing markers.
         """
-        # several scoped words
-        retracing_regex1 = re.compile(r'<(.*?)> ?\[(/{1,3}|/-)\]')
         clean = retracing_regex1.sub(r'\1', utterance)
-        # one scoped word
-        retracing_regex2 = re.compile(r'(\S+) ?\[(/{1,3}|/-)\]')
         return retracing_regex2.sub(r'\1', clean)
 
     @classmethod
@@ -122,6 +124,5 @@ class ActualTargetUtteranceExtractor:
         correcting part can be of variable length.
         """
         # single-word correction
-        retracing_regex = re.compile(r'([^>\s]+) ?\[//\] (\S+)')
-        utterance = retracing_regex.sub(r'\2 \2', utterance)
+        utterance = retracing_target_regex.sub(r'\2 \2', utterance)
         return cls.get_retracing_actual(utterance)
@@ -1,8 +1,20 @@
+import io
+import itertools
 import re
 
 from acqdiv.parsers.chat.model.chat import CHAT
 from acqdiv.parsers.chat.model.participant import Participant
 from acqdiv.parsers.chat.model.record import Record
+from acqdiv.util.profiler import profiler
+
+metadata_regex = re.compile(r'@.*?:\t')
+participants_regex = re.compile(r'\s*,\s*')
+whitespace_regex = re.compile(r'\s+')
+rec_start_regex = re.compile(r'\*[A-Za-z0-9]{2,3}:\t')
+main_line_regex = re.compile(r'^\*.*')
+main_line_fields_regex = re.compile(
+    r'\*([A-Za-z0-9]{2,3}):\t(.*?)(\s*\D?(\d+)(_(\d+))?\D?$|$)')
+dependent_tier_regex = re.compile(r'(?<=\n)%.*')
 
 
 class CHATFileParser:
@@ -12,6 +24,12 @@ class CHATFileParser:
     def parse(cls, session_file):
         """Get a CHAT instance from a CHAT file.
 
+        The file is read in a single pass. The headers are read right away
+        while the records are read lazily as `CHAT.records` is iterated, so
+        the file must stay open until then. As the headers are read before
+        any record, metadata fields after the first main line are ignored,
+        see `iter_metadata_fields`.
+
         Args:
             session_file (file/file-like object): A CHAT file.
 
@@ -19,19 +37,86 @@ class CHATFileParser:
             CHAT: The CHAT instance.
         """
         chat = CHAT()
-        session = session_file.read()
-        cls.add_headers(chat, session)
-        cls.add_records(chat, session)
+        lines = profiler.iter_stage('read', cls.iter_lines(session_file))
+
+        with profiler.stage('split'):
+            header_lines, lines = cls.split_header(lines)
+            cls.add_headers(chat, header_lines)
+
+        chat.records = profiler.iter_stage(
+            'split', cls.iter_parsed_records(
+                itertools.chain(header_lines, lines)))
 
         return chat
 
+    @staticmethod
+    def iter_lines(session_file):
+        """Iter the lines of a session file.
+
+        CHAT inserts a line break and a tab when a tier or field becomes too
+        long. Such continuation lines are joined to the previous line by a
+        blank space.
+
+        Args:
+            session_file (file/file-like object): A CHAT file.
+
+        Yields:
+            str: The next line without the line break.
+        """
+        line = None
+        for next_line in session_file:
+            if next_line.endswith('\n'):
+                next_line = next_line[:-1]
+
+            if line is not None and next_line.startswith('\t'):
+                line += ' ' + next_line[1:]
+            else:
+                if line is not None:
+                    yield line
+                line = next_line
+
+        if line is not None:
+            yield line
+
+    @staticmethod
+    def split_header(lines):
+        """Split the lines up to the first main line from the others.
+
+        The first main line is part of the header lines as it ends the
+        metadata section, see `iter_metadata_fields`.
+
+        Args:
+            lines (Iterator[str]): The lines of the session.
+
+        Returns:
+            Tuple[List[str], Iterator[str]]: The header lines and the
+            remaining lines after the first main line.
+        """
+        header_lines = []
+        for line in lines:
+            header_lines.append(line)
+
+            if line.startswith('*'):
+                break
+
+        return header_lines, lines
+
+    @classmethod
+    def _iter_lines(cls, session):
+        """Iter the lines of a session string or the given lines."""
+        if isinstance(session, str):
+            return cls.iter_lines(io.StringIO(session))
+
+        return session
+
     @classmethod
     def add_headers(cls, chat, session):
         """Add all headers to the CHAT instance.
 
         Args:
             chat (CHAT): The CHAT instance.
-            session (str): The CHAT file as a string.
+            session (str/Iterable[str]): The CHAT file as a string or
+                its header lines.
         """
         for metadata_field in cls.iter_metadata_fields(session):
             key, content = cls.get_metadata_field(metadata_field)
@@ -76,15 +161,17 @@ class CHATFileParser:
                     setattr(chat, key.lower(), content)
 
     @classmethod
-    def add_records(cls, chat, session):
-        """Add the records to the CHAT instance.
+    def iter_parsed_records(cls, session):
+        """Iter the records as Record instances.
 
         Args:
-            chat (CHAT): The CHAT instance.
-            session (str): The CHAT file as a string.
+            session (str/Iterable[str]): The CHAT file as a string or its
+                lines.
+
+        Yields:
+            Record: The next record.
         """
-        uid = 0
-        for rec_str in cls.iter_records(session):
+        for uid, rec_str in enumerate(cls.iter_records(session)):
             rec = Record()
             rec.uid = uid
             main_line = cls.get_mainline(rec_str)
@@ -98,23 +185,7 @@ class CHATFileParser:
                 key, content = cls.get_dependent_tier(dependent_tier)
                 rec.dependent_tiers[key] = content
 
-            chat.records.append(rec)
-            uid += 1
-
-    @staticmethod
-    def _replace_line_breaks(session):
-        """Remove line breaks within record tiers or metadata fields.
-
-        CHAT inserts a line break and a tab when a tier or field becomes too
-        long. The line breaks are replaced by a blank space.
-
-        Args:
-            session (str): The session.
-
-        Returns:
-            str:  The session without line breaks in tiers and fields.
-        """
-        return session.replace('\n\t', ' ')
+            yield rec
 
     # ---------- metadata ----------
 
@@ -124,18 +195,21 @@ class CHATFileParser:
 
         Metadata fields start with @ followed by the key, colon, tab and its
         content. Line breaks within a field are automatically removed and
-        replaced by a blank space.
+        replaced by a blank space. The metadata section ends with the first
+        main line, later fields such as the @Date of a new episode are
+        ignored.
 
         Args:
-            session (str): The session.
+            session (str/Iterable[str]): The session as a string or its
+                lines.
 
         Yields:
             str: The next metadata field.
         """
-        metadata_regex = re.compile(r'@.*?:\t')
-        session = cls._replace_line_breaks(session)
-        for match in re.finditer(r'[^\n]+', session):
-            line = match.group()
+        for line in cls._iter_lines(session):
+            if not line:
+                continue
+
             if metadata_regex.search(line):
                 yield line
 
@@ -213,7 +287,6 @@ class CHATFileParser:
         Yields:
             str: The next participant.
         """
-        participants_regex = re.compile(r'\s*,\s*')
         for participant in participants_regex.split(participants):
             yield participant
 
@@ -235,7 +308,7 @@ class CHATFileParser:
         Returns:
             tuple: (label, name, role).
         """
-        fields = re.split(r'\s+', participant)
+        fields = whitespace_regex.split(participant)
         # name and role is missing
         if len(fields) == 1:
             return fields[0], '', ''
@@ -321,20 +394,33 @@ class CHATFileParser:
     def iter_records(cls, session):
         """Yield a record of the session.
 
-        A record starts with '*speaker_label:\t' in CHAT. Line breaks within
-        the main line and dependent tiers are automatically removed and
-        replaced by a blank space.
+        A record starts with '*speaker_label:\t' in CHAT and ends before the
+        next line starting with '*' or '@End'. Line breaks within the main
+        line and dependent tiers are automatically removed and replaced by a
+        blank space. A record that is not terminated is ignored.
+
+        Args:
+            session (str/Iterable[str]): The session as a string or its
+                lines.
 
         Yields:
             str: The next record.
         """
-        session = cls._replace_line_breaks(session)
-        rec_regex = re.compile(r'\*[A-Za-z0-9]{2,3}:\t.*?(?=\n\*|\n@End)',
-                               flags=re.DOTALL)
-        # iter all records
-        for match in rec_regex.finditer(session):
-            rec = match.group()
-            yield rec
+        rec_lines = None
+        for line in cls._iter_lines(session):
+            if line.startswith('*') or line.startswith('@End'):
+                if rec_lines is not None:
+                    yield '\n'.join(rec_lines)
+                    rec_lines = None
+
+            elif rec_lines is not None:
+                rec_lines.append(line)
+                continue
+
+            # a record may also start within a line, e.g. after a file name
+            match = rec_start_regex.search(line)
+            if match:
+                rec_lines = [line[match.start():]]
 
     # ---------- Main line ----------
 
@@ -348,7 +434,6 @@ class CHATFileParser:
         Returns:
             str: The main line.
         """
-        main_line_regex = re.compile(r'^\*.*')
         return main_line_regex.search(rec).group()
 
     @staticmethod
@@ -364,9 +449,7 @@ class CHATFileParser:
         Returns:
             tuple: (speaker ID, utterance, start time, end time).
         """
-        main_line_regex = re.compile(
-            r'\*([A-Za-z0-9]{2,3}):\t(.*?)(\s*\D?(\d+)(_(\d+))?\D?$|$)')
-        match = main_line_regex.search(main_line)
+        match = main_line_fields_regex.search(main_line)
         label = match.group(1)
         utterance = match.group(2)
 
@@ -412,7 +495,6 @@ class CHATFileParser:
         Yields:
             str: The next dependent tier.
         """
-        dependent_tier_regex = re.compile(r'(?<=\n)%.*')
         for dependent_tier in dependent_tier_regex.finditer(rec):
             yield dependent_tier.group()
 
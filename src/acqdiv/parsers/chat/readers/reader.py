@@ -6,6 +6,8 @@ from acqdiv.parsers.chat.readers.actual_target_utterance \
 from acqdiv.parsers.chat.readers.sentence_type \
     import SentenceTypeExtractor
 
+whitespace_regex = re.compile(r'\s+')
+
 
 class CHATReader:
     """Methods for reading CHAT files."""
@@ -269,7 +271,7 @@ class CHATReader:
             list: The words.
         """
         if utterance:
-            return re.split(r'\s+', utterance)
+            return whitespace_regex.split(utterance)
         else:
             return []
 
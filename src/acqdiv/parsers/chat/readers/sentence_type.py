@@ -1,5 +1,7 @@
 import re
 
+terminator_regex = re.compile(r'([+/.!?"]*[!?.])(?=(\s*\[\+|\s*$))')
+
 
 class SentenceTypeExtractor:
     """Methods for inferring the sentence type of a CHAT utterance."""
@@ -20,7 +22,6 @@ class SentenceTypeExtractor:
 
     @staticmethod
     def get_utterance_terminator(utterance):
-        terminator_regex = re.compile(r'([+/.!?"]*[!?.])(?=(\s*\[\+|\s*$))')
         match = terminator_regex.search(utterance)
         if match:
             return match.group(1)
@@ -7,8 +7,11 @@ from acqdiv.parsers.corpora.main.chintang.session_parser \
 
 class ChintangCorpusParser(CorpusParser):
 
-    def get_session_parser(self, session_path):
+    def get_metadata_path(self, session_path):
         metadata_filename = Path(session_path).with_suffix('.imdi').name
-        metadata_filepath = Path(self.cfg['metadata_dir']) / metadata_filename
+        return str(Path(self.cfg['metadata_dir']) / metadata_filename)
+
+    def get_session_parser(self, session_path):
+        metadata_filepath = self.get_metadata_path(session_path)
 
-        return ChintangSessionParser(session_path, str(metadata_filepath))
+        return ChintangSessionParser(session_path, metadata_filepath)
@@ -25,7 +25,5 @@ class ChintangSessionParser(ToolboxParser):
     def get_cleaner(self):
         return ChintangCleaner()
 
-    def parse(self):
-        session = super().parse()
+    def clean_speakers(self, session):
         tc_cleaner.clean(session)
-        return session
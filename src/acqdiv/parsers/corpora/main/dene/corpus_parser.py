@@ -5,11 +5,14 @@ from acqdiv.parsers.corpora.main.dene.session_parser \
 
 class DeneCorpusParser(CorpusParser):
 
-    def get_session_parser(self, session_path):
+    def get_metadata_path(self, session_path):
         temp = session_path.replace(
             self.cfg['paths']['sessions_dir'],
             self.cfg['paths']['metadata_dir'])
 
-        metadata_path = temp.replace('.tbt', '.imdi')
+        return temp.replace('.tbt', '.imdi')
+
+    def get_session_parser(self, session_path):
+        metadata_path = self.get_metadata_path(session_path)
 
         return DeneSessionParser(session_path, metadata_path)
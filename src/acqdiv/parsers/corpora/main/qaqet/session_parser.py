@@ -17,7 +17,7 @@ class QaqetSessionParser(ToolboxParser):
         return QaqetCleaner()
 
     def add_words(self, actual_utterance, target_utterance):
-        utt = self.session.utterances[-1]
+        utt = self.utterance
 
         actual_words = self.record_reader.get_words(actual_utterance)
         target_words = self.record_reader.get_words(target_utterance)
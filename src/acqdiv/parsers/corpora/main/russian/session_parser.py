@@ -26,10 +26,8 @@ class RussianSessionParser(ToolboxParser):
     def get_cleaner(self):
         return RussianCleaner()
 
-    def parse(self):
-        session = super().parse()
+    def clean_speakers(self, session):
         tc_cleaner.clean(session)
-        return session
 
     def add_speakers(self):
         for speaker_dict in self.metadata_reader.metadata['participants']:
@@ -62,7 +60,7 @@ class RussianSessionParser(ToolboxParser):
         self.delete_morphemes()
 
     def delete_morphemes(self):
-        utt = self.session.utterances[-1]
+        utt = self.utterance
         utt.morpheme_raw = ''
         utt.gloss_raw = ''
         utt.pos_raw = ''
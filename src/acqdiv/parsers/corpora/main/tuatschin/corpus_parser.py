@@ -7,12 +7,15 @@ from acqdiv.parsers.corpora.main.tuatschin.session_parser \
 
 class TuatschinCorpusParser(CorpusParser):
 
-    def get_session_parser(self, session_path):
+    def get_metadata_path(self, session_path):
         metadata_filename = Path(session_path).with_suffix('.imdi').name
-        metadata_filepath = Path(self.cfg['metadata_dir']) / metadata_filename
+        return str(Path(self.cfg['metadata_dir']) / metadata_filename)
+
+    def get_session_parser(self, session_path):
+        metadata_filepath = self.get_metadata_path(session_path)
 
         # TODO: remove this check once we have all the metadata
-        if metadata_filepath.is_file():
-            return TuatschinSessionParser(session_path, str(metadata_filepath))
+        if Path(metadata_filepath).is_file():
+            return TuatschinSessionParser(session_path, metadata_filepath)
 
         return None
@@ -22,7 +22,7 @@ class TuatschinSessionParser(ToolboxParser):
         self.delete_morphemes()
 
     def delete_morphemes(self):
-        utt = self.session.utterances[-1]
+        utt = self.utterance
         utt.morpheme_raw = ''
         utt.gloss_raw = ''
         utt.pos_raw = ''
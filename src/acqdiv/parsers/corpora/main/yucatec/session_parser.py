@@ -22,7 +22,5 @@ class YucatecSessionParser(CHATParser):
     def get_cleaner():
         return YucatecCleaner()
 
-    def parse(self):
-        session = super().parse()
+    def clean_speakers(self, session):
         tc_cleaner.clean(session)
-        return session
@@ -1,12 +1,18 @@
 """Abstract class for corpus parsing."""
 
 import glob
+import itertools
 import os
 from abc import ABC, abstractmethod
 
 from tqdm import tqdm
 
 from acqdiv.model.corpus import Corpus
+from acqdiv.util.fingerprint import get_code_fingerprint
+from acqdiv.util.memoization import add_worker_counts, call_counting_caches
+from acqdiv.util.parallel import get_executor, iter_ordered
+from acqdiv.util.profiler import profiler
+from acqdiv.util.session_cache import SessionCache
 from acqdiv.util.uniquespeaker import set_unique_speakers
 from acqdiv.util.session_duration import extract_duration
 
@@ -14,20 +20,37 @@ from acqdiv.util.session_duration import extract_duration
 class CorpusParser(ABC):
     """Methods for constructing a corpus instance."""
 
-    def __init__(self, cfg, disable_pbar=False):
+    def __init__(self, cfg, disable_pbar=False, jobs=1, cache_dir=None,
+                 stream=False):
         """Initialize config.
 
         Args:
             cfg (dict): Corpus configuration data.
             disable_pbar (bool): Whether the progressbar should be disabled.
+            jobs (int): Number of worker processes parsing the sessions.
+            cache_dir (str): Where parsed sessions are cached. No caching if
+                not specified.
+            stream (bool): Whether the utterances of the sessions are parsed
+                lazily while they are consumed. Only applies to sessions
+                parsed in this process that are not cached, as the others
+                have to be complete to be pickled.
         """
         self.cfg = cfg
         self.disable_pbar = disable_pbar
+        self.jobs = jobs
+        self.cache_dir = cache_dir
+        self.stream = stream
+        self.cache = SessionCache(cache_dir) if cache_dir else None
         tqdm.monitor_interval = 0
         self.corpus = Corpus()
 
-    def parse(self):
-        """Get a Corpus instance."""
+    def parse(self, session_paths=None):
+        """Get a Corpus instance.
+
+        Args:
+            session_paths (List[str]): Only parse these session files
+                instead of all session files of the corpus.
+        """
         corpus = self.corpus
         corpus.iso_639_3 = self.cfg['iso639-3']
         corpus.glottolog_code = self.cfg['glottolog_code']
@@ -36,7 +59,7 @@ class CorpusParser(ABC):
         corpus.owner = self.cfg['owner']
         corpus.acronym = self.cfg['acronym']
         corpus.name = self.cfg['name']
-        corpus.sessions = self.iter_sessions()
+        corpus.sessions = self.iter_sessions(session_paths)
         corpus.license = self.cfg['license']
         corpus.format = self.cfg['format']
 
@@ -51,36 +74,225 @@ class CorpusParser(ABC):
         """
         pass
 
-    def iter_sessions(self):
+    def get_metadata_path(self, session_path):
+        """Get the path to the metadata file of a session.
+
+        Returns:
+            Optional[str]: The path or None if the metadata is contained in
+            the session file.
+        """
+        return None
+
+    def get_source_paths(self, session_path):
+        """Get the paths to the files a session is parsed from.
+
+        Args:
+            session_path (str): Path to the session file.
+
+        Returns:
+            List[str]: The session file and its metadata file if any.
+        """
+        source_paths = [session_path]
+
+        metadata_path = self.get_metadata_path(session_path)
+        if metadata_path is not None:
+            source_paths.append(metadata_path)
+
+        return source_paths
+
+    def get_cache_key(self, session_path):
+        """Get the key of a session in the session cache.
+
+        Args:
+            session_path (str): Path to the session file.
+
+        Returns:
+            str: The cache key.
+        """
+        return self.cache.get_key(
+            self.get_source_paths(session_path),
+            get_code_fingerprint(type(self)), self.cfg['corpus'])
+
+    def parse_session(self, session_path):
+        """Parse a session.
+
+        The session is read from the session cache if possible.
+
+        Unique speakers are not set here as they are shared across the
+        sessions of a corpus.
+
+        Args:
+            session_path (str): Path to the session file.
+
+        Returns:
+            Optional[acqdiv.model.session.Session]: The session or None if
+            there is no session parser for this file.
+        """
+        profiler.set_session(self.cfg['corpus'], session_path)
+
+        if self.cache is None:
+            session = self.parse_session_file(session_path, self.stream)
+        else:
+            key = self.get_cache_key(session_path)
+            with profiler.stage('cache'):
+                session = self.cache.get(key)
+
+            if session is None:
+                session = self.parse_session_file(session_path)
+
+                if session is not None:
+                    with profiler.stage('cache'):
+                        self.cache.put(key, session)
+
+        if session is not None:
+            session.path = session_path
+
+        return session
+
+    def parse_session_file(self, session_path, stream=False):
+        """Parse a session from its source files.
+
+        Args:
+            session_path (str): Path to the session file.
+            stream (bool): Whether the utterances are parsed lazily.
+
+        Returns:
+            Optional[acqdiv.model.session.Session]: The session or None if
+            there is no session parser for this file.
+        """
+        with profiler.stage('parse'):
+            session_parser = self.get_session_parser(session_path)
+
+            if session_parser is None:
+                return None
+
+            session = session_parser.parse(stream=stream)
+
+        if not isinstance(session.utterances, list):
+            session.utterances = profiler.iter_stage(
+                'parse', session.utterances)
+
+        # add duration
+        session.duration = extract_duration(self.cfg['corpus'],
+                                            session.source_id)
+
+        return session
+
+    def iter_parsed_sessions(self, session_paths):
+        """Parse the sessions in the order of the paths.
+
+        If more than one job is configured, the sessions are parsed in
+        spawned worker processes. Module and class state such as the role
+        mappings of `RoleMapper` is thus built from scratch in every worker,
+        while the unique speakers are set by the calling process in
+        `iter_sessions` so that they are shared across all sessions. The
+        cache statistics of the workers are added to those of the calling
+        process.
+
+        Args:
+            session_paths (List[str]): Paths to the session files.
+
+        Yields:
+            Optional[acqdiv.model.session.Session]: The next session.
+        """
+        if self.jobs > 1:
+            with get_executor(self.jobs) as executor:
+                args = ((parse_session, type(self), self.cfg, session_path,
+                         self.cache_dir)
+                        for session_path in session_paths)
+                results = iter_ordered(
+                    executor, call_counting_caches, args,
+                    prefetch=2 * self.jobs)
+
+                for session, counts in results:
+                    add_worker_counts(counts)
+                    yield session
+        else:
+            for session_path in session_paths:
+                yield self.parse_session(session_path)
+
+    def get_session_paths(self):
+        """Get the paths to the session files of the corpus.
+
+        Returns:
+            List[str]: The sorted paths.
+        """
+        return sorted(glob.glob(self.cfg['sessions']))
+
+    def iter_sessions(self, session_paths=None):
         """Iter the sessions of the corpus.
 
+        Args:
+            session_paths (List[str]): Only iter the sessions of these files.
+
         Yields:
-            acqdiv.parsers.SessionParser: The session parser.
+            acqdiv.model.session.Session: The session.
         """
-        session_paths = sorted(glob.glob(self.cfg['sessions']))
+        if session_paths is None:
+            session_paths = self.get_session_paths()
+
         print('Reading sessions from:', os.path.abspath(self.cfg['sessions']))
 
+        sessions = self.iter_parsed_sessions(session_paths)
+
         with tqdm(session_paths, disable=self.disable_pbar) as pbar:
 
-            for session_path in pbar:
+            for session_path, session in zip(pbar, sessions):
                 pbar.set_description(session_path)
 
-                session_parser = self.get_session_parser(session_path)
-
-                if session_parser is not None:
-
-                    session = session_parser.parse()
+                if session is not None:
 
                     # set unique speakers
                     set_unique_speakers(self.corpus.corpus, session.speakers)
 
-                    # add duration
-                    session.duration = extract_duration(self.corpus.corpus,
-                                                        session.source_id)
-
                     # ignore sessions with no utterances
-                    if len(session.utterances):
+                    if self.has_utterances(session):
                         if self.disable_pbar:
                             print("\t", session_path)
 
                         yield session
+
+        if self.cache is not None:
+            self.cache.prune()
+
+    @staticmethod
+    def has_utterances(session):
+        """Check whether a session has any utterances.
+
+        If the utterances are streamed, the first one is parsed and put
+        back in front of the others.
+
+        Args:
+            session (acqdiv.model.session.Session): The session.
+
+        Returns:
+            bool: Whether there are utterances.
+        """
+        if isinstance(session.utterances, list):
+            return bool(session.utterances)
+
+        try:
+            first = next(session.utterances)
+        except StopIteration:
+            return False
+
+        session.utterances = itertools.chain([first], session.utterances)
+
+        return True
+
+
+def parse_session(corpus_parser_class, cfg, session_path, cache_dir=None):
+    """Parse a session in a worker process.
+
+    Args:
+        corpus_parser_class (type): The corpus parser class.
+        cfg (dict): Corpus configuration data.
+        session_path (str): Path to the session file.
+        cache_dir (str): Where parsed sessions are cached.
+
+    Returns:
+        Optional[acqdiv.model.session.Session]: The session.
+    """
+    corpus_parser = corpus_parser_class(
+        cfg, disable_pbar=True, cache_dir=cache_dir)
+    return corpus_parser.parse_session(session_path)
@@ -6,10 +6,67 @@ from abc import ABC, abstractmethod
 class SessionParser(ABC):
 
     @abstractmethod
-    def parse(self):
+    def parse(self, stream=False):
         """Return an instance of a Session.
 
+        Args:
+            stream (bool): Whether the utterances are parsed lazily. If so,
+                the utterances of the session are an iterator parsing one
+                utterance after the other instead of a list, so that only
+                the current utterance is held in memory.
+
         Returns:
             acqdiv.model.session.Session: The Session instance.
         """
         pass
+
+    def clean_speakers(self, session):
+        """Correct the speakers once all of them are added.
+
+        Called before any utterance is parsed. The child-directedness of the
+        utterances is still inferred from the target children before the
+        correction, see `index_target_children`.
+
+        Args:
+            session (acqdiv.model.session.Session): The session.
+        """
+
+    def index_target_children(self, speakers):
+        """Remember the target children before the speakers are cleaned.
+
+        Utterances addressed to a target child that `clean_speakers` demotes
+        are still child-directed.
+
+        Args:
+            speakers (List[acqdiv.model.speaker.Speaker]): The speakers.
+        """
+        self.target_children = {
+            speaker for speaker in speakers
+            if speaker.macro_role == 'Target_Child'}
+
+    def index_speakers(self, speakers):
+        """Index the speakers of the session by their label.
+
+        Has to be called again whenever speakers are added or their labels
+        are changed. If several speakers share a label, the first one is
+        indexed.
+
+        Args:
+            speakers (List[acqdiv.model.speaker.Speaker]): The speakers.
+        """
+        self.speaker_index = {}
+
+        for speaker in speakers:
+            self.speaker_index.setdefault(speaker.code, speaker)
+
+    def get_speaker(self, label):
+        """Get the speaker by label.
+
+        Args:
+            label (str): The speaker label.
+
+        Returns:
+            Optional[acqdiv.model.speaker.Speaker]: The speaker or None if
+            there is no speaker with this label.
+        """
+        return self.speaker_index.get(label)
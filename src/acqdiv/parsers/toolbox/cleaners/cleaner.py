@@ -2,17 +2,27 @@ import re
 
 from acqdiv.parsers.toolbox.cleaners.morpheme_cleaner \
     import ToolboxMorphemeCleaner
+from acqdiv.util.memoization import MemoizedClassMethods
 from acqdiv.util.timestamp import unify_timestamp
 
 
-class ToolboxCleaner:
+class ToolboxCleaner(MemoizedClassMethods):
+    """Default cleaner for Toolbox corpora.
+
+    The per-token cleaning methods are memoized as the same words and
+    morphemes recur throughout a corpus. Cleaners whose results depend on
+    anything but the token have to set `memoize` to False.
+    """
+
+    memoized_methods = (
+        'clean_word', 'clean_seg', 'clean_gloss_raw', 'clean_gloss',
+        'clean_pos_raw', 'clean_pos', 'clean_pos_ud', 'clean_lang',
+        'clean_id')
 
     @staticmethod
     def remove_redundant_whitespaces(string):
         """Remove redundant whitespaces."""
-        string = re.sub(r'\s+', ' ', string)
-        string = string.strip()
-        return string
+        return ' '.join(string.split())
 
     @staticmethod
     def cross_clean(rec_dict):
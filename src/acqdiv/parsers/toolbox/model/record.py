@@ -1,15 +1,84 @@
+from acqdiv.parsers.toolbox.cleaners.cleaner import ToolboxCleaner
 
 
 class Record:
+    """A Toolbox record.
 
-    def __init__(self):
-        self.tiers = {}
+    The tiers read from a file are kept as the offsets of their content in
+    its bytes and only decoded and cleaned when first accessed.
+    """
+
+    __slots__ = ('tiers', 'data')
+
+    def __init__(self, tiers=None, data=b''):
+        """Initialize the tiers.
+
+        Args:
+            tiers (dict): The content of the tiers by field marker. The
+                content not decoded yet is given as its start and end in
+                `data`.
+            data (bytes/mmap.mmap): The bytes of the Toolbox file.
+        """
+        self.tiers = {} if tiers is None else tiers
+        self.data = data
+
+    @staticmethod
+    def decode_tier(data, start, end):
+        """Get the clean content of a tier.
+
+        Args:
+            data (bytes/mmap.mmap): The bytes of the Toolbox file.
+            start (int): The start of the content.
+            end (int): The end of the content.
+
+        Returns:
+            str: The content without redundant whitespaces.
+        """
+        return ToolboxCleaner.remove_redundant_whitespaces(
+            data[start:end].decode())
 
     def get(self, field, not_exists=''):
-        return self.tiers.get(field, not_exists)
+        content = self.tiers.get(field, not_exists)
+
+        if isinstance(content, tuple):
+            content = self.decode_tier(self.data, *content)
+            self.tiers[field] = content
+
+        return content
+
+    def startswith(self, prefix):
+        """Check whether the content of any tier starts with a prefix.
+
+        The tiers not decoded yet are checked in their bytes, except if they
+        start with a non-ASCII character which might be a whitespace.
+
+        Args:
+            prefix (str): The ASCII prefix without whitespaces.
+
+        Returns:
+            bool: Whether any tier starts with the prefix.
+        """
+        encoded = prefix.encode()
+
+        for content in self.tiers.values():
+            if isinstance(content, tuple):
+                start, end = content
+                first = self.data[start:start + 1]
+
+                if first and first < b'\x80':
+                    if self.data[start:start + len(encoded)] == encoded:
+                        return True
+                    continue
+
+                content = self.decode_tier(self.data, start, end)
+
+            if content.startswith(prefix):
+                return True
+
+        return False
 
     def __getitem__(self, field):
-        return self.tiers.get(field, '')
+        return self.get(field)
 
     def __setitem__(self, key, value):
         self.tiers[key] = value
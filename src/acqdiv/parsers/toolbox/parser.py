@@ -9,6 +9,7 @@ from acqdiv.parsers.toolbox.readers.age_updater import ToolboxAgeUpdater
 from acqdiv.util.role import RoleMapper
 from acqdiv.util.alignment import fix_misalignments, align_words_morphemes
 from acqdiv.util.childdirectedness import infer_childdirected
+from acqdiv.util.profiler import profiler
 
 from acqdiv.model.session import Session
 from acqdiv.model.speaker import Speaker
@@ -44,26 +45,40 @@ class ToolboxParser(SessionParser):
             metadata_path (str): Path to the metadata file.
         """
         self.session = Session()
+        # the utterance of the current record
+        self.utterance = None
 
         self.metadata_path = metadata_path
         self.toolbox_path = toolbox_path
 
         # get record reader
-        self.record_reader = self.get_record_reader()
+        self.record_reader = profiler.wrap(
+            'reader', self.get_record_reader())
         # get metadata reader
-        self.metadata_reader = self.get_metadata_reader()
+        with profiler.stage('reader'):
+            self.metadata_reader = profiler.wrap(
+                'reader', self.get_metadata_reader())
         # get cleaner
-        self.cleaner = self.get_cleaner()
+        self.cleaner = profiler.wrap('cleaner', self.get_cleaner())
 
-    def parse(self):
+    def parse(self, stream=False):
         """Get the session instance.
 
+        Args:
+            stream (bool): Whether the utterances are parsed lazily, see
+                `iter_utterances`.
+
         Returns:
             acqdiv.model.session.Session: The Session instance.
         """
         self.add_session_metadata()
         self.add_speakers()
-        self.add_records()
+        self.index_target_children(self.session.speakers)
+        self.clean_speakers(self.session)
+        self.index_speakers(self.session.speakers)
+
+        utterances = self.iter_utterances()
+        self.session.utterances = utterances if stream else list(utterances)
 
         return self.session
 
@@ -114,17 +129,27 @@ class ToolboxParser(SessionParser):
 
             self.session.speakers.append(speaker)
 
-    def add_records(self):
-        """Add the utterances to the session."""
+    def iter_utterances(self):
+        """Parse the utterances one after the other.
+
+        The records are read from the Toolbox file while iterating. The file
+        is closed once all of them are read.
+
+        Yields:
+            acqdiv.model.utterance.Utterance: The next utterance.
+        """
         separator = self.record_reader.get_rec_separator()
-        toolbox_file = ToolboxFileParser.parse(self.toolbox_path, separator)
+        records = ToolboxFileParser.iter_parsed_records(
+            self.toolbox_path, separator)
 
-        for rec in toolbox_file.records:
+        for rec in records:
             if self.record_reader.is_record(rec):
                 self.add_record(rec)
 
+                yield self.utterance
+
     def add_record(self, rec):
-        """Add the utterance to the session."""
+        """Parse the utterance of the record."""
         rec = self.cleaner.cross_clean(rec)
 
         utt = self.add_utterance(rec)
@@ -145,34 +170,24 @@ class ToolboxParser(SessionParser):
 
         align_words_morphemes(utt)
 
-    @staticmethod
-    def _get_speaker(label, speakers):
-        for speaker in speakers:
-            if speaker.code == label:
-                return speaker
-
-        return None
-
     def add_utterance(self, rec):
-        """Add the utterance to the Session instance.
+        """Set the utterance of the record as the current utterance.
 
         Args:
             rec (acqdiv.parsers.toolbox.model.record.Record): The record.
         """
         utt = Utterance()
-        self.session.utterances.append(utt)
+        self.utterance = utt
 
         speaker_label = self.record_reader.get_speaker_label(rec)
-        utt.speaker = self._get_speaker(
-            speaker_label, self.session.speakers)
+        utt.speaker = self.get_speaker(speaker_label)
         addressee_label = self.record_reader.get_addressee(rec)
-        utt.addressee = self._get_speaker(
-            addressee_label, self.session.speakers)
+        utt.addressee = self.get_speaker(addressee_label)
         utt.utterance_raw = self.record_reader.get_actual_utterance(rec)
         utt.utterance = self.cleaner.clean_utterance(utt.utterance_raw)
         utt.sentence_type = self.record_reader.get_sentence_type(rec)
         utt.childdirected = self.record_reader.get_childdirected(rec)
-        utt.childdirected = infer_childdirected(utt)
+        utt.childdirected = infer_childdirected(utt, self.target_children)
         utt.source_id = self.record_reader.get_source_id(rec)
         utt.start_raw = self.record_reader.get_start_raw(rec)
         utt.start = self.cleaner.clean_timestamp(utt.start_raw)
@@ -194,7 +209,7 @@ class ToolboxParser(SessionParser):
             target_utterance (str): The clean target utterance.
         """
         words = self.record_reader.get_words(actual_utterance)
-        utterance = self.session.utterances[-1]
+        utterance = self.utterance
 
         for word in words:
             w = Word()
@@ -231,7 +246,7 @@ class ToolboxParser(SessionParser):
             wglosses, wsegs, wposes, wlangs, wids = fix_misalignments(
                 [wglosses, wsegs, wposes, wlangs, wids])
 
-        utt = self.session.utterances[-1]
+        utt = self.utterance
 
         # go through all morpheme words
         for wseg, wgloss, wpos, wlang, wid in zip(
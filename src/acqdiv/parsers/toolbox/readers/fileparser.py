@@ -1,10 +1,11 @@
+import os
 import re
 import mmap
 import contextlib
 
-from acqdiv.parsers.toolbox.cleaners.cleaner import ToolboxCleaner
 from acqdiv.parsers.toolbox.model.toolbox import ToolboxFile
 from acqdiv.parsers.toolbox.model.record import Record
+from acqdiv.util.profiler import profiler
 
 @contextlib.contextmanager
 def memorymapped(path, access=mmap.ACCESS_READ):
@@ -23,12 +24,26 @@ def memorymapped(path, access=mmap.ACCESS_READ):
 
 
 class ToolboxFileParser:
-    """Methods for creating a ToolboxFile instance."""
+    """Methods for creating a ToolboxFile instance.
+
+    The records and tiers are found as offsets in the bytes of the file and
+    only the content of the tiers accessed is decoded.
+    """
+
+    # a line of a record: the field marker, whitespace and the content
+    tier_regex = re.compile(rb'(\S*)[^\S\n]*([^\n]*)')
+    tiers_regex = re.compile(rb'^' + tier_regex.pattern, re.MULTILINE)
+    # bytes of characters that might be whitespaces only as str
+    non_ascii_regex = re.compile(rb'[\x1c-\x1f\x80-\xff]')
+    unicode_tier_regex = re.compile(r'(\S*)\s*(.*)')
 
     @classmethod
     def parse(cls, path, separator):
         """Get a ToolboxFile instance.
 
+        All records are kept in memory, see `iter_parsed_records` for
+        reading one record after the other.
+
         Args:
             path (str): Path to Toolbox file.
             separator (str): Field that marks beginning of a record.
@@ -39,15 +54,56 @@ class ToolboxFileParser:
         """
         toolbox = ToolboxFile()
 
+        # the records decode their tiers from the bytes when accessed
         with open(path, 'rb') as f:
-            for record in cls.iter_records(f, separator):
-                rec_dict = cls.get_record_dict(record)
-                rec = Record()
-                rec.tiers = rec_dict
-                toolbox.records.append(rec)
+            data = f.read()
+
+        toolbox.records.extend(cls.iter_buffer_records(data, separator))
 
         return toolbox
 
+    @classmethod
+    def iter_parsed_records(cls, path, separator):
+        """Iter the records of a Toolbox file.
+
+        The file is memory-mapped and only the current record is read. As
+        the file is closed once all records are read, the tiers of a record
+        not accessed while iterating cannot be accessed afterwards.
+
+        Args:
+            path (str): Path to Toolbox file.
+            separator (bytes): Field that marks beginning of a record.
+
+        Yields:
+            acqdiv.parsers.toolbox.model.record.Record: The next record.
+        """
+        # empty files cannot be memory-mapped
+        if not os.path.getsize(path):
+            return
+
+        with memorymapped(path) as data:
+            yield from cls.iter_buffer_records(data, separator)
+
+    @classmethod
+    def iter_buffer_records(cls, data, separator):
+        """Iter the records in a buffer.
+
+        Args:
+            data (bytes/mmap.mmap): The content of the toolbox file.
+            separator (bytes): Field that marks beginning of a record.
+
+        Yields:
+            acqdiv.parsers.toolbox.model.record.Record: The next record.
+        """
+        spans = profiler.iter_stage(
+            'read', cls.iter_record_spans(data, separator))
+
+        for start, end in spans:
+            with profiler.stage('split'):
+                rec = cls.get_record(data, start, end)
+
+            yield rec
+
     @classmethod
     def iter_records(cls, toolbox_file, separator):
         """Iter the records of a toolbox file.
@@ -59,20 +115,134 @@ class ToolboxFileParser:
         Yields:
             str: The record.
         """
-        _record_marker = re.compile(separator)
-
         with contextlib.closing(mmap.mmap(toolbox_file.fileno(),
                                           0, access=mmap.ACCESS_READ)) as data:
-            ma = _record_marker.search(data)
+            for start, end in cls.iter_record_spans(data, separator):
+                yield data[start:end].decode()
+
+    @staticmethod
+    def iter_record_spans(data, separator):
+        """Iter the offsets of the records in a buffer.
+
+        Everything before the first record is skipped.
+
+        Args:
+            data (bytes/mmap.mmap): The content of the toolbox file.
+            separator (bytes): Fieldmarker that marks beginning of record.
+
+        Yields:
+            Tuple[int, int]: The start and end of the record.
+        """
+        pos = None
+        for ma in re.finditer(separator, data):
+            if pos is not None:
+                yield pos, ma.start()
             pos = ma.start()
-            for ma in _record_marker.finditer(data, ma.end()):
-                yield data[pos:ma.start()].decode()
-                pos = ma.start()
 
-            if ma is None:
-                raise StopIteration
-            else:
-                yield data[pos:].decode()
+        if pos is not None:
+            yield pos, len(data)
+
+    @classmethod
+    def iter_tier_matches(cls, data, start, end):
+        """Iter the tiers of a record.
+
+        Every line of the record is a tier.
+
+        Args:
+            data (bytes/mmap.mmap): The content of the toolbox file.
+            start (int): The start of the record.
+            end (int): The end of the record.
+
+        Yields:
+            re.Match: The field marker and the content of the tier.
+        """
+        # the first line starts at the separator, the others after a newline
+        ma = cls.tier_regex.match(data, start, end)
+        yield ma
+
+        if ma.end() < end:
+            yield from cls.tiers_regex.finditer(data, ma.end() + 1, end)
+
+    @classmethod
+    def get_tier_span(cls, ma):
+        """Get the field marker and the content offsets of a tier.
+
+        The bytes are only split at ASCII whitespaces. If the field marker
+        contains characters that might be other whitespaces, the tier is
+        split again after decoding it.
+
+        Args:
+            ma (re.Match): The tier, see `iter_tier_matches`.
+
+        Returns:
+            Tuple[str, int, int]: The field marker without the backslashes
+            and the start and end of the content.
+        """
+        field_marker = ma.group(1)
+        start, end = ma.span(2)
+
+        if cls.non_ascii_regex.search(field_marker):
+            tier = ma.group(0).decode()
+            tier_ma = cls.unicode_tier_regex.match(tier)
+            field_marker = tier_ma.group(1).encode()
+            start = ma.start() + len(tier[:tier_ma.start(2)].encode())
+
+        return field_marker.replace(b'\\', b'').decode(), start, end
+
+    @classmethod
+    def iter_tier_spans(cls, data, start, end):
+        """Iter the field markers and content offsets of a record.
+
+        Args:
+            data (bytes/mmap.mmap): The content of the toolbox file.
+            start (int): The start of the record.
+            end (int): The end of the record.
+
+        Yields:
+            Tuple[str, int, int]: The field marker and the start and end of
+            the content.
+        """
+        for ma in cls.iter_tier_matches(data, start, end):
+            yield cls.get_tier_span(ma)
+
+    @classmethod
+    def get_record(cls, data, start, end):
+        """Get the record of a record in a buffer.
+
+        The tiers are only decoded when accessed.
+
+        Args:
+            data (bytes/mmap.mmap): The content of the toolbox file.
+            start (int): The start of the record.
+            end (int): The end of the record.
+
+        Returns:
+            acqdiv.parsers.toolbox.model.record.Record: The record.
+        """
+        tiers = {field_marker: (content_start, content_end)
+                 for field_marker, content_start, content_end
+                 in cls.iter_tier_spans(data, start, end)}
+
+        return Record(tiers, data)
+
+    @classmethod
+    def read_record(cls, data, start, end):
+        """Get the record dictionary of a record in a buffer.
+
+        Args:
+            data (bytes/mmap.mmap): The content of the toolbox file.
+            start (int): The start of the record.
+            end (int): The end of the record.
+
+        Returns:
+            dict: Key and content of tiers.
+        """
+        return {
+            field_marker: Record.decode_tier(
+                data, content_start, content_end)
+            for field_marker, content_start, content_end
+            in cls.iter_tier_spans(data, start, end)
+        }
 
     @classmethod
     def get_record_dict(cls, record):
@@ -86,19 +256,8 @@ class ToolboxFileParser:
         Returns:
             dict: Key and content of tiers.
         """
-        rec_dict = {}
-
-        # iter tiers of the record
-        for tier in cls.get_tiers(record):
-            # get field marker and content of tier
-            field_marker, content = cls.get_tier(tier)
-            # clean the content
-            content = ToolboxCleaner.remove_redundant_whitespaces(content)
-
-            # add content to dictionary
-            rec_dict[field_marker] = content
-
-        return rec_dict
+        data = record.encode()
+        return cls.read_record(data, 0, len(data))
 
     @staticmethod
     def get_tiers(record):
@@ -7,15 +7,12 @@ class ToolboxReader(object):
     # ---------- record ----------
 
     @classmethod
-    def is_record(cls, rec_dict):
-        """Is the record really a record or just metadata?"""
-        for tier in rec_dict:
-            content = rec_dict[tier]
+    def is_record(cls, rec):
+        """Is the record really a record or just metadata?
 
-            if content.startswith('@'):
-                return False
-
-        return True
+        The content of a tier of metadata starts with '@'.
+        """
+        return not rec.startswith('@')
 
     @staticmethod
     def get_rec_separator():
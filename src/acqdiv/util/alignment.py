@@ -1,5 +1,9 @@
 
 
+from acqdiv.util.profiler import profiler
+
+
+@profiler.timed('alignment')
 def align_words_morphemes(utt):
     """Align words and morphemes of an utterance.
 
@@ -19,6 +23,7 @@ def align_words_morphemes(utt):
                     utt.words[i].pos_ud = morpheme.pos_ud
 
 
+@profiler.timed('alignment')
 def fix_misalignments(entities):
     """Fix misalignments.
 
@@ -1,13 +1,20 @@
-def infer_childdirected(utt):
+def infer_childdirected(utt, target_children=None):
     """Infer child directedness.
 
     Args:
         utt (acqdiv.model.utterance.Utterance): The utterance.
+        target_children (Optional[Set[acqdiv.model.speaker.Speaker]]): The
+            target children of the session. By default, the speakers with
+            the macro role `Target_Child`.
     """
     if utt.childdirected == '':
         if utt.addressee:
-            if (utt.addressee.macro_role == 'Target_Child'
-                    and utt.addressee != utt.speaker):
+            if target_children is None:
+                is_target_child = utt.addressee.macro_role == 'Target_Child'
+            else:
+                is_target_child = utt.addressee in target_children
+
+            if is_target_child and utt.addressee != utt.speaker:
                 return True
             else:
                 return False
@@ -0,0 +1,174 @@
+"""Fingerprints of session files and of the code parsing them."""
+
+import functools
+import hashlib
+import inspect
+import os
+import re
+
+from acqdiv.util.path import get_acqdiv_path
+
+# packages whose code and resources every corpus parser depends on
+SHARED_PACKAGES = ['model', 'parsers', 'util']
+
+# package containing one subpackage per corpus
+CORPORA_PACKAGE = os.path.join('parsers', 'corpora')
+
+corpus_import_regex = re.compile(r'acqdiv\.parsers\.corpora\.(\w+)\.(\w+)')
+line_continuation_regex = re.compile(r'\\\n\s*')
+
+
+def get_file_stat(path):
+    """Get the size and modification time of a file.
+
+    Args:
+        path (str): Path to the file.
+
+    Returns:
+        Tuple[int, float]: The size in bytes and the modification time.
+    """
+    stat = os.stat(path)
+    return stat.st_size, stat.st_mtime
+
+
+def get_file_hash(path):
+    """Get the SHA-1 hash of the content of a file.
+
+    Args:
+        path (str): Path to the file.
+
+    Returns:
+        str: The hex digest.
+    """
+    sha1 = hashlib.sha1()
+
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            sha1.update(chunk)
+
+    return sha1.hexdigest()
+
+
+def get_source_stat(paths):
+    """Get the size and modification time of the source files of a session.
+
+    Args:
+        paths (List[str]): Paths to the session file and its metadata file
+            if any. Missing files are ignored.
+
+    Returns:
+        Tuple[int, float]: The total size in bytes and the most recent
+        modification time.
+    """
+    stats = [get_file_stat(path) for path in paths if os.path.isfile(path)]
+    return sum(size for size, _ in stats), max(mtime for _, mtime in stats)
+
+
+def get_source_hash(paths):
+    """Get the SHA-1 hash of the source files of a session.
+
+    The hash of a single file is the hash of its content.
+
+    Args:
+        paths (List[str]): Paths to the session file and its metadata file
+            if any. Missing files are ignored.
+
+    Returns:
+        str: The hex digest.
+    """
+    paths = [path for path in paths if os.path.isfile(path)]
+    if len(paths) == 1:
+        return get_file_hash(paths[0])
+
+    sha1 = hashlib.sha1()
+    for path in paths:
+        sha1.update(get_file_hash(path).encode('ascii'))
+
+    return sha1.hexdigest()
+
+
+def iter_package_files(package_dir, exclude_dir=None):
+    """Iter the source and resource files of a package.
+
+    Args:
+        package_dir (str): Path to the package.
+        exclude_dir (str): Path to a subdirectory that is skipped.
+
+    Yields:
+        str: The path to the next file in a stable order.
+    """
+    for root, dirs, files in os.walk(package_dir):
+        dirs[:] = sorted(
+            d for d in dirs
+            if d != '__pycache__' and os.path.join(root, d) != exclude_dir)
+
+        for file in sorted(files):
+            if not file.endswith('.pyc'):
+                yield os.path.join(root, file)
+
+
+def get_corpus_packages(corpus_parser_class):
+    """Get the corpus packages a corpus parser depends on.
+
+    Besides the package of the corpus parser itself, these are all corpus
+    packages imported by its modules, directly or indirectly.
+
+    Args:
+        corpus_parser_class (type): The corpus parser class.
+
+    Returns:
+        List[str]: Paths to the corpus packages.
+    """
+    corpora_dir = os.path.join(get_acqdiv_path(), CORPORA_PACKAGE)
+    package_dir = os.path.dirname(inspect.getfile(corpus_parser_class))
+    packages = [package_dir]
+
+    for package_dir in packages:
+        for path in iter_package_files(package_dir):
+            if not path.endswith('.py'):
+                continue
+
+            with open(path, encoding='utf8') as f:
+                code = line_continuation_regex.sub('', f.read())
+
+            for group, corpus in corpus_import_regex.findall(code):
+                imported_dir = os.path.join(corpora_dir, group, corpus)
+                if imported_dir not in packages:
+                    packages.append(imported_dir)
+
+    return sorted(packages)
+
+
+@functools.lru_cache(maxsize=None)
+def get_code_fingerprint(corpus_parser_class):
+    """Get the fingerprint of the code parsing a corpus.
+
+    The fingerprint covers the shared packages of acqdiv as well as the
+    corpus packages the corpus parser depends on, including resource files
+    like role mappings. It changes whenever any of these files changes.
+    It is computed once per process as the code does not change while
+    loading.
+
+    Args:
+        corpus_parser_class (type): The corpus parser class.
+
+    Returns:
+        str: The hex digest.
+    """
+    acqdiv_dir = get_acqdiv_path()
+    corpora_dir = os.path.join(acqdiv_dir, CORPORA_PACKAGE)
+    paths = []
+
+    for package in SHARED_PACKAGES:
+        paths.extend(iter_package_files(
+            os.path.join(acqdiv_dir, package), exclude_dir=corpora_dir))
+
+    for package_dir in get_corpus_packages(corpus_parser_class):
+        paths.extend(iter_package_files(package_dir))
+
+    sha1 = hashlib.sha1()
+    for path in paths:
+        sha1.update(os.path.relpath(path, acqdiv_dir).encode('utf8'))
+        sha1.update(get_file_hash(path).encode('ascii'))
+
+    return sha1.hexdigest()
@@ -0,0 +1,183 @@
+"""Bounded memoization of pure classmethods."""
+
+import collections
+import functools
+
+# default maximum number of cached results per method
+MAXSIZE = 1 << 16
+
+# memoized functions by their qualified name
+registry = {}
+
+# hits and misses of the calls in worker processes by qualified name
+worker_counts = {}
+
+CacheStats = collections.namedtuple('CacheStats', ['hits', 'misses'])
+
+
+def memoize(func, maxsize=MAXSIZE):
+    """Memoize the function of a classmethod.
+
+    The results are cached per class and arguments unless the `memoize`
+    attribute of the class is false at call time.
+
+    Args:
+        func (Callable): The function taking the class as first argument.
+        maxsize (int): Maximum number of cached results.
+
+    Returns:
+        Callable: The memoized function having the `cache_info` and
+        `cache_clear` methods of `functools.lru_cache`.
+    """
+    cached_func = functools.lru_cache(maxsize=maxsize)(func)
+
+    @functools.wraps(func)
+    def wrapper(cls, *args):
+        if cls.memoize:
+            return cached_func(cls, *args)
+
+        return func(cls, *args)
+
+    wrapper.cache_info = cached_func.cache_info
+    wrapper.cache_clear = cached_func.cache_clear
+    registry[f'{func.__module__}.{func.__qualname__}'] = wrapper
+
+    return wrapper
+
+
+class MemoizedClassMethods:
+    """Mixin memoizing the classmethods listed in `memoized_methods`.
+
+    Every class memoizes the listed classmethods it defines itself, so that
+    overriding methods of subclasses are memoized as well. Only classmethods
+    whose result depends on nothing but the class and the arguments should
+    be listed. Classes setting `memoize` to false opt out for all of their
+    methods, including the inherited ones.
+    """
+
+    # whether the results of the listed classmethods are cached
+    memoize = True
+
+    # names of the classmethods to memoize
+    memoized_methods = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        for name in cls.memoized_methods:
+            method = vars(cls).get(name)
+
+            if isinstance(method, classmethod):
+                setattr(cls, name, classmethod(memoize(method.__func__)))
+
+
+def get_cache_counts():
+    """Get the hits and misses of the memoized methods in this process.
+
+    Returns:
+        Dict[str, Tuple[int, int]]: The hits and misses of the methods that
+        have been called at least once by qualified name.
+    """
+    counts = {}
+
+    for name, func in registry.items():
+        info = func.cache_info()
+        if info.hits or info.misses:
+            counts[name] = (info.hits, info.misses)
+
+    return counts
+
+
+def call_counting_caches(func, *args):
+    """Call a function and count the cache hits and misses of the call.
+
+    Used to send the counts of a worker process along with the result, see
+    `add_worker_counts`.
+
+    Args:
+        func (Callable): The function.
+        *args: The arguments.
+
+    Returns:
+        Tuple[Any, Dict[str, Tuple[int, int]]]: The result and the hits
+        and misses by qualified name.
+    """
+    before = get_cache_counts()
+    result = func(*args)
+    counts = {}
+
+    for name, (hits, misses) in get_cache_counts().items():
+        hits_before, misses_before = before.get(name, (0, 0))
+        if (hits, misses) != (hits_before, misses_before):
+            counts[name] = (hits - hits_before, misses - misses_before)
+
+    return result, counts
+
+
+def add_worker_counts(counts):
+    """Add the cache hits and misses of a worker process to the statistics.
+
+    Args:
+        counts (Dict[str, Tuple[int, int]]): The hits and misses by
+            qualified name, see `call_counting_caches`.
+    """
+    for name, (hits, misses) in counts.items():
+        worker_hits, worker_misses = worker_counts.get(name, (0, 0))
+        worker_counts[name] = (worker_hits + hits, worker_misses + misses)
+
+
+def get_cache_stats():
+    """Get the hit and miss statistics of all memoized methods.
+
+    The statistics combine the calls in this process and those added from
+    worker processes.
+
+    Returns:
+        Dict[str, CacheStats]: The statistics of the methods that have been
+        called at least once by qualified name.
+    """
+    counts = get_cache_counts()
+    stats = {}
+
+    for name in sorted(set(counts) | set(worker_counts)):
+        hits, misses = counts.get(name, (0, 0))
+        worker_hits, worker_misses = worker_counts.get(name, (0, 0))
+        stats[name] = CacheStats(hits + worker_hits, misses + worker_misses)
+
+    return stats
+
+
+def format_cache_stats():
+    """Format the hit and miss statistics of all memoized methods.
+
+    Returns:
+        str: One line per method and a total.
+    """
+    stats = get_cache_stats()
+    width = max([60] + [len(name) + 2 for name in stats])
+    lines = [f'{"method":<{width}}{"hits":>12}{"misses":>10}{"hit rate":>10}']
+    total_hits = total_misses = 0
+
+    for name, info in stats.items():
+        total_hits += info.hits
+        total_misses += info.misses
+        lines.append(format_stats_line(name, info.hits, info.misses, width))
+
+    lines.append(format_stats_line('total', total_hits, total_misses, width))
+
+    return '\n'.join(lines)
+
+
+def format_stats_line(name, hits, misses, width=60):
+    calls = hits + misses
+    hit_rate = hits / calls if calls else 0
+
+    return f'{name:<{width}}{hits:>12}{misses:>10}{hit_rate:>10.1%}'
+
+
+def clear_caches():
+    """Clear the caches and statistics of all memoized methods."""
+    for func in registry.values():
+        func.cache_clear()
+
+    worker_counts.clear()
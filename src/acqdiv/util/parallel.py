@@ -0,0 +1,49 @@
+"""Helpers for running parsing work in worker processes."""
+
+import collections
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+
+def get_executor(jobs):
+    """Get a process pool.
+
+    Workers are spawned instead of forked so that they neither inherit an
+    open database connection nor any module state of the parent process.
+
+    Args:
+        jobs (int): Number of worker processes.
+
+    Returns:
+        ProcessPoolExecutor: The process pool.
+    """
+    mp_context = multiprocessing.get_context('spawn')
+    return ProcessPoolExecutor(jobs, mp_context=mp_context)
+
+
+def iter_ordered(executor, func, args_iterable, prefetch):
+    """Yield the results of `func` in the order of the arguments.
+
+    In contrast to `Executor.map`, at most `prefetch` tasks are pending at
+    the same time so that results never pile up in memory when they are
+    consumed more slowly than they are produced.
+
+    Args:
+        executor (concurrent.futures.Executor): The executor.
+        func (Callable): A picklable function.
+        args_iterable (Iterable[tuple]): The arguments for each call.
+        prefetch (int): Maximum number of pending tasks.
+
+    Yields:
+        Any: The next result.
+    """
+    pending = collections.deque()
+
+    for args in args_iterable:
+        pending.append(executor.submit(func, *args))
+
+        if len(pending) >= prefetch:
+            yield pending.popleft().result()
+
+    while pending:
+        yield pending.popleft().result()
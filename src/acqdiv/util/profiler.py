@@ -0,0 +1,255 @@
+"""Wall time of the loading stages per corpus and session."""
+
+import contextlib
+import csv
+import functools
+import json
+import os
+import time
+
+
+class Profiler:
+    """Methods for timing the stages of a load.
+
+    The stages are nested: a stage only counts the time not spent in the
+    stages started while it runs, so the times of all stages of a session
+    add up to its total time. Nothing is recorded unless enabled.
+
+    Stages:
+        read: Reading the lines or records from the session file.
+        split: Splitting the records into their tiers.
+        reader: Reading the data from the records and metadata.
+        cleaner: Cleaning the data.
+        alignment: Aligning words and morphemes.
+        parse: Building the session, e.g. the speakers and utterances.
+        cache: Reading and writing the session cache.
+        insert: Writing the session to the backend.
+    """
+
+    def __init__(self):
+        self.enabled = False
+
+        # seconds and counts by corpus, session and stage
+        self.stats = {}
+        self.corpus = None
+        self.session = None
+
+        # the running stages as [name, start, seconds in nested stages]
+        self.stack = []
+
+    def enable(self):
+        """Start recording and discard any previous records."""
+        self.enabled = True
+        self.stats = {}
+        self.corpus = None
+        self.session = None
+        self.stack = []
+
+    def disable(self):
+        """Stop recording."""
+        self.enabled = False
+
+    def set_session(self, corpus, session):
+        """Set the session the following stages are recorded for.
+
+        Args:
+            corpus (str): The corpus name.
+            session (str): Path to the session file.
+        """
+        self.corpus = corpus
+        self.session = session
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        """Record the time of a block.
+
+        Args:
+            name (str): The stage name.
+        """
+        if not self.enabled:
+            yield
+            return
+
+        self.start(name)
+        try:
+            yield
+        finally:
+            self.stop()
+
+    def start(self, name):
+        self.stack.append([name, time.perf_counter(), 0])
+
+    def stop(self):
+        name, start, nested = self.stack.pop()
+        elapsed = time.perf_counter() - start
+
+        if self.stack:
+            self.stack[-1][2] += elapsed
+
+        sessions = self.stats.setdefault(self.corpus, {})
+        stages = sessions.setdefault(self.session, {})
+        stats = stages.setdefault(name, [0, 0])
+        stats[0] += elapsed - nested
+        stats[1] += 1
+
+    def timed(self, name):
+        """Decorate a function to record its calls.
+
+        Args:
+            name (str): The stage name.
+
+        Returns:
+            Callable: The decorator.
+        """
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+
+                self.start(name)
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.stop()
+
+            return wrapper
+
+        return decorator
+
+    def iter_stage(self, name, iterable):
+        """Record the time of getting every item of an iterable.
+
+        Args:
+            name (str): The stage name.
+            iterable (Iterable): The items.
+
+        Returns:
+            Iterable: The items. The iterable itself if not enabled.
+        """
+        if not self.enabled:
+            return iterable
+
+        return self._iter_stage(name, iter(iterable))
+
+    def _iter_stage(self, name, iterator):
+        while True:
+            self.start(name)
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                self.stop()
+
+            yield item
+
+    def wrap(self, name, obj):
+        """Record the method calls of an object.
+
+        Args:
+            name (str): The stage name.
+            obj (object): The object.
+
+        Returns:
+            object: A proxy of the object. The object itself if not enabled.
+        """
+        if not self.enabled:
+            return obj
+
+        return StageProxy(self, name, obj)
+
+    def get_rows(self):
+        """Get the records as rows.
+
+        Returns:
+            List[dict]: The corpus, session, stage, seconds and count.
+        """
+        return [
+            dict(corpus=corpus, session=session, stage=stage,
+                 seconds=seconds, count=count)
+            for corpus, sessions in self.stats.items()
+            for session, stages in sessions.items()
+            for stage, (seconds, count) in stages.items()
+        ]
+
+    def get_report(self):
+        """Get the records with totals per corpus and session.
+
+        Returns:
+            dict: The seconds and stages of every corpus and its sessions.
+        """
+        corpora = {}
+        for row in self.get_rows():
+            corpus = corpora.setdefault(
+                row['corpus'], {'seconds': 0, 'stages': {}, 'sessions': {}})
+            session = corpus['sessions'].setdefault(
+                row['session'], {'seconds': 0, 'stages': {}})
+
+            for entry in [corpus, session]:
+                entry['seconds'] += row['seconds']
+                stage = entry['stages'].setdefault(
+                    row['stage'], {'seconds': 0, 'count': 0})
+                stage['seconds'] += row['seconds']
+                stage['count'] += row['count']
+
+        return {
+            'seconds': sum(corpus['seconds'] for corpus in corpora.values()),
+            'corpora': corpora,
+        }
+
+    def write_report(self, out_dir):
+        """Write the records to `profile.json` and `profile.csv`.
+
+        Args:
+            out_dir (str): Where the files are written to.
+        """
+        os.makedirs(out_dir, exist_ok=True)
+
+        with open(os.path.join(out_dir, 'profile.json'), 'w') as json_file:
+            json.dump(self.get_report(), json_file, indent=2)
+
+        with open(os.path.join(out_dir, 'profile.csv'), 'w',
+                  newline='') as csv_file:
+            writer = csv.DictWriter(csv_file, fieldnames=[
+                'corpus', 'session', 'stage', 'seconds', 'count'])
+            writer.writeheader()
+            writer.writerows(self.get_rows())
+
+
+class StageProxy:
+    """Records the method calls of an object as a stage."""
+
+    def __init__(self, profiler, name, obj):
+        self._profiler = profiler
+        self._name = name
+        self._obj = obj
+
+    def __getattr__(self, attr):
+        value = getattr(self._obj, attr)
+
+        if not callable(value):
+            return value
+
+        profiler = self._profiler
+        name = self._name
+
+        @functools.wraps(value)
+        def wrapper(*args, **kwargs):
+            profiler.start(name)
+            try:
+                return value(*args, **kwargs)
+            finally:
+                profiler.stop()
+
+        return wrapper
+
+    def __setattr__(self, attr, value):
+        if attr.startswith('_'):
+            super().__setattr__(attr, value)
+        else:
+            setattr(self._obj, attr, value)
+
+
+# the profiler of the current process
+profiler = Profiler()
@@ -0,0 +1,132 @@
+"""On-disk cache of parsed sessions."""
+
+import hashlib
+import os
+import pickle
+import tempfile
+import zlib
+
+from acqdiv.util.fingerprint import get_file_hash
+
+
+class SessionCache:
+    """Cache of parsed sessions keyed by the content of their source files.
+
+    Every session is stored as a zlib-compressed pickle in its own file.
+    Reading a session marks it as recently used, and `prune` evicts the
+    least recently used sessions once the cache exceeds its maximum size.
+    """
+
+    # default maximum size of the cache in bytes
+    max_size = 2 * 1024**3
+
+    suffix = '.pickle.z'
+
+    def __init__(self, cache_dir, max_size=None):
+        """Initialize the cache directory.
+
+        Args:
+            cache_dir (str): Where the sessions are cached.
+            max_size (int): Maximum size of the cache in bytes.
+        """
+        self.cache_dir = cache_dir
+        if max_size is not None:
+            self.max_size = max_size
+
+        os.makedirs(cache_dir, exist_ok=True)
+
+    @staticmethod
+    def get_key(source_paths, fingerprint, corpus):
+        """Get the cache key of a session.
+
+        Besides their content, the names of the source files are part of the
+        key as the session and utterance IDs are derived from them.
+
+        Args:
+            source_paths (List[str]): Paths to the session file and its
+                metadata file if any. Missing files are ignored.
+            fingerprint (str): Fingerprint of the parser code.
+            corpus (str): The corpus name.
+
+        Returns:
+            str: The hex digest.
+        """
+        sha1 = hashlib.sha1()
+        sha1.update(corpus.encode('utf8'))
+        sha1.update(fingerprint.encode('ascii'))
+
+        for path in source_paths:
+            sha1.update(os.path.basename(path).encode('utf8'))
+
+            if os.path.isfile(path):
+                sha1.update(get_file_hash(path).encode('ascii'))
+            else:
+                sha1.update(b'-')
+
+        return sha1.hexdigest()
+
+    def get_path(self, key):
+        return os.path.join(self.cache_dir, key + self.suffix)
+
+    def get(self, key):
+        """Get a cached session.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Optional[acqdiv.model.session.Session]: The session or None if it
+            is not cached.
+        """
+        path = self.get_path(key)
+
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            session = pickle.loads(zlib.decompress(data))
+        except FileNotFoundError:
+            return None
+        except (EOFError, zlib.error, pickle.UnpicklingError):
+            # ignore corrupt entries
+            return None
+
+        # mark as recently used
+        os.utime(path)
+
+        return session
+
+    def put(self, key, session):
+        """Cache a session.
+
+        The file is written atomically so that concurrent workers never read
+        partial entries.
+
+        Args:
+            key (str): The cache key.
+            session (acqdiv.model.session.Session): The session.
+        """
+        data = zlib.compress(
+            pickle.dumps(session, protocol=pickle.HIGHEST_PROTOCOL))
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, self.get_path(key))
+
+    def prune(self):
+        """Remove the least recently used sessions exceeding the maximum size.
+        """
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith(self.suffix):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        size = sum(entry_size for _, entry_size, _ in entries)
+
+        for _, entry_size, path in sorted(entries):
+            if size <= self.max_size:
+                break
+
+            os.remove(path)
+            size -= entry_size
@@ -0,0 +1,637 @@
+"""Generate synthetic corpora for load testing.
+
+The real corpora cannot be shared for licensing reasons. The synthetic
+corpora have the formats of the English Manchester corpus (CHAT with
+`%mor`), the Inuktitut corpus (CHAT with `%xmor`) and the Qaqet corpus
+(Toolbox with `\\mb`, `\\ge`, `\\ps`, `\\ELANBegin` and IMDI metadata) and are
+read by the parsers of these corpora.
+
+The word frequencies follow Zipf's law and the utterance lengths a geometric
+distribution, with shorter utterances of the target children. Every session
+is recorded with one of a few target children and one or two adults taking
+turns. The same seed always generates the same corpora.
+
+Usage:
+    python -m acqdiv.util.synthetic_corpora OUT_DIR [--sessions N]
+        [--utterances N] [--corpora NAME [NAME ...]] [--seed N]
+
+The corpora are written to `OUT_DIR/corpora` together with a config
+`OUT_DIR/config.ini` loading them into `OUT_DIR/database`:
+    acqdiv load -c OUT_DIR/config.ini
+"""
+import argparse
+import configparser
+import datetime
+import itertools
+import os
+import random
+
+from acqdiv.util.path import get_full_path
+
+CONSONANTS = 'ptkbdgmnslrwjh'
+VOWELS = 'aeiou'
+MONTHS = ['JAN', 'FEB', 'MAR', 'APR', 'MAY', 'JUN', 'JUL', 'AUG', 'SEP',
+          'OCT', 'NOV', 'DEC']
+
+# exponent of the Zipf distribution of the word frequencies
+ZIPF_EXPONENT = 1.0
+
+# utterance terminators and their weights
+TERMINATORS = [('.', 70), ('?', 20), ('!', 10)]
+
+
+class SyntheticCorpus:
+    """Generator of the session files of a corpus.
+
+    Subclasses write the session files in the format of one corpus. A word
+    of the lexicon is a list of morphemes as (segment, gloss, POS) tuples
+    with exactly one stem.
+    """
+
+    # the config section of the corpus
+    corpus = ''
+
+    # POS tags of the stems
+    stem_poses = []
+
+    # affixes as (segment, gloss, POS) tuples
+    prefixes = []
+    suffixes = []
+
+    # probability of a prefix and of a suffix per word
+    prefix_prob = 0
+    suffix_prob = 0
+
+    # mean number of words of an utterance
+    adult_length = 4.5
+    child_length = 2.2
+
+    # roles and names of the adults
+    adults = [('MOT', 'Mother'), ('FAT', 'Father'), ('INV', 'Investigator')]
+
+    def __init__(self, rng, lexicon_size=2000, n_children=4):
+        """Generate the lexicon and target children.
+
+        Args:
+            rng (random.Random): The random generator.
+            lexicon_size (int): Number of distinct words.
+            n_children (int): Number of target children.
+        """
+        self.rng = rng
+        self.lexicon = [self.get_word() for _ in range(lexicon_size)]
+        self.cum_weights = list(itertools.accumulate(
+            1 / rank ** ZIPF_EXPONENT for rank in range(1, lexicon_size + 1)))
+        self.children = [self.get_child(i) for i in range(n_children)]
+
+    def get_segment(self, min_syllables, max_syllables):
+        """Get a random segment of CV syllables."""
+        n = self.rng.randint(min_syllables, max_syllables)
+
+        return ''.join(self.rng.choice(CONSONANTS) + self.rng.choice(VOWELS)
+                       for _ in range(n))
+
+    def get_word(self):
+        """Get a random word of the lexicon.
+
+        Returns:
+            List[Tuple[str, str, str]]: The morphemes.
+        """
+        segment = self.get_segment(1, 3)
+        word = [(segment, self.get_stem_gloss(segment),
+                 self.rng.choice(self.stem_poses))]
+
+        if self.prefixes and self.rng.random() < self.prefix_prob:
+            word.insert(0, self.rng.choice(self.prefixes))
+
+        if self.suffixes and self.rng.random() < self.suffix_prob:
+            word.append(self.rng.choice(self.suffixes))
+
+        return word
+
+    def get_stem_gloss(self, segment):
+        """Get the gloss of a stem."""
+        return self.get_segment(1, 2)
+
+    def get_child(self, index):
+        """Get a target child.
+
+        Returns:
+            dict: The code, name, sex and birth date.
+        """
+        code = ''.join(self.rng.choice('ABCDEFGHJKLMNPRSTVWZ')
+                       for _ in range(3))
+        birth_date = datetime.date(1995, 1, 1) + datetime.timedelta(
+            days=self.rng.randint(0, 3650))
+
+        return {
+            'code': code,
+            'name': self.get_segment(2, 3).capitalize(),
+            'sex': self.rng.choice(['female', 'male']),
+            'birth_date': birth_date,
+        }
+
+    def get_session(self, index, n_utterances):
+        """Get the metadata and utterances of a session.
+
+        The sessions of a child are recorded every few weeks starting at
+        the age of about one and a half years.
+
+        Args:
+            index (int): The session number.
+            n_utterances (int): Mean number of utterances.
+
+        Returns:
+            dict: The name, date, speakers and utterances.
+        """
+        child = self.children[index % len(self.children)]
+        date = child['birth_date'] + datetime.timedelta(
+            days=540 + 14 * (index // len(self.children)))
+
+        speakers = [dict(child, role='Target_Child', label='CHI')]
+        for label, role in self.rng.sample(
+                self.adults, self.rng.randint(1, 2)):
+            speakers.append({
+                'label': label,
+                'code': label,
+                'role': role,
+                'name': self.get_segment(2, 3).capitalize(),
+                'sex': 'female' if role == 'Mother' else 'male',
+                'birth_date': None,
+            })
+
+        n = self.rng.randint(n_utterances // 2, n_utterances * 3 // 2)
+
+        return {
+            'name': f'{self.corpus}{index + 1:05d}',
+            'date': date,
+            'child': child,
+            'speakers': speakers,
+            'utterances': self.iter_utterances(speakers, n),
+        }
+
+    def iter_utterances(self, speakers, n):
+        """Get the utterances of a session.
+
+        Args:
+            speakers (List[dict]): The speakers, the target child first.
+            n (int): Number of utterances.
+
+        Yields:
+            dict: The speaker, addressee, words, terminator and the start and
+            end time in milliseconds.
+        """
+        terminators, weights = zip(*TERMINATORS)
+        time = 0
+
+        for _ in range(n):
+            speaker = self.rng.choice(speakers)
+            is_child = speaker['role'] == 'Target_Child'
+            addressee = self.rng.choice(
+                [sp for sp in speakers if sp is not speaker])
+
+            mean_length = self.child_length if is_child \
+                else self.adult_length
+            length = min(1 + int(self.rng.expovariate(
+                1 / (mean_length - 1))), 20)
+            words = self.rng.choices(
+                self.lexicon, cum_weights=self.cum_weights, k=length)
+
+            start = time + self.rng.randint(200, 2000)
+            end = start + length * self.rng.randint(250, 450)
+            time = end
+
+            yield {
+                'speaker': speaker,
+                'addressee': addressee,
+                'words': words,
+                'terminator': self.rng.choices(terminators, weights)[0],
+                'start': start,
+                'end': end,
+            }
+
+    def write_session(self, corpus_dir, session):
+        """Write the files of a session.
+
+        Args:
+            corpus_dir (str): The directory of the corpus.
+            session (dict): The session, see `get_session`.
+        """
+        raise NotImplementedError
+
+    def write(self, corpus_dir, n_sessions, n_utterances):
+        """Write the sessions of the corpus.
+
+        Args:
+            corpus_dir (str): The directory of the corpus.
+            n_sessions (int): Number of sessions.
+            n_utterances (int): Mean number of utterances per session.
+        """
+        for index in range(n_sessions):
+            self.write_session(
+                corpus_dir, self.get_session(index, n_utterances))
+
+    @staticmethod
+    def get_form(word):
+        """Get the surface form of a word."""
+        return ''.join(segment for segment, _, _ in word)
+
+    def get_translation(self, utterance):
+        """Get the translation of an utterance from the stem glosses."""
+        return ' '.join(gloss for word in utterance['words']
+                        for _, gloss, pos in word if pos in self.stem_poses)
+
+
+class CHATCorpus(SyntheticCorpus):
+    """Generator of the session files of a CHAT corpus."""
+
+    # ISO 639-3 code and name of the corpus in the @ID headers
+    language = ''
+    id_corpus = ''
+
+    # whether the times are bullets of the main line or a `%tim` tier
+    has_bullets = True
+
+    def write_session(self, corpus_dir, session):
+        cha_dir = os.path.join(corpus_dir, 'cha')
+        os.makedirs(cha_dir, exist_ok=True)
+        path = os.path.join(cha_dir, f'{session["name"]}.cha')
+
+        with open(path, 'w') as cha_file:
+            cha_file.writelines(self.iter_lines(session))
+
+    def iter_lines(self, session):
+        """Iter the lines of the CHAT file of a session."""
+        child = session['child']
+
+        yield '@UTF8\n'
+        yield '@Begin\n'
+        yield f'@Languages:\t{self.language}\n'
+        yield '@Participants:\t' + ', '.join(
+            f'{sp["label"]} {sp["name"]} {sp["role"]}'
+            for sp in session['speakers']) + '\n'
+
+        for sp in session['speakers']:
+            age = self.get_age(sp['birth_date'], session['date'])
+            yield (f'@ID:\t{self.language}|{self.id_corpus}|{sp["label"]}|'
+                   f'{age}|{sp["sex"]}|||{sp["role"]}|||\n')
+
+        yield f'@Birth of CHI:\t{self.format_date(child["birth_date"])}\n'
+        yield f'@Media:\t{session["name"]}, audio\n'
+        yield f'@Date:\t{self.format_date(session["date"])}\n'
+
+        for utterance in session['utterances']:
+            yield from self.iter_record_lines(utterance)
+
+        yield '@End\n'
+
+    def iter_record_lines(self, utterance):
+        """Iter the main line and dependent tiers of an utterance."""
+        words = ' '.join(self.get_form(word) for word in utterance['words'])
+        line = (f'*{utterance["speaker"]["label"]}:\t{words} '
+                f'{utterance["terminator"]}')
+
+        if self.has_bullets:
+            yield f'{line} \x15{utterance["start"]}_{utterance["end"]}\x15\n'
+        else:
+            seconds = utterance['start'] // 1000
+            yield f'{line}\n'
+            yield (f'%tim:\t{seconds // 3600:02d}:{seconds // 60 % 60:02d}:'
+                   f'{seconds % 60:02d}\n')
+
+    @staticmethod
+    def format_date(date):
+        """Format a date as in CHAT, e.g. 01-JAN-2000."""
+        return f'{date.day:02d}-{MONTHS[date.month - 1]}-{date.year}'
+
+    @staticmethod
+    def get_age(birth_date, date):
+        """Get the age in CHAT format, e.g. 2;03.15, or '' if unknown."""
+        if birth_date is None:
+            return ''
+
+        months = (date.year - birth_date.year) * 12 \
+            + date.month - birth_date.month
+        days = date.day - birth_date.day
+        if days < 0:
+            months -= 1
+            days += 30
+
+        return f'{months // 12};{months % 12:02d}.{days:02d}'
+
+
+class EnglishCorpus(CHATCorpus):
+    """Generator of CHAT files with a `%mor` tier."""
+
+    corpus = 'English_Manchester1'
+    language = 'eng'
+    id_corpus = 'Manchester'
+
+    stem_poses = ['n', 'n', 'v', 'v', 'adj', 'adv', 'pro:per', 'det:art',
+                  'prep', 'co']
+    prefixes = [('un', 'un', 'pfx')]
+    suffixes = [('s', 'PL', 'sfx'), ('ed', 'PAST', 'sfx'),
+                ('ing', 'PRESP', 'sfx')]
+    prefix_prob = 0.05
+    suffix_prob = 0.3
+
+    def get_stem_gloss(self, segment):
+        # the stems are glossed by themselves
+        return segment
+
+    def iter_record_lines(self, utterance):
+        yield from super().iter_record_lines(utterance)
+        yield '%mor:\t' + ' '.join(
+            self.get_mor_word(word) for word in utterance['words']) \
+            + f' {utterance["terminator"]}\n'
+
+    @staticmethod
+    def get_mor_word(word):
+        """Get a word of the `%mor` tier, e.g. un#v|pack-PAST."""
+        mor_word = ''
+        for segment, gloss, pos in word:
+            if pos == 'pfx':
+                mor_word += f'{segment}#'
+            elif pos == 'sfx':
+                mor_word += f'-{gloss}'
+            else:
+                mor_word += f'{pos}|{segment}'
+
+        return mor_word
+
+
+class InuktitutCorpus(CHATCorpus):
+    """Generator of CHAT files with a `%xmor` tier."""
+
+    corpus = 'Inuktitut'
+    language = 'ike'
+    id_corpus = 'inuktitut'
+    has_bullets = False
+
+    stem_poses = ['NR', 'NR', 'VR', 'VR', 'LR', 'PRO', 'ADV']
+    suffixes = [('mi', 'LOC', 'NN'), ('tu', 'be', 'NZ'),
+                ('juq', 'PAR_3sS', 'VV'), ('nga', 'CSV_1sS', 'VI'),
+                ('lu', 'and', 'VZ'), ('kkut', 'VIA', 'NN')]
+    suffix_prob = 0.6
+
+    def get_word(self):
+        word = super().get_word()
+
+        # polysynthetic words with up to three suffixes
+        while len(word) < 4 and self.rng.random() < 0.3:
+            suffix = self.rng.choice(self.suffixes)
+            if suffix != word[-1]:
+                word.append(suffix)
+
+        return word
+
+    def iter_record_lines(self, utterance):
+        yield from super().iter_record_lines(utterance)
+        yield '%xmor:\t' + ' '.join(
+            '+'.join(f'{pos}|{segment}^{gloss}'
+                     for segment, gloss, pos in word)
+            for word in utterance['words']) \
+            + f' {utterance["terminator"]}\n'
+        yield f'%eng:\t{self.get_translation(utterance)}\n'
+        yield f'%add:\t{utterance["addressee"]["label"]}\n'
+
+
+class QaqetCorpus(SyntheticCorpus):
+    """Generator of Toolbox files with IMDI metadata."""
+
+    corpus = 'Qaqet'
+
+    stem_poses = ['N', 'N', 'V.CONT', 'V.NCONT', 'ADJ', 'ADV', 'PRO', 'PREP']
+    prefixes = [('ngi=', '1SG.SBJ.NPST=', 'PRO='),
+                ('ka=', '3SG.M.SBJ.NPST=', 'PRO='),
+                ('a=', 'ART.ID=', 'ART=')]
+    suffixes = [('-ki', '-SG.M', '-NSUFF'), ('-mi', '-PL', '-NSUFF')]
+    prefix_prob = 0.3
+    suffix_prob = 0.2
+
+    adults = [('MOT', 'Mother'), ('FAT', 'Father'), ('SIS', 'Sister')]
+
+    def get_session(self, index, n_utterances):
+        session = super().get_session(index, n_utterances)
+
+        # the target child is identified by the session name
+        session['name'] = f'Qaqet{session["child"]["code"]}{index + 1:05d}'
+
+        for speaker in session['speakers']:
+            if speaker['role'] == 'Target_Child':
+                speaker['label'] = speaker['code']
+
+        return session
+
+    def write_session(self, corpus_dir, session):
+        toolbox_dir = os.path.join(corpus_dir, 'toolbox')
+        imdi_dir = os.path.join(corpus_dir, 'imdi')
+        os.makedirs(toolbox_dir, exist_ok=True)
+        os.makedirs(imdi_dir, exist_ok=True)
+
+        # the metadata file is named after the session without '_1'
+        toolbox_path = os.path.join(toolbox_dir, f'{session["name"]}_1.txt')
+        imdi_path = os.path.join(imdi_dir, f'{session["name"]}.imdi')
+
+        with open(toolbox_path, 'w') as toolbox_file:
+            toolbox_file.write('\\_sh v3.0  400  TextChild\n')
+
+            for i, utterance in enumerate(session['utterances'], 1):
+                toolbox_file.write(self.get_record(session, i, utterance))
+
+        with open(imdi_path, 'w') as imdi_file:
+            imdi_file.write(self.get_imdi(session))
+
+    def get_record(self, session, number, utterance):
+        """Get a Toolbox record of an utterance."""
+        words = utterance['words']
+        forms = [self.get_form(word).replace('=', '').replace('-', '')
+                 for word in words]
+        tiers = [
+            ['tx'] + forms,
+            ['mb'] + [self.join_morphemes(word, 0) for word in words],
+            ['ge'] + [self.join_morphemes(word, 1) for word in words],
+            ['ps'] + [self.join_morphemes(word, 2) for word in words],
+            ['lg'] + [' '.join(self.mark('Q', morpheme[0])
+                               for morpheme in word) for word in words],
+        ]
+
+        # the columns of the interlinear tiers are aligned
+        widths = [max(len(tier[i]) for tier in tiers) + 1
+                  for i in range(len(tiers[0]))]
+        lines = ['\\' + ''.join(value.ljust(width) for value, width
+                                in zip(tier, widths)).rstrip()
+                 for tier in tiers]
+
+        return '\n'.join([
+            '',
+            f'\\ref {session["name"]}_1 {number:03d}',
+            f'\\ELANBegin {utterance["start"] / 1000:.3f}',
+            f'\\ELANEnd {utterance["end"] / 1000:.3f}',
+            f'\\ELANParticipant {utterance["speaker"]["label"]}',
+            f'\\addr {utterance["addressee"]["label"]}',
+            '',
+        ] + lines + [
+            f'\\ft {self.get_translation(utterance)}',
+            '',
+        ])
+
+    @staticmethod
+    def mark(value, segment):
+        """Add the clitic or affix marker of a segment to a value."""
+        if segment.endswith('='):
+            return value + '='
+        elif segment.startswith('-'):
+            return '-' + value
+
+        return value
+
+    @staticmethod
+    def join_morphemes(word, field):
+        """Get a word of a morpheme tier."""
+        return ' '.join(morpheme[field] for morpheme in word)
+
+    def get_imdi(self, session):
+        """Get the IMDI metadata of a session."""
+        actors = ''.join(self.get_imdi_actor(speaker)
+                         for speaker in session['speakers'])
+
+        return f'''<METATRANSCRIPT>
+    <Session>
+        <Name>{session["name"]}</Name>
+        <Date>{session["date"].isoformat()}</Date>
+        <Description>Free play</Description>
+        <MDGroup>
+            <Location/>
+            <Project>
+                <Name>QCLD</Name>
+                <Title>Qaqet Child Language Documentation</Title>
+                <Id>QCLD</Id>
+                <Contact/>
+            </Project>
+            <Content>
+                <Genre>Discourse</Genre>
+            </Content>
+            <Actors>{actors}
+            </Actors>
+        </MDGroup>
+        <Resources>
+            <MediaFile>
+                <ResourceLink>{session["name"]}.wav</ResourceLink>
+                <Type>audio</Type>
+            </MediaFile>
+        </Resources>
+    </Session>
+</METATRANSCRIPT>
+'''
+
+    @staticmethod
+    def get_imdi_actor(speaker):
+        """Get the IMDI actor of a speaker."""
+        if speaker['birth_date'] is None:
+            birth_date = 'Unspecified'
+        else:
+            birth_date = speaker['birth_date'].isoformat()
+
+        return f'''
+                <Actor>
+                    <Role>{speaker["role"]}</Role>
+                    <Name>{speaker["name"]}</Name>
+                    <FullName>{speaker["name"]}</FullName>
+                    <Code>{speaker["label"]}</Code>
+                    <FamilySocialRole>{speaker["role"]}</FamilySocialRole>
+                    <Languages>
+                        <Language>
+                            <Id>ISO639-3:byx</Id>
+                            <Name>Qaqet</Name>
+                        </Language>
+                    </Languages>
+                    <BirthDate>{birth_date}</BirthDate>
+                    <Sex>{speaker["sex"]}</Sex>
+                </Actor>'''
+
+
+# the generators by corpus
+CORPORA = {
+    corpus_class.corpus: corpus_class
+    for corpus_class in [EnglishCorpus, InuktitutCorpus, QaqetCorpus]
+}
+
+
+def write_config(out_dir, corpora):
+    """Write the config loading the corpora.
+
+    The sections of the corpora are taken from the config of the package.
+
+    Args:
+        out_dir (str): Where the config is written to.
+        corpora (List[str]): The corpora.
+
+    Returns:
+        str: The path to the config.
+    """
+    package_cfg = configparser.ConfigParser(interpolation=None)
+    package_cfg.read(get_full_path('config.ini'))
+
+    cfg = configparser.ConfigParser(interpolation=None)
+    cfg['.global'] = {
+        'corpora_dir': os.path.abspath(os.path.join(out_dir, 'corpora')),
+        'db_dir': os.path.abspath(os.path.join(out_dir, 'database')),
+    }
+    for corpus in corpora:
+        cfg[corpus] = package_cfg[corpus]
+
+    os.makedirs(cfg['.global']['db_dir'], exist_ok=True)
+    cfg_path = os.path.join(out_dir, 'config.ini')
+    with open(cfg_path, 'w') as cfg_file:
+        cfg.write(cfg_file)
+
+    return cfg_path
+
+
+def generate(out_dir, corpora=None, n_sessions=10, n_utterances=500,
+             seed=0):
+    """Generate synthetic corpora.
+
+    Args:
+        out_dir (str): Where the corpora and the config are written to.
+        corpora (List[str]): The corpora, see `CORPORA`. Defaults to all.
+        n_sessions (int): Number of sessions per corpus.
+        n_utterances (int): Mean number of utterances per session.
+        seed (int): Seed of the random generator.
+
+    Returns:
+        str: The path to the config loading the corpora.
+    """
+    if corpora is None:
+        corpora = list(CORPORA)
+
+    for corpus in corpora:
+        print(f'Generating {n_sessions} sessions of {corpus}')
+        rng = random.Random(f'{seed}-{corpus}')
+        corpus_dir = os.path.join(out_dir, 'corpora', corpus)
+        CORPORA[corpus](rng).write(corpus_dir, n_sessions, n_utterances)
+
+    return write_config(out_dir, corpora)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Generate synthetic corpora for load testing.')
+    parser.add_argument('out_dir', help='Where the corpora are written to.')
+    parser.add_argument('-s', '--sessions', type=int, default=10,
+                        help='Number of sessions per corpus.')
+    parser.add_argument('-u', '--utterances', type=int, default=500,
+                        help='Mean number of utterances per session.')
+    parser.add_argument('-c', '--corpora', nargs='+', choices=list(CORPORA),
+                        help='The corpora. Defaults to all.')
+    parser.add_argument('--seed', type=int, default=0,
+                        help='Seed of the random generator.')
+    args = parser.parse_args()
+
+    cfg_path = generate(args.out_dir, args.corpora, args.sessions,
+                        args.utterances, args.seed)
+    print('Load the corpora with: acqdiv load -c', os.path.abspath(cfg_path))
+
+
+if __name__ == '__main__':
+    main()
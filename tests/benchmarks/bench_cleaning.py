@@ -0,0 +1,128 @@
+"""Micro-benchmark of the per-utterance cost of reading and cleaning CHAT.
+
+The sample consists of the main lines of the CHAT files of the unit tests
+and of utterances covering the CHAT codings handled by the cleaners.
+
+Usage:
+    python tests/benchmarks/bench_cleaning.py [--number N] [--repeat R]
+"""
+import argparse
+import glob
+import io
+import pathlib
+import timeit
+
+from acqdiv.parsers.chat.cleaners.cleaner import CHATCleaner
+from acqdiv.parsers.chat.cleaners.utterance_cleaner \
+    import CHATUtteranceCleaner
+from acqdiv.parsers.chat.cleaners.word_cleaner import CHATWordCleaner
+from acqdiv.parsers.chat.readers.actual_target_utterance \
+    import ActualTargetUtteranceExtractor
+from acqdiv.parsers.chat.readers.fileparser import CHATFileParser
+from acqdiv.util.memoization import format_cache_stats
+
+tests_dir = pathlib.Path(__file__).parents[1]
+
+# utterances covering the codings handled by the cleaners
+CODED_UTTERANCES = [
+    '*CHI:\t<that is> [/] that is my ba(ll) [: ball] ! \x15123_456\x15',
+    '*MOT:\t&=laughs xxx you want 0the [*] ball@f , no ? [+ bch]',
+    '*CHI:\tmore [x 3] (.) cookie [=! cries] +//.',
+    '*FAT:\t+< ‡ oh (..) &uh ↑look , at^the dog:gie „ yyy .',
+    '*CHI:\t0 [=! points] .',
+    '*MOT:\t<do you> [//] did you see &-um the ca(t) [: cat] ?',
+]
+
+
+def get_main_lines():
+    """Get the main lines of the sample."""
+    main_lines = list(CODED_UTTERANCES)
+
+    for path in sorted(glob.glob(
+            str(tests_dir / 'unittests' / '**' / '*.cha'), recursive=True)):
+        with open(path) as f:
+            for rec in CHATFileParser.iter_records(f.read()):
+                main_lines.append(CHATFileParser.get_mainline(rec))
+
+    return main_lines
+
+
+def read_main_lines(main_lines):
+    return [CHATFileParser.get_mainline_fields(line) for line in main_lines]
+
+
+def extract_actual_target(utterances):
+    for utterance in utterances:
+        ActualTargetUtteranceExtractor.to_actual_utterance(utterance)
+        ActualTargetUtteranceExtractor.to_target_utterance(utterance)
+
+
+def clean_utterances(utterances):
+    return [CHATUtteranceCleaner.clean(utterance) for utterance in utterances]
+
+
+def clean_words(utterances):
+    for utterance in utterances:
+        for word in utterance.split(' '):
+            CHATWordCleaner.clean(word)
+
+
+def clean_words_memoized(utterances):
+    for utterance in utterances:
+        for word in utterance.split(' '):
+            CHATCleaner.clean_word(word)
+
+
+def read_session(session):
+    for _ in CHATFileParser.parse(io.StringIO(session)).records:
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--number', type=int, default=200,
+                        help='Runs over the sample per measurement.')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='Measurements of which the best is taken.')
+    args = parser.parse_args()
+
+    main_lines = get_main_lines()
+    utterances = [fields[1] for fields in read_main_lines(main_lines)]
+    cleaned = clean_utterances(utterances)
+    session = '@Begin\n' + '\n'.join(main_lines) + '\n@End\n'
+
+    stages = [
+        ('CHATFileParser.parse', read_session, session),
+        ('get_mainline_fields', read_main_lines, main_lines),
+        ('actual/target utterance', extract_actual_target, utterances),
+        ('CHATUtteranceCleaner.clean', clean_utterances, utterances),
+        ('CHATWordCleaner.clean', clean_words, cleaned),
+        ('CHATCleaner.clean_word', clean_words_memoized, cleaned),
+    ]
+
+    print(f'{len(utterances)} utterances, '
+          f'best of {args.repeat} x {args.number} runs')
+    print()
+    print(f'{"stage":<30}{"us/utterance":>15}')
+
+    total = 0
+    timings = {}
+    for name, func, sample in stages:
+        if func is clean_words_memoized:
+            # memoized alternative to the previous stage
+            total -= timings[clean_words]
+
+        seconds = min(timeit.repeat(
+            lambda: func(sample), number=args.number, repeat=args.repeat))
+        per_utterance = seconds / args.number / len(utterances) * 1e6
+        timings[func] = per_utterance
+        total += per_utterance
+        print(f'{name:<30}{per_utterance:>15.2f}')
+
+    print(f'{"total":<30}{total:>15.2f}')
+    print()
+    print(format_cache_stats())
+
+
+if __name__ == '__main__':
+    main()
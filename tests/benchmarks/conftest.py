@@ -0,0 +1,139 @@
+"""Inputs of the benchmarks of the parsing and loading hot paths.
+
+The inputs are the test corpora of the unit tests scaled up by repeating the
+records of every session file 1, 10 and 100 times. Optionally, synthetic
+corpora of any size are generated, e.g. about 1 GB with the options
+`--synthetic-sessions 200 --synthetic-utterances 10000`.
+"""
+import configparser
+import pathlib
+import re
+import shutil
+
+import pytest
+
+from acqdiv.util.synthetic_corpora import generate
+
+resources_dir = pathlib.Path(__file__).parents[1] / 'unittests' / 'resources'
+
+# factors by which the test corpora are scaled up
+SCALES = [1, 10, 100]
+
+# first record of a Toolbox file
+toolbox_record_regex = re.compile(r'^\\(ref|u_id)\b', re.MULTILINE)
+
+
+def scale_chat(text, scale):
+    """Repeat the records of a CHAT file.
+
+    Args:
+        text (str): The CHAT file.
+        scale (int): How many times the records are repeated.
+
+    Returns:
+        str: The scaled CHAT file.
+    """
+    lines = text.rstrip('\n').split('\n')
+    start = next(i for i, line in enumerate(lines) if line.startswith('*'))
+    end = len(lines) - 1 if lines[-1] == '@End' else len(lines)
+    header, records, footer = lines[:start], lines[start:end], lines[end:]
+
+    return '\n'.join(header + records * scale + footer) + '\n'
+
+
+def scale_toolbox(text, scale):
+    """Repeat the records of a Toolbox file.
+
+    Args:
+        text (str): The Toolbox file.
+        scale (int): How many times the records are repeated.
+
+    Returns:
+        str: The scaled Toolbox file.
+    """
+    start = toolbox_record_regex.search(text).start()
+    records = text[start:].rstrip('\n') + '\n\n'
+
+    return text[:start] + records * scale
+
+
+def scale_corpora(corpora_dir, scale):
+    """Scale up the session files of the test corpora.
+
+    Args:
+        corpora_dir (pathlib.Path): Where the corpora are copied to.
+        scale (int): How many times the records are repeated.
+    """
+    shutil.copytree(str(resources_dir / 'corpora'), str(corpora_dir))
+
+    for path in corpora_dir.glob('*/*/*'):
+        if path.parent.name == 'cha':
+            scale_file = scale_chat
+        elif path.parent.name == 'toolbox':
+            scale_file = scale_toolbox
+        else:
+            continue
+
+        with open(str(path)) as f:
+            text = scale_file(f.read(), scale)
+
+        with open(str(path), 'w') as f:
+            f.write(text)
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        '--synthetic-sessions', type=int, default=0,
+        help='Number of sessions per synthetic corpus. The benchmarks of '
+             'the synthetic corpora are skipped unless given.')
+    parser.addoption(
+        '--synthetic-utterances', type=int, default=500,
+        help='Mean number of utterances per synthetic session.')
+
+
+@pytest.fixture(scope='session', params=SCALES, ids=lambda s: f'{s}x')
+def scaled_cfg_path(request, tmp_path_factory):
+    """Get the path to the config of the scaled test corpora."""
+    scale = request.param
+    tmp_dir = tmp_path_factory.mktemp(f'scale{scale}')
+    corpora_dir = tmp_dir / 'corpora'
+    db_dir = tmp_dir / 'db'
+    db_dir.mkdir()
+
+    scale_corpora(corpora_dir, scale)
+
+    cfg = configparser.ConfigParser(interpolation=None)
+    cfg.read(str(resources_dir / 'config.ini'))
+    cfg['.global']['corpora_dir'] = str(corpora_dir)
+    cfg['.global']['db_dir'] = str(db_dir)
+    cfg_path = tmp_dir / 'config.ini'
+
+    with open(str(cfg_path), 'w') as cfg_file:
+        cfg.write(cfg_file)
+
+    return str(cfg_path)
+
+
+@pytest.fixture(scope='session')
+def corpus_cfgs(scaled_cfg_path):
+    """Get the configs of the scaled corpora by section."""
+    cfg = configparser.ConfigParser(
+        interpolation=configparser.ExtendedInterpolation())
+    cfg.read(scaled_cfg_path)
+
+    return {section: dict(cfg.items(section)) for section in cfg.sections()
+            if not section.startswith('.')}
+
+
+@pytest.fixture(scope='session')
+def synthetic_cfg_path(request, tmp_path_factory):
+    """Get the path to the config of the synthetic corpora."""
+    n_sessions = request.config.getoption('--synthetic-sessions')
+    if not n_sessions:
+        pytest.skip('needs --synthetic-sessions')
+
+    n_utterances = request.config.getoption('--synthetic-utterances')
+    out_dir = tmp_path_factory.mktemp('synthetic')
+
+    return generate(str(out_dir), n_sessions=n_sessions,
+                    n_utterances=n_utterances)
@@ -0,0 +1,80 @@
+"""Benchmarks of writing the sessions to the database and of whole loads.
+
+Requires pytest-benchmark (`pip install acqdiv[benchmark]`). Run with:
+    pytest tests/benchmarks --benchmark-autosave
+
+Every run is saved as JSON to `.benchmarks/`. Compare the runs of two
+commits with e.g. `pytest-benchmark compare 0001 0002`. Every benchmark runs
+on the test corpora scaled up 1, 10 and 100 times. The loads of the synthetic
+corpora only run if `--synthetic-sessions` is given.
+"""
+import contextlib
+import io
+import itertools
+
+import pytest
+
+from acqdiv.database.processor import DBProcessor
+from acqdiv.loader import Loader
+from acqdiv.parsers.corpus_parser_mapper import CorpusParserMapper
+
+pytest.importorskip('pytest_benchmark')
+
+# rounds of the benchmarks writing a database
+ROUNDS = 3
+
+# rounds of the loads of the synthetic corpora
+SYNTHETIC_ROUNDS = 1
+
+
+@pytest.fixture(scope='session')
+def corpora(corpus_cfgs):
+    """Get the parsed scaled corpora with their sessions."""
+    corpora = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for section, data in corpus_cfgs.items():
+            corpus_parser_class = CorpusParserMapper.map(section)
+            corpus = corpus_parser_class(data, disable_pbar=True).parse()
+            corpus.sessions = list(corpus.sessions)
+            corpora.append(corpus)
+
+    return corpora
+
+
+def insert_sessions(db_processor, corpora):
+    with contextlib.redirect_stdout(io.StringIO()), db_processor.bulk_load():
+        for corpus in corpora:
+            uspeakers_dict = {}
+            for session in corpus.sessions:
+                db_processor.insert_session(
+                    session, corpus.corpus, uspeakers_dict)
+
+
+def test_insert_session(benchmark, corpora, tmp_path):
+    counter = itertools.count()
+
+    def setup():
+        db_dir = tmp_path / str(next(counter))
+        db_dir.mkdir()
+        with contextlib.redirect_stdout(io.StringIO()):
+            db_processor = DBProcessor(db_dir=str(db_dir))
+
+        return (db_processor, corpora), {}
+
+    benchmark.pedantic(insert_sessions, setup=setup, rounds=ROUNDS)
+
+
+def load(cfg_path, jobs=1):
+    with contextlib.redirect_stdout(io.StringIO()), \
+            contextlib.redirect_stderr(io.StringIO()):
+        Loader.load(cfg_path=cfg_path, jobs=jobs)
+
+
+def test_load(benchmark, scaled_cfg_path):
+    benchmark.pedantic(load, args=(scaled_cfg_path,), rounds=ROUNDS)
+
+
+@pytest.mark.parametrize('jobs', [1, 4])
+def test_load_synthetic(benchmark, synthetic_cfg_path, jobs):
+    benchmark.pedantic(load, args=(synthetic_cfg_path, jobs),
+                       rounds=SYNTHETIC_ROUNDS)
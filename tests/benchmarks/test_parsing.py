@@ -0,0 +1,78 @@
+"""Benchmarks of parsing the session files.
+
+Run with pytest-benchmark, see `tests/benchmarks/test_loading.py`.
+"""
+import configparser
+import glob
+import os
+import pathlib
+
+import pytest
+
+from acqdiv.parsers.chat.readers.fileparser import CHATFileParser
+from acqdiv.parsers.corpus_parser_mapper import CorpusParserMapper
+from acqdiv.parsers.toolbox.readers.fileparser import ToolboxFileParser
+from acqdiv.parsers.toolbox.readers.reader import ToolboxReader
+
+pytest.importorskip('pytest_benchmark')
+
+resources_dir = pathlib.Path(__file__).parents[1] / 'unittests' / 'resources'
+
+
+def get_sections():
+    """Get the corpora of the test config."""
+    cfg = configparser.ConfigParser(interpolation=None)
+    cfg.read(str(resources_dir / 'config.ini'))
+
+    return [section for section in cfg.sections()
+            if not section.startswith('.')]
+
+
+def get_session_paths(cfg_path, fmt):
+    """Get the session files of a format of all scaled corpora."""
+    corpora_dir = os.path.join(os.path.dirname(cfg_path), 'corpora')
+    ext = 'cha' if fmt == 'cha' else 'txt'
+
+    return sorted(glob.glob(os.path.join(corpora_dir, '*', fmt, f'*.{ext}')))
+
+
+def parse_chat_files(paths):
+    for path in paths:
+        with open(path) as session_file:
+            for _ in CHATFileParser.parse(session_file).records:
+                pass
+
+
+def parse_toolbox_files(paths):
+    separator = ToolboxReader.get_rec_separator()
+
+    for path in paths:
+        for _ in ToolboxFileParser.iter_parsed_records(path, separator):
+            pass
+
+
+def parse_sessions(corpus_parser, paths):
+    for path in paths:
+        corpus_parser.get_session_parser(path).parse()
+
+
+def test_chat_file_parse(benchmark, scaled_cfg_path):
+    paths = get_session_paths(scaled_cfg_path, 'cha')
+    assert paths
+    benchmark(parse_chat_files, paths)
+
+
+def test_toolbox_file_parse(benchmark, scaled_cfg_path):
+    paths = get_session_paths(scaled_cfg_path, 'toolbox')
+    assert paths
+    benchmark(parse_toolbox_files, paths)
+
+
+@pytest.mark.parametrize('section', get_sections())
+def test_session_parse(benchmark, corpus_cfgs, section):
+    corpus_parser_class = CorpusParserMapper.map(section)
+    corpus_parser = corpus_parser_class(
+        corpus_cfgs[section], disable_pbar=True)
+    paths = corpus_parser.get_session_paths()
+    assert paths
+    benchmark(parse_sessions, corpus_parser, paths)
@@ -1,9 +1,11 @@
 import acqdiv
 import unittest
 import io
-from acqdiv.parsers.chat.parser import *
+import os
+from acqdiv.parsers.chat.parser import CHATParser
 from acqdiv.parsers.chat.readers.reader import CHATReader
-from acqdiv.parsers.chat.cleaners.cleaner import *
+from acqdiv.model.speaker import Speaker
+from acqdiv.parsers.chat.cleaners.cleaner import CHATCleaner
 
 
 class TestCHATParser(unittest.TestCase):
@@ -25,6 +27,21 @@ class TestCHATParser(unittest.TestCase):
         actual_cleaner = CHATParser.get_cleaner()
         self.assertTrue(isinstance(actual_cleaner, CHATCleaner))
 
+    def test_parse_session_file_closed(self):
+        """Test that parse opens and closes the session file. (CHATParser)"""
+        parser = CHATParser(self.dummy_cha_path)
+        self.assertIsNone(parser.session_file)
+        parser.parse()
+        self.assertTrue(parser.session_file.closed)
+
+    def test_parse_stream_session_file_closed(self):
+        """Test parse closes the file once streamed. (CHATParser)"""
+        parser = CHATParser(self.dummy_cha_path)
+        session = parser.parse(stream=True)
+        self.assertFalse(parser.session_file.closed)
+        list(session.utterances)
+        self.assertTrue(parser.session_file.closed)
+
     def test_get_session_metadata(self):
         """Test get_session_metadata with TestCHATParser.cha. (CHATParser)"""
         session = (
@@ -50,6 +67,42 @@ class TestCHATParser(unittest.TestCase):
 
         assert oracle
 
+    def test_get_speaker(self):
+        """Test get_speaker with speakers sharing a label. (CHATParser)"""
+        speakers = [Speaker(), Speaker(), Speaker()]
+        for speaker, label in zip(speakers, ['MOT', 'CHI', 'MOT']):
+            speaker.code = label
+        parser = CHATParser(self.dummy_cha_path)
+        parser.index_speakers(speakers)
+        actual_output = [parser.get_speaker(label)
+                         for label in ['MOT', 'CHI', 'FAT']]
+        desired_output = [speakers[0], speakers[1], None]
+        self.assertEqual(actual_output, desired_output)
+
+    def test_parse_utterance_speakers(self):
+        """Test parse for the speaker and addressee. (CHATParser)"""
+        session = (
+            '@UTF8\n'
+            '@Begin\n'
+            '@Participants:\tMEM Mme_Manyili Grandmother , '
+            'CHI Hlobohang Target_Child\n'
+            '@ID:\tsme|Sesotho|MEM||female|||Grandmother|||\n'
+            '@ID:\tsme|Sesotho|CHI|2;2.||||Target_Child|||\n'
+            '*MEM:\tke eng ?\n'
+            '%add:\tCHI\n'
+            '*CHI:\tke ntho .\n'
+            '@End'
+        )
+        parser = CHATParser(self.dummy_cha_path)
+        parser.reader = CHATReader(io.StringIO(session))
+
+        session = parser.parse()
+        actual_output = [(utt.speaker.code,
+                          utt.addressee.code if utt.addressee else None)
+                         for utt in session.utterances]
+        desired_output = [('MEM', 'CHI'), ('CHI', None)]
+        self.assertEqual(actual_output, desired_output)
+
     def test_next_speaker(self):
         """Test next_speaker with test.cha. (CHATParser)"""
         session = (
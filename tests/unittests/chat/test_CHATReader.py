@@ -307,25 +307,69 @@ class TestCHATReader(unittest.TestCase):
         desired_output = ''
         self.assertEqual(actual_output, desired_output)
 
-    # ---------- replace_line_breaks ----------
+    # ---------- iter_lines ----------
 
-    def test_replace_line_breaks_single(self):
-        """Test replace_line_breaks for single line break."""
+    def test_iter_lines_single_line_break(self):
+        """Test iter_lines for single line break."""
         input_str = 'n^name ij\n\tsm2s-t^p_v^leave-m^s.'
-        actual_output = CHATFileParser._replace_line_breaks(input_str)
-        desired_output = 'n^name ij sm2s-t^p_v^leave-m^s.'
+        actual_output = list(CHATFileParser.iter_lines(io.StringIO(input_str)))
+        desired_output = ['n^name ij sm2s-t^p_v^leave-m^s.']
         self.assertEqual(actual_output, desired_output)
 
-    def test_replace_line_breaks_multiple(self):
-        """Test replace_line_breaks for two following linebreaks."""
+    def test_iter_lines_multiple_line_breaks(self):
+        """Test iter_lines for two following linebreaks."""
         input_str = 'n^name ij sm2s-t^p_v^leave-m^s n^name\n\t' \
                     'sm1-t^p-v^play-m^s pr house(9 , 10/6)/lc ' \
                     'sm1-t^p-v^chat-m^s\n\tcj n^name .'
-        actual_output = CHATFileParser._replace_line_breaks(input_str)
-        desired_output = 'n^name ij sm2s-t^p_v^leave-m^s n^name ' \
-                         'sm1-t^p-v^play-m^s pr house(9 , 10/6)/lc ' \
-                         'sm1-t^p-v^chat-m^s cj n^name .'
-        self.assertEqual(actual_output, desired_output)
+        actual_output = list(CHATFileParser.iter_lines(io.StringIO(input_str)))
+        desired_output = ['n^name ij sm2s-t^p_v^leave-m^s n^name '
+                          'sm1-t^p-v^play-m^s pr house(9 , 10/6)/lc '
+                          'sm1-t^p-v^chat-m^s cj n^name .']
+        self.assertEqual(actual_output, desired_output)
+
+    def test_iter_lines_multiple_lines(self):
+        """Test iter_lines for lines with and without line breaks."""
+        input_str = '@Begin\n*CHI:\tfoo\n\tbar .\n%gls:\tfoo bar .\n@End\n'
+        actual_output = list(CHATFileParser.iter_lines(io.StringIO(input_str)))
+        desired_output = ['@Begin', '*CHI:\tfoo bar .', '%gls:\tfoo bar .',
+                          '@End']
+        self.assertEqual(actual_output, desired_output)
+
+    # ---------- parse ----------
+
+    def test_parse_records_read_lazily(self):
+        """Test parse that records are only read when iterated."""
+        session = io.StringIO(
+            '@Begin\n@Date:\t12-SEP-1997\n*CHI:\tfoo .\n'
+            '*MOT:\tbar .\n%eng:\tbar\n@End\n')
+        chat = CHATFileParser.parse(session)
+        self.assertEqual(chat.date, '12-SEP-1997')
+        session.close()
+        with self.assertRaises(ValueError):
+            list(chat.records)
+
+    def test_parse_records(self):
+        """Test parse for the records."""
+        session = io.StringIO(
+            '@Begin\n@Date:\t12-SEP-1997\n*CHI:\tfoo .\n'
+            '*MOT:\tbar .\n%eng:\tbar\n@End\n')
+        chat = CHATFileParser.parse(session)
+        actual_output = [(rec.uid, rec.participant_code, rec.utterance,
+                          rec.dependent_tiers) for rec in chat.records]
+        desired_output = [(0, 'CHI', 'foo .', {}),
+                          (1, 'MOT', 'bar .', {'eng': 'bar'})]
+        self.assertEqual(actual_output, desired_output)
+
+    def test_parse_metadata_after_first_main_line(self):
+        """Test parse that metadata fields after the first record are ignored.
+        """
+        session = io.StringIO(
+            '@Begin\n@Date:\t12-SEP-1997\n*CHI:\tfoo .\n'
+            '@New Episode\n@Date:\t13-SEP-1997\n*MOT:\tbar .\n@End\n')
+        chat = CHATFileParser.parse(session)
+        self.assertEqual(chat.date, '12-SEP-1997')
+        actual_output = [rec.utterance for rec in chat.records]
+        self.assertEqual(actual_output, ['foo .', 'bar .'])
 
     # ---------- iter_records ----------
 
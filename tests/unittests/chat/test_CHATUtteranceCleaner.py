@@ -1,10 +1,67 @@
+import random
 import unittest
+from pathlib import Path
+
 from acqdiv.parsers.chat.cleaners.utterance_cleaner \
     import CHATUtteranceCleaner
+from acqdiv.parsers.chat.readers.fileparser import CHATFileParser
+
+# tokens covering the codings handled by the cleaning methods
+CODING_TOKENS = [
+    'dog', 'a0b', '0', '0the', '0[=! points]', 'xxx', 'yyy', 'www', '???',
+    '&=laughs', '&uh', '&-um', '[x 3]', '<', '>', '<a b>', '[: ball]',
+    '[/]', '[//]', '[*]', '[=! cries]', '[+ bch]', '(.)', '(..)', '(...)',
+    '(', ')', 'ba(ll)', '↓', '↑', '‡', '„', '“', '”', ',', ':', ';', '+<',
+    '+"', '+^', '+,', '+', '.', '?', '!', '+//.', '+...', '"', '@s:eng',
+    'dog@f', ' ', '  ', '\t', '[', ']',
+]
+
+
+def iter_test_utterances():
+    """Iter the utterances of all CHAT files of the unit tests."""
+    unittests_dir = Path(__file__).parents[1]
+    for path in sorted(unittests_dir.glob('**/*.cha')):
+        with open(path) as f:
+            for rec in CHATFileParser.iter_records(f.read()):
+                main_line = CHATFileParser.get_mainline(rec)
+                yield CHATFileParser.get_mainline_fields(main_line)[1]
+
+
+def iter_random_utterances(n):
+    """Iter random utterances combining the coding tokens."""
+    rand = random.Random(0)
+    for _ in range(n):
+        tokens = rand.choices(CODING_TOKENS, k=rand.randint(1, 12))
+        yield rand.choice(['', ' ']).join(tokens)
 
 
 class TestCHATUtteranceCleaner(unittest.TestCase):
-    
+
+    # Tests for the clean-method.
+
+    def test_clean_identical_to_stepwise_test_corpora(self):
+        """Test clean against clean_stepwise for the test corpora."""
+        utterances = list(iter_test_utterances())
+        self.assertTrue(utterances)
+        for utterance in utterances:
+            self.assertEqual(CHATUtteranceCleaner.clean(utterance),
+                             CHATUtteranceCleaner.clean_stepwise(utterance))
+
+    def test_clean_identical_to_stepwise_random(self):
+        """Test clean against clean_stepwise for random codings."""
+        for utterance in iter_random_utterances(20000):
+            self.assertEqual(CHATUtteranceCleaner.clean(utterance),
+                             CHATUtteranceCleaner.clean_stepwise(utterance),
+                             msg=repr(utterance))
+
+    def test_clean(self):
+        """Test clean for an utterance with several codings."""
+        utterance = ('&=laughs <that is> [/] ‡ xxx you want 0the [*] '
+                     'more [x 2] (.) , ball [: ball] ! [+ bch]')
+        actual_output = CHATUtteranceCleaner.clean(utterance)
+        desired_output = 'that is ??? you want more more ball'
+        self.assertEqual(actual_output, desired_output)
+
     # Tests for the remove_redundant_whitespace-method.
 
     def test_remove_redundant_whitespace_leading_trailing_whitespace(self):
@@ -76,3 +76,30 @@ class TestYucatecParser(unittest.TestCase):
         assert (False not in utt_list
                 and False not in words_list
                 and False not in morpheme_list)
+
+    def test_parse_childdirected_secondary_target_child(self):
+        """Test parse for utterances to a demoted target child. (Yucatec)"""
+        session_str = (
+            '@UTF8\n'
+            '@Begin\n'
+            '@Participants:\tLOR Lorena Target_Child , '
+            'ARM Armando Target_Child , MOT Susanne Mother\n'
+            '@ID:\tyua|yucatec|LOR|||||Target_Child|||\n'
+            '@ID:\tyua|yucatec|ARM|||||Target_Child|||\n'
+            '@ID:\tyua|yucatec|MOT||female|||Mother|||\n'
+            '*MOT:\tbaʼax .\n'
+            '%add:\tARM\n'
+            '*MOT:\tbaʼax .\n'
+            '%add:\tLOR\n'
+            '@End'
+        )
+        parser = YucatecSessionParser(self.dummy_cha_path)
+        parser.session_filename = 'LOR.cha'
+        parser.reader = YucatecReader(io.StringIO(session_str))
+        session = parser.parse(stream=True)
+
+        actual_output = [utt.childdirected for utt in session.utterances]
+        self.assertEqual(actual_output, [True, True])
+        actual_output = [speaker.macro_role for speaker in session.speakers]
+        desired_output = ['Target_Child', 'Child', 'Adult']
+        self.assertEqual(actual_output, desired_output)
@@ -0,0 +1,120 @@
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from acqdiv.parsers.corpora.main.english.corpus_parser \
+    import EnglishCorpusParser
+
+
+def session2tuple(session):
+    """Get the parsed data of a session as a comparable tuple."""
+    speakers = tuple(
+        tuple(sorted((k, getattr(sp, k)) for k in sp.__slots__
+                     if k != 'uniquespeaker'))
+        for sp in session.speakers)
+    utterances = tuple(
+        (utt.source_id, utt.utterance, utt.morpheme, utt.gloss, utt.pos,
+         utt.speaker.code if utt.speaker else None,
+         tuple(w.word for w in utt.words),
+         tuple(tuple(m.gloss for m in wm) for wm in utt.morphemes))
+        for utt in session.utterances)
+
+    return session.source_id, speakers, utterances
+
+
+class CorpusParserTest(unittest.TestCase):
+
+    english_cha = Path(__file__).parent.joinpath(
+        'resources', 'corpora', 'English_Manchester1', 'cha', 'English.cha')
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+        # several sessions sharing the same speakers
+        for name in ['c', 'a', 'd', 'b']:
+            shutil.copy(str(self.english_cha),
+                        os.path.join(self.tmp_dir.name, f'{name}.cha'))
+
+        self.cfg = {
+            'iso639-3': 'eng',
+            'glottolog_code': 'stan1293',
+            'corpus': 'English_Manchester1',
+            'language': 'English',
+            'owner': 'Elena Lieven',
+            'acronym': 'EMC',
+            'name': 'English Manchester Corpus',
+            'license': 'CC BY-NC-SA 3.0',
+            'format': 'cha',
+            'sessions': os.path.join(self.tmp_dir.name, '*.cha'),
+        }
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_iter_sessions_parallel_identical_to_serial(self):
+        serial = list(EnglishCorpusParser(
+            self.cfg, disable_pbar=True).parse().sessions)
+        parallel = list(EnglishCorpusParser(
+            self.cfg, disable_pbar=True, jobs=2).parse().sessions)
+        self.assertEqual(
+            [session2tuple(s) for s in serial],
+            [session2tuple(s) for s in parallel])
+
+    def test_iter_sessions_parallel_sorted(self):
+        sessions = EnglishCorpusParser(
+            self.cfg, disable_pbar=True, jobs=2).parse().sessions
+        actual_output = [session.source_id for session in sessions]
+        desired_output = ['a', 'b', 'c', 'd']
+        self.assertEqual(actual_output, desired_output)
+
+    def test_iter_sessions_parallel_shared_uniquespeakers(self):
+        sessions = list(EnglishCorpusParser(
+            self.cfg, disable_pbar=True, jobs=2).parse().sessions)
+        uspeakers = {id(sp.uniquespeaker)
+                     for session in sessions for sp in session.speakers}
+        self.assertEqual(len(uspeakers), len(sessions[0].speakers))
+
+    def test_iter_sessions_streamed_identical_to_eager(self):
+        eager = list(EnglishCorpusParser(
+            self.cfg, disable_pbar=True).parse().sessions)
+        streamed = list(EnglishCorpusParser(
+            self.cfg, disable_pbar=True, stream=True).parse().sessions)
+        self.assertFalse(
+            any(isinstance(s.utterances, list) for s in streamed))
+        self.assertEqual(
+            [session2tuple(s) for s in eager],
+            [session2tuple(s) for s in streamed])
+
+    def test_iter_sessions_cached_identical_to_uncached(self):
+        cache_dir = os.path.join(self.tmp_dir.name, 'cache')
+        uncached = list(EnglishCorpusParser(
+            self.cfg, disable_pbar=True).parse().sessions)
+        list(EnglishCorpusParser(
+            self.cfg, disable_pbar=True, cache_dir=cache_dir).parse().sessions)
+        cached = list(EnglishCorpusParser(
+            self.cfg, disable_pbar=True, cache_dir=cache_dir).parse().sessions)
+
+        self.assertEqual(len(os.listdir(cache_dir)), 4)
+        self.assertEqual(
+            [session2tuple(s) for s in uncached],
+            [session2tuple(s) for s in cached])
+        self.assertEqual(
+            [os.path.basename(s.path) for s in cached],
+            ['a.cha', 'b.cha', 'c.cha', 'd.cha'])
+
+    def test_parse_session_cached(self):
+        cache_dir = os.path.join(self.tmp_dir.name, 'cache')
+        session_path = os.path.join(self.tmp_dir.name, 'a.cha')
+        parser = EnglishCorpusParser(self.cfg, cache_dir=cache_dir)
+        parser.parse_session(session_path)
+
+        # the session file is not read again
+        parser.parse_session_file = None
+        session = parser.parse_session(session_path)
+        self.assertEqual(session.source_id, 'a')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,187 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+from unittest import mock
+
+import sqlalchemy as sa
+
+from acqdiv.database.processor import DBProcessor
+from acqdiv.model.corpus import Corpus
+from acqdiv.model.morpheme import Morpheme
+from acqdiv.model.session import Session
+from acqdiv.model.speaker import Speaker
+from acqdiv.model.utterance import Utterance
+from acqdiv.model.word import Word
+from acqdiv.util.uniquespeaker import set_unique_speakers
+
+
+def get_corpus(n_sessions=2):
+    """Get a corpus whose utterances have two words with two morphemes."""
+    corpus = Corpus()
+    corpus.corpus = 'Test'
+    corpus.license = 'private'
+    corpus.format = 'cha'
+
+    for i in range(n_sessions):
+        session = Session()
+        session.source_id = f'session_{i}'
+
+        speaker = Speaker()
+        speaker.code = 'CHI'
+        session.speakers.append(speaker)
+        set_unique_speakers(corpus.corpus, session.speakers)
+
+        for j in range(3):
+            utt = Utterance()
+            utt.source_id = f'session_{i}_{j}'
+            utt.speaker = speaker
+            for k in range(2):
+                word = Word()
+                word.word = f'w{k}'
+                utt.words.append(word)
+                morphemes = []
+                for seg in ['a', 'b']:
+                    morpheme = Morpheme()
+                    morpheme.morpheme = seg
+                    morphemes.append(morpheme)
+                utt.morphemes.append(morphemes)
+            session.utterances.append(utt)
+
+        corpus.sessions.append(session)
+
+    return corpus
+
+
+class DBProcessorTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.processor = DBProcessor(self.tmp_dir.name)
+        self.processor.insert_corpus(get_corpus())
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def query(self, sql):
+        with self.processor.engine.connect() as conn:
+            return conn.execute(sql).fetchall()
+
+    def test_insert_utterances_ids(self):
+        actual_output = self.query(
+            'SELECT id, session_id_fk FROM utterances ORDER BY id')
+        desired_output = [(1, 1), (2, 1), (3, 1), (4, 2), (5, 2), (6, 2)]
+        self.assertEqual(actual_output, desired_output)
+
+    def test_insert_words_linked_to_utterances(self):
+        actual_output = self.query(
+            'SELECT id, utterance_id_fk FROM words ORDER BY id')[-2:]
+        desired_output = [(11, 6), (12, 6)]
+        self.assertEqual(actual_output, desired_output)
+
+    def test_insert_morphemes_linked_to_words(self):
+        actual_output = self.query(
+            'SELECT id, utterance_id_fk, word_id_fk, morpheme '
+            'FROM morphemes ORDER BY id')[-4:]
+        desired_output = [(21, 6, 11, 'a'), (22, 6, 11, 'b'),
+                          (23, 6, 12, 'a'), (24, 6, 12, 'b')]
+        self.assertEqual(actual_output, desired_output)
+
+    def test_insert_uniquespeakers_shared(self):
+        actual_output = self.query(
+            'SELECT uniquespeaker_id_fk FROM speakers ORDER BY id')
+        desired_output = [(1,), (1,)]
+        self.assertEqual(actual_output, desired_output)
+
+    def get_bulk_processor(self):
+        db_dir = os.path.join(self.tmp_dir.name, 'bulk')
+        os.makedirs(db_dir)
+
+        return DBProcessor(db_dir)
+
+    def test_bulk_load_identical(self):
+        processor = self.get_bulk_processor()
+        with processor.bulk_load(checkpoint_interval=1):
+            processor.insert_corpus(get_corpus())
+
+        for table in ['sessions', 'speakers', 'uniquespeakers', 'utterances',
+                      'words', 'morphemes']:
+            with processor.engine.connect() as conn:
+                bulk = conn.execute(f'SELECT * FROM {table}').fetchall()
+            self.assertEqual(self.query(f'SELECT * FROM {table}'), bulk)
+
+    def test_bulk_load_committed_at_checkpoints(self):
+        processor = self.get_bulk_processor()
+        with self.assertRaises(KeyboardInterrupt):
+            with processor.bulk_load(checkpoint_interval=2):
+                processor.insert_corpus(get_corpus(n_sessions=5))
+                raise KeyboardInterrupt
+
+        with processor.engine.connect() as conn:
+            actual_output = conn.execute(
+                'SELECT source_id FROM sessions ORDER BY id').fetchall()
+        desired_output = [(f'session_{i}',) for i in range(4)]
+        self.assertEqual(actual_output, desired_output)
+
+    def test_bulk_load_safe_pragmas_after_failure(self):
+        processor = self.get_bulk_processor()
+        statements = []
+        sa.event.listen(
+            processor.engine, 'before_cursor_execute',
+            lambda conn, cursor, statement, *args: statements.append(
+                statement))
+
+        with self.assertRaises(KeyboardInterrupt):
+            with processor.bulk_load():
+                raise KeyboardInterrupt
+
+        actual_output = statements[-len(DBProcessor.safe_pragmas):]
+        desired_output = [
+            f'PRAGMA {pragma}' for pragma in DBProcessor.safe_pragmas]
+        self.assertEqual(actual_output, desired_output)
+
+    def test_create_indexes(self):
+        self.processor.create_indexes()
+        self.processor.create_indexes()
+        indexes = [row[0] for row in self.query(
+            "SELECT name FROM sqlite_master WHERE type = 'index'")]
+        self.assertIn('ix_words_utterance_id_fk', indexes)
+        self.assertIn('ix_morphemes_word_id_fk', indexes)
+
+    def test_create_indexes_analyze(self):
+        self.processor.create_indexes()
+        actual_output = self.query(
+            "SELECT stat FROM sqlite_stat1 "
+            "WHERE idx = 'ix_utterances_session_id_fk'")
+        desired_output = [('6 3',)]
+        self.assertEqual(actual_output, desired_output)
+
+    def test_create_indexes_used_by_view(self):
+        self.processor.create_indexes()
+        plan = ' '.join(row[-1] for row in self.query(
+            'EXPLAIN QUERY PLAN SELECT * FROM v_all_data'))
+        self.assertIn('ix_words_utterance_id_fk', plan)
+        self.assertIn('ix_morphemes_word_id_fk', plan)
+
+    def test_get_engine_views_created_in_process(self):
+        db_dir = os.path.join(self.tmp_dir.name, 'no_cli')
+        os.makedirs(db_dir)
+        # no sqlite3 command-line tool
+        with mock.patch.dict(os.environ, {'PATH': ''}):
+            engine = DBProcessor.get_engine(db_dir)
+        with engine.connect() as conn:
+            actual_output = conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'view'").fetchall()
+        desired_output = [('v_all_data',)]
+        self.assertEqual(actual_output, desired_output)
+
+    def test_create_views_error(self):
+        with self.processor.engine.connect() as conn:
+            with mock.patch('builtins.open', mock.mock_open(
+                    read_data='CREATE VIEW v AS SELEC 1;')):
+                with self.assertRaises(sqlite3.Error):
+                    DBProcessor.create_views(conn)
+
+
+if __name__ == '__main__':
+    unittest.main()
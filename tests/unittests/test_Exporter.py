@@ -0,0 +1,116 @@
+import configparser
+import contextlib
+import glob
+import io
+import os
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from acqdiv.exporter import Exporter
+from acqdiv.loader import Loader
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:
+    pq = None
+
+
+@unittest.skipIf(pq is None, 'pyarrow is not installed')
+class ExporterTest(unittest.TestCase):
+
+    resources_dir = Path(__file__).parent / 'resources'
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp_dir = tempfile.TemporaryDirectory()
+        db_dir = os.path.join(cls.tmp_dir.name, 'db')
+        os.makedirs(db_dir)
+
+        cfg = configparser.ConfigParser(interpolation=None)
+        cfg.read(cls.resources_dir / 'config.ini')
+        cfg['.global']['corpora_dir'] = str(cls.resources_dir / 'corpora')
+        cfg['.global']['db_dir'] = db_dir
+        cls.cfg_path = os.path.join(cls.tmp_dir.name, 'config.ini')
+        with open(cls.cfg_path, 'w') as cfg_file:
+            cfg.write(cfg_file)
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            Loader.load(cfg_path=cls.cfg_path)
+
+        cls.db_path = glob.glob(os.path.join(db_dir, '*.sqlite3'))[0]
+        cls.out_dir = os.path.join(cls.tmp_dir.name, 'parquet')
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            Exporter.export(cfg_path=cls.cfg_path, out_dir=cls.out_dir)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp_dir.cleanup()
+
+    def read_parquet(self, table):
+        """Get the rows of all corpus files of a table."""
+        rows = []
+        for path in sorted(
+                glob.glob(os.path.join(self.out_dir, table, '*.parquet'))):
+            pydict = pq.read_table(path).to_pydict()
+            rows.extend(zip(*pydict.values()))
+
+        return rows
+
+    def read_sqlite(self, query):
+        conn = sqlite3.connect(self.db_path)
+        rows = conn.execute(query).fetchall()
+        conn.close()
+
+        return rows
+
+    def test_export_tables(self):
+        for table in ['corpora', 'sessions', 'speakers', 'uniquespeakers',
+                      'utterances', 'words', 'morphemes']:
+            actual_output = sorted(self.read_parquet(table), key=str)
+            desired_output = sorted(
+                self.read_sqlite(f'SELECT * FROM {table}'), key=str)
+            self.assertTrue(actual_output)
+            self.assertEqual(actual_output, desired_output)
+
+    def test_export_all_data(self):
+        actual_output = self.read_parquet('all_data')
+        desired_output = self.read_sqlite(
+            'SELECT * FROM v_all_data ORDER BY corpus, session_id, '
+            'utterance_id, word_id, morpheme_id')
+        self.assertEqual(actual_output, desired_output)
+
+    def test_export_partitioned_by_corpus(self):
+        actual_output = sorted(os.path.basename(path) for path in glob.glob(
+            os.path.join(self.out_dir, 'morphemes', '*.parquet')))
+        desired_output = sorted(f'{row[0]}.parquet' for row in
+                                self.read_sqlite('SELECT id FROM corpora'))
+        self.assertEqual(actual_output, desired_output)
+
+    def test_export_dictionary_encoded(self):
+        path = os.path.join(
+            self.out_dir, 'morphemes', 'English_Manchester1.parquet')
+        schema = pq.read_schema(path)
+        self.assertEqual(str(schema.field('gloss').type),
+                         'dictionary<values=string, indices=int32, '
+                         'ordered=0>')
+        self.assertEqual(str(schema.field('morpheme').type), 'string')
+
+    def test_export_batches(self):
+        out_dir = os.path.join(self.tmp_dir.name, 'batches')
+        with contextlib.redirect_stdout(io.StringIO()), \
+                mock.patch.object(Exporter, 'batch_size', 2):
+            Exporter.export(db_path=self.db_path, out_dir=out_dir)
+        path = os.path.join(out_dir, 'morphemes', 'Chintang.parquet')
+        parquet_file = pq.ParquetFile(path)
+        self.assertGreater(parquet_file.num_row_groups, 1)
+        self.assertEqual(parquet_file.read().num_rows,
+                         pq.read_table(path.replace('batches',
+                                                    'parquet')).num_rows)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,330 @@
+import configparser
+import glob
+import json
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from acqdiv.database.processor import DBProcessor
+from acqdiv.loader import Loader
+from acqdiv.util.memoization import get_cache_stats
+
+
+def get_database_path(db_dir):
+    """Get the path to the most recent database in `db_dir`."""
+    paths = glob.glob(os.path.join(db_dir, 'acqdiv_corpus_*.sqlite3'))
+    return sorted(paths)[-1]
+
+
+def dump_database(db_dir):
+    """Get all rows of all tables of the database in `db_dir`."""
+    conn = sqlite3.connect(get_database_path(db_dir))
+    tables = [row[0] for row in conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'table' ORDER BY name")]
+    dump = {
+        table: conn.execute(f'SELECT * FROM {table} ORDER BY rowid').fetchall()
+        for table in tables
+    }
+    conn.close()
+
+    return dump
+
+
+def dump_utterances(db_dir):
+    """Get the utterances with words and morphemes, ignoring their IDs."""
+    conn = sqlite3.connect(get_database_path(db_dir))
+    dump = conn.execute(
+        'SELECT sessions.corpus, sessions.source_id, utterances.source_id, '
+        'utterances.utterance, speakers.role, uniquespeakers.id, '
+        '(SELECT group_concat(word) FROM words '
+        ' WHERE utterance_id_fk = utterances.id), '
+        '(SELECT group_concat(gloss) FROM morphemes '
+        ' WHERE utterance_id_fk = utterances.id) '
+        'FROM utterances '
+        'JOIN sessions ON utterances.session_id_fk = sessions.id '
+        'LEFT JOIN speakers ON utterances.speaker_id_fk = speakers.id '
+        'LEFT JOIN uniquespeakers '
+        'ON speakers.uniquespeaker_id_fk = uniquespeakers.id '
+        'ORDER BY sessions.corpus, sessions.source_id, utterances.id'
+    ).fetchall()
+    conn.close()
+
+    return dump
+
+
+def dump_all_data(db_dir):
+    """Get the rows of the table `all_data` and the view `v_all_data`."""
+    conn = sqlite3.connect(get_database_path(db_dir))
+    dump = [conn.execute(
+        f'SELECT * FROM {table} '
+        f'ORDER BY session_id, utterance_id, word_id, morpheme_id').fetchall()
+        for table in ['all_data', 'v_all_data']]
+    conn.close()
+
+    return dump
+
+
+def dump_words_morphemes(db_dir):
+    """Get the rows of words, morphemes and `v_all_data`."""
+    conn = sqlite3.connect(get_database_path(db_dir))
+    dump = [conn.execute(f'SELECT * FROM {table} ORDER BY id').fetchall()
+            for table in ['words', 'morphemes']]
+    dump.append(conn.execute('SELECT * FROM v_all_data').fetchall())
+    conn.close()
+
+    return dump
+
+
+class LoaderTest(unittest.TestCase):
+
+    resources_dir = Path(__file__).parent / 'resources'
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def write_cfg(self, db_dir, corpora_dir=None):
+        """Write the test config with the test corpora and `db_dir`."""
+        if corpora_dir is None:
+            corpora_dir = str(self.resources_dir / 'corpora')
+
+        cfg = configparser.ConfigParser(interpolation=None)
+        cfg.read(self.resources_dir / 'config.ini')
+        cfg['.global']['corpora_dir'] = corpora_dir
+        cfg['.global']['db_dir'] = db_dir
+        cfg_path = os.path.join(self.tmp_dir.name, 'config.ini')
+
+        with open(cfg_path, 'w') as cfg_file:
+            cfg.write(cfg_file)
+
+        return cfg_path
+
+    def load(self, name, corpora_dir=None, **kwargs):
+        db_dir = os.path.join(self.tmp_dir.name, name)
+        os.makedirs(db_dir, exist_ok=True)
+        Loader.load(cfg_path=self.write_cfg(db_dir, corpora_dir), **kwargs)
+
+        return dump_database(db_dir)
+
+    def copy_corpora(self):
+        """Copy the test corpora adding a second English session."""
+        corpora_dir = os.path.join(self.tmp_dir.name, 'corpora')
+        shutil.copytree(str(self.resources_dir / 'corpora'), corpora_dir)
+        self.english_dir = os.path.join(
+            corpora_dir, 'English_Manchester1', 'cha')
+        shutil.copy(os.path.join(self.english_dir, 'English.cha'),
+                    os.path.join(self.english_dir, 'English2.cha'))
+
+        return corpora_dir
+
+    def test_load_parallel_identical_to_serial(self):
+        serial = self.load('serial')
+        parallel = self.load('parallel', jobs=3)
+        self.assertTrue(serial['utterances'])
+        self.assertEqual(serial, parallel)
+
+    def test_load_parallel_cache_stats(self):
+        calls = []
+        for db_name, kwargs in [
+                ('serial', {}),
+                ('parallel', {'jobs': 3}),
+                ('parallel_sessions', {'jobs': 2, 'parallel_sessions': True})]:
+            self.load(db_name, **kwargs)
+            calls.append({name: stats.hits + stats.misses
+                          for name, stats in get_cache_stats().items()})
+
+        self.assertTrue(calls[0])
+        self.assertEqual(calls[0], calls[1])
+        self.assertEqual(calls[0], calls[2])
+
+    def test_load_parallel_sessions_identical_to_serial(self):
+        serial = self.load('serial')
+        parallel = self.load('parallel', jobs=2, parallel_sessions=True)
+        self.assertEqual(serial, parallel)
+
+    def test_load_utterance_batches(self):
+        desired_output = self.load('db')
+        with mock.patch.object(DBProcessor, 'utterance_batch_size', 2):
+            actual_output = self.load('batches')
+        self.assertEqual(actual_output, desired_output)
+
+    def test_load_profile(self):
+        desired_output = self.load('db')
+        profile_dir = os.path.join(self.tmp_dir.name, 'profile')
+        actual_output = self.load(
+            'profiled', profile_dir=profile_dir, cprofile=True)
+        self.assertEqual(actual_output, desired_output)
+
+        with open(os.path.join(profile_dir, 'profile.json')) as json_file:
+            report = json.load(json_file)
+
+        corpora = report['corpora']
+        self.assertEqual(sorted(corpora), sorted(
+            row[0] for row in desired_output['corpora']))
+        self.assertTrue({'read', 'split', 'reader', 'cleaner', 'alignment',
+                         'parse', 'insert'}.issubset(
+            corpora['Cree']['stages']))
+        self.assertTrue(os.path.isfile(
+            os.path.join(profile_dir, 'Cree.prof')))
+        self.assertTrue(os.path.isfile(
+            os.path.join(profile_dir, 'profile.csv')))
+
+    def test_load_incremental_unchanged(self):
+        corpora_dir = self.copy_corpora()
+        full = self.load('db', corpora_dir)
+        incremental = self.load('db', corpora_dir, incremental=True)
+        self.assertEqual(full, incremental)
+
+    def test_load_incremental_changed_session(self):
+        corpora_dir = self.copy_corpora()
+        self.load('db', corpora_dir)
+
+        english2_path = os.path.join(self.english_dir, 'English2.cha')
+        with open(english2_path) as f:
+            cha = f.read().replace('too big', 'too small')
+        with open(english2_path, 'w') as f:
+            f.write(cha)
+
+        incremental = self.load('db', corpora_dir, incremental=True)
+        full = self.load('full', corpora_dir)
+        self.assertEqual(
+            dump_utterances(os.path.join(self.tmp_dir.name, 'db')),
+            dump_utterances(os.path.join(self.tmp_dir.name, 'full')))
+        for table in ['corpora', 'sessions', 'uniquespeakers']:
+            self.assertEqual(full[table], incremental[table])
+        self.assertEqual(
+            sorted(full['manifest']), sorted(incremental['manifest']))
+
+    def test_load_incremental_changed_metadata(self):
+        corpora_dir = self.copy_corpora()
+        before = self.load('db', corpora_dir)
+
+        imdi_path = os.path.join(corpora_dir, 'Qaqet', 'imdi', 'Qaqet.imdi')
+        with open(imdi_path) as f:
+            imdi = f.read().replace(
+                '<Date>session date</Date>', '<Date>2001-04-07</Date>')
+        with open(imdi_path, 'w') as f:
+            f.write(imdi)
+
+        incremental = self.load('db', corpora_dir, incremental=True)
+        full = self.load('full', corpora_dir)
+        self.assertNotEqual(before['sessions'], incremental['sessions'])
+        self.assertEqual(
+            dump_utterances(os.path.join(self.tmp_dir.name, 'db')),
+            dump_utterances(os.path.join(self.tmp_dir.name, 'full')))
+        for table in ['corpora', 'sessions', 'uniquespeakers']:
+            self.assertEqual(full[table], incremental[table])
+        self.assertEqual(
+            sorted(full['manifest']), sorted(incremental['manifest']))
+
+    def test_load_incremental_removed_session(self):
+        corpora_dir = self.copy_corpora()
+        self.load('db', corpora_dir)
+        os.remove(os.path.join(self.english_dir, 'English2.cha'))
+
+        incremental = self.load('db', corpora_dir, incremental=True)
+        full = self.load('full', corpora_dir)
+        self.assertEqual(
+            dump_utterances(os.path.join(self.tmp_dir.name, 'db')),
+            dump_utterances(os.path.join(self.tmp_dir.name, 'full')))
+        for table in ['corpora', 'uniquespeakers']:
+            self.assertEqual(full[table], incremental[table])
+        self.assertEqual(
+            sorted(row[2] for row in full['sessions']),
+            sorted(row[2] for row in incremental['sessions']))
+        self.assertEqual(
+            sorted(row[0] for row in full['manifest']),
+            sorted(row[0] for row in incremental['manifest']))
+
+    def test_load_incremental_copies_most_recent_database(self):
+        corpora_dir = self.copy_corpora()
+        full = self.load('db', corpora_dir)
+        db_dir = os.path.join(self.tmp_dir.name, 'db')
+        os.rename(get_database_path(db_dir),
+                  os.path.join(db_dir, 'acqdiv_corpus_2000-01-01.sqlite3'))
+
+        incremental = self.load('db', corpora_dir, incremental=True)
+        self.assertEqual(
+            len(glob.glob(os.path.join(db_dir, '*.sqlite3'))), 2)
+        self.assertEqual(full, incremental)
+
+    def test_load_materialize(self):
+        self.load('db', materialize=True)
+        all_data, v_all_data = dump_all_data(
+            os.path.join(self.tmp_dir.name, 'db'))
+        self.assertTrue(all_data)
+        self.assertEqual(all_data, v_all_data)
+
+    def test_load_not_materialized(self):
+        dump = self.load('db')
+        self.assertNotIn('all_data', dump)
+
+    def test_load_incremental_materialized_changed_session(self):
+        corpora_dir = self.copy_corpora()
+        self.load('db', corpora_dir, materialize=True)
+
+        english2_path = os.path.join(self.english_dir, 'English2.cha')
+        with open(english2_path) as f:
+            cha = f.read().replace('too big', 'too small')
+        with open(english2_path, 'w') as f:
+            f.write(cha)
+        os.remove(os.path.join(
+            corpora_dir, 'Cree', 'cha', 'Cree.cha'))
+
+        self.load('db', corpora_dir, incremental=True)
+        all_data, v_all_data = dump_all_data(
+            os.path.join(self.tmp_dir.name, 'db'))
+        self.assertIn('is it too small', {row[19] for row in all_data})
+        self.assertNotIn('Cree', {row[0] for row in all_data})
+        self.assertEqual(all_data, v_all_data)
+
+    def test_load_normalized(self):
+        full = self.load('full')
+        normalized = self.load('normalized', normalize=True)
+        self.assertEqual(
+            dump_words_morphemes(os.path.join(self.tmp_dir.name, 'full')),
+            dump_words_morphemes(
+                os.path.join(self.tmp_dir.name, 'normalized')))
+
+        self.assertNotIn('morphemes', normalized)
+        self.assertEqual(
+            len(normalized['morphemes_normalized']), len(full['morphemes']))
+        self.assertEqual(
+            sorted(row[1] for row in normalized['lookup_glosses']),
+            sorted({row[i] for row in full['morphemes'] for i in (6, 7)
+                    if row[i] is not None}))
+
+        for table in ['corpora', 'sessions', 'speakers', 'utterances']:
+            self.assertEqual(full[table], normalized[table])
+
+    def test_load_normalized_reload(self):
+        self.load('db', normalize=True)
+        reloaded = self.load('db')
+        self.assertIn('morphemes', reloaded)
+        self.assertNotIn('morphemes_normalized', reloaded)
+
+    def test_load_incremental_normalized(self):
+        corpora_dir = self.copy_corpora()
+        full = self.load('full', corpora_dir)
+        self.load('db', corpora_dir, normalize=True)
+        db_dir = os.path.join(self.tmp_dir.name, 'db')
+
+        # the original tables are restored
+        incremental = self.load('db', corpora_dir, incremental=True)
+        self.assertEqual(full['morphemes'], incremental['morphemes'])
+        self.assertNotIn('lookup_glosses', incremental)
+
+        self.load('db', corpora_dir, incremental=True, normalize=True)
+        self.assertEqual(
+            dump_words_morphemes(os.path.join(self.tmp_dir.name, 'full')),
+            dump_words_morphemes(db_dir))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,136 @@
+import unittest
+
+from acqdiv.util.memoization import MemoizedClassMethods, get_cache_stats, \
+    format_cache_stats, call_counting_caches, add_worker_counts, \
+    clear_caches
+
+
+class Cleaner(MemoizedClassMethods):
+
+    memoized_methods = ('clean', 'clean_upper')
+
+    calls = []
+
+    @classmethod
+    def clean(cls, token):
+        cls.calls.append(token)
+        return cls.strip(token)
+
+    @classmethod
+    def clean_upper(cls, token):
+        return cls.clean(token).upper()
+
+    @staticmethod
+    def strip(token):
+        return token.strip()
+
+
+class DashCleaner(Cleaner):
+
+    @staticmethod
+    def strip(token):
+        return token.strip('-')
+
+
+class OverridingCleaner(Cleaner):
+
+    @classmethod
+    def clean(cls, token):
+        cls.calls.append(token)
+        return token[::-1]
+
+
+class ContextCleaner(Cleaner):
+
+    memoize = False
+
+    context = ''
+
+    @staticmethod
+    def strip(token):
+        return ContextCleaner.context + token
+
+
+class TestMemoizedClassMethods(unittest.TestCase):
+
+    def setUp(self):
+        Cleaner.clean.cache_clear()
+        Cleaner.clean_upper.cache_clear()
+        OverridingCleaner.clean.cache_clear()
+        Cleaner.calls.clear()
+
+    def test_memoized(self):
+        results = [Cleaner.clean(' a '), Cleaner.clean(' a ')]
+        self.assertEqual(results, ['a', 'a'])
+        self.assertEqual(Cleaner.calls, [' a '])
+
+    def test_cache_info(self):
+        Cleaner.clean('a')
+        Cleaner.clean('a')
+        Cleaner.clean('b')
+        info = Cleaner.clean.cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 2))
+
+    def test_memoized_per_class(self):
+        results = [Cleaner.clean('-a-'), DashCleaner.clean('-a-')]
+        self.assertEqual(results, ['-a-', 'a'])
+
+    def test_memoized_override(self):
+        OverridingCleaner.clean('ab')
+        OverridingCleaner.clean('ab')
+        self.assertEqual(Cleaner.calls, ['ab'])
+        self.assertTrue(hasattr(OverridingCleaner.clean, 'cache_info'))
+
+    def test_memoized_override_called_by_inherited_method(self):
+        actual_output = OverridingCleaner.clean_upper('ab')
+        desired_output = 'BA'
+        self.assertEqual(actual_output, desired_output)
+
+    def test_opt_out(self):
+        ContextCleaner.context = 'x'
+        ContextCleaner.clean('a')
+        ContextCleaner.context = 'y'
+        actual_output = ContextCleaner.clean_upper('a')
+        desired_output = 'YA'
+        self.assertEqual(actual_output, desired_output)
+        self.assertEqual(Cleaner.clean.cache_info().currsize, 0)
+
+    def test_get_cache_stats(self):
+        Cleaner.clean('a')
+        Cleaner.clean('a')
+        stats = get_cache_stats()
+        info = stats[__name__ + '.Cleaner.clean']
+        self.assertEqual((info.hits, info.misses), (1, 1))
+        self.assertNotIn(__name__ + '.Cleaner.clean_upper', stats)
+
+    def test_call_counting_caches(self):
+        Cleaner.clean('a')
+        actual_output = call_counting_caches(
+            lambda: [Cleaner.clean(token) for token in 'aab'])
+        desired_output = (['a', 'a', 'b'],
+                          {__name__ + '.Cleaner.clean': (2, 1)})
+        self.assertEqual(actual_output, desired_output)
+
+    def test_add_worker_counts(self):
+        Cleaner.clean('a')
+        add_worker_counts({__name__ + '.Cleaner.clean': (2, 3),
+                           __name__ + '.Cleaner.clean_upper': (0, 1)})
+        stats = get_cache_stats()
+        self.assertEqual(stats[__name__ + '.Cleaner.clean'], (2, 4))
+        self.assertEqual(stats[__name__ + '.Cleaner.clean_upper'], (0, 1))
+
+        clear_caches()
+        self.assertNotIn(__name__ + '.Cleaner.clean', get_cache_stats())
+
+    def test_format_cache_stats(self):
+        Cleaner.clean('a')
+        Cleaner.clean('a')
+        lines = format_cache_stats().split('\n')
+        line = next(line for line in lines
+                    if line.startswith(__name__ + '.Cleaner.clean '))
+        self.assertEqual(line.split()[1:], ['1', '1', '50.0%'])
+        self.assertTrue(lines[-1].startswith('total'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+import configparser
+import contextlib
+import glob
+import io
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from acqdiv.database.parquet_processor import ParquetProcessor
+from acqdiv.exporter import Exporter
+from acqdiv.loader import Loader
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:
+    pq = None
+
+
+def read_parquet_dir(out_dir):
+    """Get the schema and rows of every file by table and file name."""
+    files = {}
+    for path in glob.glob(os.path.join(out_dir, '*', '*.parquet')):
+        table = pq.read_table(path)
+        key = os.path.relpath(path, out_dir)
+        files[key] = (table.schema, table.to_pydict())
+
+    return files
+
+
+@unittest.skipIf(pq is None, 'pyarrow is not installed')
+class ParquetProcessorTest(unittest.TestCase):
+
+    resources_dir = Path(__file__).parent / 'resources'
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp_dir = tempfile.TemporaryDirectory()
+
+        # the files exported from a database
+        cls.write_cfg('db')
+        cls.export_dir = os.path.join(cls.tmp_dir.name, 'export')
+        with contextlib.redirect_stdout(io.StringIO()):
+            Loader.load(cfg_path=cls.cfg_path)
+            Exporter.export(cfg_path=cls.cfg_path, out_dir=cls.export_dir)
+        cls.exported = read_parquet_dir(cls.export_dir)
+
+        # the files written without a database
+        cls.parquet_db_dir = cls.write_cfg('parquet')
+        with contextlib.redirect_stdout(io.StringIO()):
+            Loader.load(cfg_path=cls.cfg_path, backend='parquet')
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp_dir.cleanup()
+
+    @classmethod
+    def write_cfg(cls, name):
+        db_dir = os.path.join(cls.tmp_dir.name, name)
+        os.makedirs(db_dir)
+
+        cfg = configparser.ConfigParser(interpolation=None)
+        cfg.read(cls.resources_dir / 'config.ini')
+        cfg['.global']['corpora_dir'] = str(cls.resources_dir / 'corpora')
+        cfg['.global']['db_dir'] = db_dir
+        cls.cfg_path = os.path.join(cls.tmp_dir.name, f'{name}.ini')
+        with open(cls.cfg_path, 'w') as cfg_file:
+            cfg.write(cfg_file)
+
+        return db_dir
+
+    def get_out_dir(self):
+        out_dirs = glob.glob(os.path.join(self.parquet_db_dir, '*_parquet'))
+        self.assertEqual(len(out_dirs), 1)
+
+        return out_dirs[0]
+
+    def test_load_parquet_identical_to_export(self):
+        actual_output = read_parquet_dir(self.get_out_dir())
+        desired_output = self.exported
+        self.assertEqual(sorted(actual_output), sorted(desired_output))
+
+        for key, (schema, pydict) in desired_output.items():
+            with self.subTest(file=key):
+                self.assertEqual(actual_output[key][0], schema)
+                self.assertEqual(actual_output[key][1], pydict)
+
+    def test_load_parquet_no_database(self):
+        self.assertFalse(
+            glob.glob(os.path.join(self.parquet_db_dir, '*.sqlite3')))
+
+    def test_load_parquet_all_data(self):
+        out_dir = self.get_out_dir()
+        path = os.path.join(out_dir, 'all_data', 'English_Manchester1.parquet')
+        self.assertTrue(pq.read_table(path).num_rows)
+
+    def test_load_parquet_batches(self):
+        with contextlib.redirect_stdout(io.StringIO()), \
+                mock.patch.object(ParquetProcessor, 'batch_size', 2):
+            Loader.load(cfg_path=self.cfg_path, backend='parquet')
+
+        path = os.path.join(self.get_out_dir(), 'morphemes', 'Chintang.parquet')
+        self.assertGreater(pq.ParquetFile(path).num_row_groups, 1)
+        self.assertEqual(read_parquet_dir(self.get_out_dir()), self.exported)
+
+    def test_load_parquet_incremental(self):
+        with self.assertRaises(ValueError):
+            ParquetProcessor(self.parquet_db_dir, incremental=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+import csv
+import json
+import os
+import tempfile
+import time
+import unittest
+
+from acqdiv.util.profiler import Profiler
+
+
+class Reader:
+
+    def get_value(self):
+        time.sleep(0.01)
+        return 'value'
+
+
+class ProfilerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.profiler = Profiler()
+        self.profiler.enable()
+        self.profiler.set_session('corpus', 'session.cha')
+
+    def get_stats(self):
+        return self.profiler.stats['corpus']['session.cha']
+
+    def test_stage_disabled(self):
+        self.profiler.disable()
+        with self.profiler.stage('parse'):
+            pass
+        self.assertFalse(self.profiler.stats)
+
+    def test_stage_nested(self):
+        with self.profiler.stage('parse'):
+            with self.profiler.stage('cleaner'):
+                time.sleep(0.02)
+
+        stats = self.get_stats()
+        self.assertGreaterEqual(stats['cleaner'][0], 0.02)
+        self.assertLess(stats['parse'][0], 0.02)
+        self.assertEqual(stats['cleaner'][1], 1)
+
+    def test_iter_stage(self):
+        actual_output = list(self.profiler.iter_stage('read', ['a', 'b']))
+        desired_output = ['a', 'b']
+        self.assertEqual(actual_output, desired_output)
+        self.assertEqual(self.get_stats()['read'][1], 3)
+
+    def test_iter_stage_disabled(self):
+        self.profiler.disable()
+        items = ['a', 'b']
+        self.assertIs(self.profiler.iter_stage('read', items), items)
+
+    def test_timed(self):
+        func = self.profiler.timed('alignment')(lambda x: x + 1)
+        self.assertEqual(func(1), 2)
+        self.assertEqual(self.get_stats()['alignment'][1], 1)
+
+    def test_wrap(self):
+        reader = self.profiler.wrap('reader', Reader())
+        self.assertEqual(reader.get_value(), 'value')
+        reader.attr = 1
+        self.assertEqual(reader.attr, 1)
+        self.assertGreaterEqual(self.get_stats()['reader'][0], 0.01)
+
+    def test_wrap_disabled(self):
+        self.profiler.disable()
+        reader = Reader()
+        self.assertIs(self.profiler.wrap('reader', reader), reader)
+
+    def test_get_report(self):
+        with self.profiler.stage('parse'):
+            pass
+        self.profiler.set_session('corpus', 'session2.cha')
+        with self.profiler.stage('parse'):
+            pass
+
+        report = self.profiler.get_report()
+        corpus = report['corpora']['corpus']
+        self.assertEqual(sorted(corpus['sessions']),
+                         ['session.cha', 'session2.cha'])
+        self.assertEqual(corpus['stages']['parse']['count'], 2)
+        self.assertEqual(report['seconds'], corpus['seconds'])
+
+    def test_write_report(self):
+        with self.profiler.stage('insert'):
+            pass
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            self.profiler.write_report(tmp_dir)
+
+            with open(os.path.join(tmp_dir, 'profile.json')) as json_file:
+                report = json.load(json_file)
+            with open(os.path.join(tmp_dir, 'profile.csv')) as csv_file:
+                rows = list(csv.DictReader(csv_file))
+
+        self.assertIn('insert',
+                      report['corpora']['corpus']['sessions']['session.cha']
+                      ['stages'])
+        self.assertEqual(
+            [(row['corpus'], row['session'], row['stage'], row['count'])
+             for row in rows],
+            [('corpus', 'session.cha', 'insert', '1')])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import os
+import tempfile
+import unittest
+
+from acqdiv.model.session import Session
+from acqdiv.util.session_cache import SessionCache
+
+
+class SessionCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache = SessionCache(os.path.join(self.tmp_dir.name, 'cache'))
+        self.session_path = os.path.join(self.tmp_dir.name, 'session.cha')
+
+        with open(self.session_path, 'w') as f:
+            f.write('@Begin\n')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def get_session(self, source_id):
+        session = Session()
+        session.source_id = source_id
+        return session
+
+    def test_get_missing(self):
+        self.assertIsNone(self.cache.get('missing'))
+
+    def test_put_get(self):
+        self.cache.put('key', self.get_session('session'))
+        actual_output = self.cache.get('key').source_id
+        desired_output = 'session'
+        self.assertEqual(actual_output, desired_output)
+
+    def test_get_corrupt(self):
+        with open(self.cache.get_path('key'), 'wb') as f:
+            f.write(b'corrupt')
+        self.assertIsNone(self.cache.get('key'))
+
+    def test_get_key_same_content(self):
+        key = self.cache.get_key([self.session_path], 'abc', 'Corpus')
+        self.assertEqual(
+            key, self.cache.get_key([self.session_path], 'abc', 'Corpus'))
+
+    def test_get_key_changed_content(self):
+        key = self.cache.get_key([self.session_path], 'abc', 'Corpus')
+        with open(self.session_path, 'a') as f:
+            f.write('@End\n')
+        self.assertNotEqual(
+            key, self.cache.get_key([self.session_path], 'abc', 'Corpus'))
+
+    def test_get_key_changed_fingerprint(self):
+        key = self.cache.get_key([self.session_path], 'abc', 'Corpus')
+        self.assertNotEqual(
+            key, self.cache.get_key([self.session_path], 'abd', 'Corpus'))
+
+    def test_get_key_missing_metadata(self):
+        metadata_path = os.path.join(self.tmp_dir.name, 'session.imdi')
+        key = self.cache.get_key(
+            [self.session_path, metadata_path], 'abc', 'Corpus')
+        with open(metadata_path, 'w') as f:
+            f.write('<METATRANSCRIPT/>')
+        self.assertNotEqual(key, self.cache.get_key(
+            [self.session_path, metadata_path], 'abc', 'Corpus'))
+
+    def test_prune_least_recently_used(self):
+        for i, key in enumerate(['a', 'b', 'c']):
+            self.cache.put(key, self.get_session(key))
+            os.utime(self.cache.get_path(key), (i, i))
+
+        # reading 'a' marks it as recently used
+        self.cache.get('a')
+        self.cache.max_size = 2 * os.path.getsize(self.cache.get_path('a'))
+        self.cache.prune()
+
+        actual_output = sorted(os.listdir(self.cache.cache_dir))
+        desired_output = ['a.pickle.z', 'c.pickle.z']
+        self.assertEqual(actual_output, desired_output)
+
+
+if __name__ == '__main__':
+    unittest.main()
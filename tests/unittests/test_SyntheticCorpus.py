@@ -0,0 +1,92 @@
+import filecmp
+import glob
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from acqdiv.loader import Loader
+from acqdiv.util.synthetic_corpora import CORPORA, generate
+
+
+def count_records(corpora_dir):
+    """Get the number of records of the session files by corpus."""
+    counts = {}
+    for corpus in CORPORA:
+        counts[corpus] = 0
+        for path in glob.glob(os.path.join(corpora_dir, corpus, '*', '*')):
+            with open(path) as session_file:
+                counts[corpus] += sum(
+                    line.startswith(('*', '\\ref')) for line in session_file)
+
+    return counts
+
+
+def count_rows(db_dir):
+    """Get the number of sessions, utterances and unlinked morphemes."""
+    db_path = sorted(glob.glob(os.path.join(db_dir, '*.sqlite3')))[-1]
+    conn = sqlite3.connect(db_path)
+    rows = conn.execute(
+        'SELECT sessions.corpus, COUNT(DISTINCT sessions.id), '
+        'COUNT(DISTINCT utterances.id), '
+        'SUM(morphemes.word_id_fk IS NULL OR morphemes.pos IS NULL) '
+        'FROM sessions '
+        'JOIN utterances ON utterances.session_id_fk = sessions.id '
+        'JOIN morphemes ON morphemes.utterance_id_fk = utterances.id '
+        'GROUP BY sessions.corpus'
+    ).fetchall()
+    conn.close()
+
+    return {corpus: counts for corpus, *counts in rows}
+
+
+class SyntheticCorpusTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.out_dir = self.tmp_dir.name
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_generate_deterministic(self):
+        out_dirs = [os.path.join(self.out_dir, name) for name in 'ab']
+        for out_dir in out_dirs:
+            generate(out_dir, n_sessions=2, n_utterances=10, seed=1)
+
+        for corpus in CORPORA:
+            paths = [
+                sorted(glob.glob(os.path.join(
+                    out_dir, 'corpora', corpus, '*', '*')))
+                for out_dir in out_dirs]
+            self.assertTrue(paths[0])
+            self.assertEqual(
+                [os.path.basename(path) for path in paths[0]],
+                [os.path.basename(path) for path in paths[1]])
+
+            for path_a, path_b in zip(*paths):
+                self.assertTrue(filecmp.cmp(path_a, path_b, shallow=False))
+
+    def test_load(self):
+        cfg_path = generate(self.out_dir, n_sessions=3, n_utterances=10)
+        Loader.load(cfg_path=cfg_path)
+
+        records = count_records(os.path.join(self.out_dir, 'corpora'))
+        actual_output = count_rows(os.path.join(self.out_dir, 'database'))
+        desired_output = {corpus: [3, records[corpus], 0]
+                          for corpus in CORPORA}
+        self.assertEqual(actual_output, desired_output)
+
+    def test_load_parallel(self):
+        cfg_path = generate(self.out_dir, n_sessions=3, n_utterances=10)
+        Loader.load(cfg_path=cfg_path, jobs=3)
+
+        records = count_records(os.path.join(self.out_dir, 'corpora'))
+        actual_output = count_rows(os.path.join(self.out_dir, 'database'))
+        desired_output = {corpus: [3, records[corpus], 0]
+                          for corpus in CORPORA}
+        self.assertEqual(actual_output, desired_output)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import unittest
+
+from acqdiv.parsers.toolbox.model.record import Record
+
+
+class RecordTest(unittest.TestCase):
+
+    def setUp(self):
+        data = '\\ref 001\n\\tx  a  b \n\\nep  @ c\n\\ge @x'.encode()
+        self.rec = Record({'ref': (5, 8), 'tx': (14, 19), 'nep': (25, 30)},
+                          data)
+
+    def test_get(self):
+        actual_output = self.rec.get('tx')
+        desired_output = 'a b'
+        self.assertEqual(actual_output, desired_output)
+
+    def test_get_cached(self):
+        self.rec.get('tx')
+        self.assertEqual(self.rec.tiers['tx'], 'a b')
+
+    def test_get_not_exists(self):
+        actual_output = self.rec.get('ge', None)
+        self.assertIsNone(actual_output)
+
+    def test_getitem_not_exists(self):
+        actual_output = self.rec['ge']
+        desired_output = ''
+        self.assertEqual(actual_output, desired_output)
+
+    def test_setitem(self):
+        self.rec['tx'] = 'c'
+        self.assertEqual(self.rec['tx'], 'c')
+
+    def test_iter(self):
+        actual_output = list(self.rec)
+        desired_output = ['ref', 'tx', 'nep']
+        self.assertEqual(actual_output, desired_output)
+
+    def test_contains(self):
+        self.assertIn('nep', self.rec)
+        self.assertNotIn('ge', self.rec)
+
+    def test_startswith(self):
+        self.assertTrue(self.rec.startswith('@'))
+
+    def test_startswith_non_ascii_whitespace(self):
+        rec = Record({'tx': (0, 4)}, '\xa0@x'.encode())
+        self.assertTrue(rec.startswith('@'))
+
+    def test_startswith_false(self):
+        del self.rec.tiers['nep']
+        self.assertFalse(self.rec.startswith('@'))
+        self.assertEqual(self.rec.tiers['tx'], (14, 19))
+
+    def test_startswith_raw(self):
+        self.rec.tiers['ge'] = (35, 37)
+        del self.rec.tiers['nep']
+        self.assertTrue(self.rec.startswith('@'))
+
+    def test_startswith_decoded(self):
+        rec = Record({'tx': '@Begin'})
+        self.assertTrue(rec.startswith('@'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,3 +1,5 @@
+import os
+import tempfile
 import unittest
 
 from acqdiv.parsers.toolbox.readers.fileparser import ToolboxFileParser
@@ -42,3 +44,71 @@ class TestToolboxFileParser(unittest.TestCase):
         actual_output = ToolboxFileParser.get_tier(tier)
         desired_output = ('ref', 'session_name.001')
         self.assertEqual(actual_output, desired_output)
+
+    def test_iter_record_spans(self):
+        data = b'\\_sh v3.0\n\n\\ref 001\n\\tx a\n\n\\ref 002\n\\tx b'
+        actual_output = [
+            data[start:end] for start, end
+            in ToolboxFileParser.iter_record_spans(data, br'\\ref')]
+        desired_output = [b'\\ref 001\n\\tx a\n\n', b'\\ref 002\n\\tx b']
+        self.assertEqual(actual_output, desired_output)
+
+    def test_iter_record_spans_no_records(self):
+        data = b'\\_sh v3.0\n'
+        actual_output = list(
+            ToolboxFileParser.iter_record_spans(data, br'\\ref'))
+        self.assertEqual(actual_output, [])
+
+    def test_iter_tier_spans(self):
+        data = b'xx\\ref 001\n\\tx  a b\r\n\\ge'
+        actual_output = [
+            (field_marker, data[start:end]) for field_marker, start, end
+            in ToolboxFileParser.iter_tier_spans(data, 2, len(data))]
+        desired_output = [
+            ('ref', b'001'),
+            ('tx', b'a b\r'),
+            ('ge', b''),
+        ]
+        self.assertEqual(actual_output, desired_output)
+
+    def test_iter_tier_spans_non_ascii_whitespace(self):
+        data = '\\tx\xa0foo bar\n\\ge\u3000\x1c b\n\\mb\xe9 c'.encode()
+        actual_output = [
+            (field_marker, data[start:end]) for field_marker, start, end
+            in ToolboxFileParser.iter_tier_spans(data, 0, len(data))]
+        desired_output = [
+            ('tx', b'foo bar'),
+            ('ge', b'b'),
+            ('mb\xe9', b'c'),
+        ]
+        self.assertEqual(actual_output, desired_output)
+
+    def test_read_record(self):
+        data = b'\\ref 001\r\n\\tx  \xc3\xa9  b \r\n\\ge\r\n\\ref 002'
+        actual_output = ToolboxFileParser.read_record(data, 0, len(data) - 8)
+        desired_output = {'ref': '001', 'tx': '\xe9 b', 'ge': '', '': ''}
+        self.assertEqual(actual_output, desired_output)
+
+    def test_iter_parsed_records(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'session.txt')
+            with open(path, 'w') as f:
+                f.write('\\_sh v3.0\n\n\\ref 001\n\\tx a  b\n\n'
+                        '\\ref 002\n\\tx c\n')
+
+            actual_output = [
+                (rec['ref'], rec['tx']) for rec
+                in ToolboxFileParser.iter_parsed_records(path, br'\\ref')]
+
+        desired_output = [('001', 'a b'), ('002', 'c')]
+        self.assertEqual(actual_output, desired_output)
+
+    def test_iter_parsed_records_empty_file(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'session.txt')
+            open(path, 'w').close()
+
+            actual_output = list(
+                ToolboxFileParser.iter_parsed_records(path, br'\\ref'))
+
+        self.assertEqual(actual_output, [])
@@ -1,4 +1,5 @@
 import unittest
+from acqdiv.parsers.toolbox.model.record import Record
 from acqdiv.parsers.toolbox.readers.reader import *
 
 
@@ -16,13 +17,13 @@ class TestToolboxReader(unittest.TestCase):
             'ELANParticipant': 'MAR',
             'nep': '?'
         }
-        self.assertTrue(ToolboxReader.is_record(rec_dict))
+        self.assertTrue(ToolboxReader.is_record(Record(rec_dict)))
 
     def test_is_record_false(self):
         rec_dict = {
             'tx': '@Participants: CHI Tim child, MOT Lisa mother',
         }
-        self.assertFalse(ToolboxReader.is_record(rec_dict))
+        self.assertFalse(ToolboxReader.is_record(Record(rec_dict)))
 
     # ---------- utterance data ----------
 